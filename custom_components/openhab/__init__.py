@@ -4,22 +4,32 @@ Custom integration to integrate openHAB with Home Assistant.
 For more details about this integration, please refer to
 https://github.com/kubawolanin/ha-openhab
 """
+import logging
+import time
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
 
-from .api import OpenHABApiClient
+from .classify import platforms_with_items
 from .const import (
     CONF_AUTH_TOKEN,
     CONF_AUTH_TYPE,
     CONF_BASE_URL,
     CONF_PASSWORD,
+    CONF_PERSIST_COMMANDS,
+    CONF_TRANSPORT,
     CONF_USERNAME,
     DOMAIN,
     LOGGER,
     PLATFORMS,
     STARTUP_MESSAGE,
+    TRANSPORT_WEBSOCKET,
 )
-from .coordinator import OpenHABDataUpdateCoordinator
+from .debug_logging import start_log_worker, stop_log_worker
+
+# Setup taking longer than this (seconds) is logged as a warning
+SETUP_TIME_BUDGET = 10.0
 
 
 async def async_setup_entry(
@@ -28,9 +38,18 @@ async def async_setup_entry(
 ) -> bool:
     """Set up this integration using UI."""
     LOGGER.info(STARTUP_MESSAGE)
+    setup_start = time.monotonic()
     hass.data.setdefault(DOMAIN, {})
+    start_log_worker()
+    entry.async_on_unload(stop_log_worker)
+
+    # Imported on demand in the executor so loading the package stays cheap
+    api = await async_import_module(hass, f"{__package__}.api")
+    coordinator_module = await async_import_module(hass, f"{__package__}.coordinator")
+    mirror_module = await async_import_module(hass, f"{__package__}.mirror")
+    services = await async_import_module(hass, f"{__package__}.services")
 
-    api_client = OpenHABApiClient(
+    api_client = api.OpenHABApiClient(
         hass=hass,
         base_url=entry.data[CONF_BASE_URL],
         auth_type=entry.data[CONF_AUTH_TYPE],
@@ -39,19 +58,53 @@ async def async_setup_entry(
         password=entry.data.get(CONF_PASSWORD, ""),
     )
 
-    coordinator = OpenHABDataUpdateCoordinator(hass, api=api_client)
+    entry.async_on_unload(api_client.command_queue.async_cancel)
+    if entry.options.get(CONF_PERSIST_COMMANDS, False):
+        await api_client.command_queue.async_persist(
+            f"{DOMAIN}.commands.{entry.entry_id}"
+        )
+
+    coordinator = coordinator_module.OpenHABDataUpdateCoordinator(
+        hass, api=api_client, options=entry.options
+    )
     await coordinator.async_config_entry_first_refresh()
+    refresh_time = time.monotonic() - setup_start
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.governor.async_cancel)
+    entry.async_on_unload(coordinator.async_cancel_release)
+    if coordinator.aggregator.active:
+        entry.async_on_unload(coordinator.async_start_aggregation())
 
-    for platform in PLATFORMS:
-        if entry.options.get(platform, True):
-            coordinator.platforms.append(platform)
+    if entry.options.get(CONF_TRANSPORT) == TRANSPORT_WEBSOCKET:
+        if coordinator.async_enable_websocket():
+            entry.async_on_unload(api_client.websocket.async_stop)
 
+    mirror = mirror_module.StateMirror.from_options(hass, api_client, entry.options)
+    if mirror is not None:
+        entry.async_on_unload(mirror.async_start())
+
+    # Only forward platforms with matching items so unused platforms are never loaded
+    coordinator.platforms = platforms_with_items(
+        coordinator.data or {},
+        coordinator.raw_items,
+        [platform for platform in PLATFORMS if entry.options.get(platform, True)],
+    )
     await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    services.async_register_services(hass)
+
+    setup_time = time.monotonic() - setup_start
+    LOGGER.log(
+        logging.WARNING if setup_time > SETUP_TIME_BUDGET else logging.DEBUG,
+        "Set up %s in %.2f s (first refresh %.2f s, platforms: %s)",
+        entry.title,
+        setup_time,
+        refresh_time,
+        ", ".join(coordinator.platforms) or "none",
+    )
     return True
 
 
@@ -62,6 +115,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry, [platform for platform in PLATFORMS if platform in coordinator.platforms]
     ):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            services = await async_import_module(hass, f"{__package__}.services")
+            services.async_unload_services(hass)
     return unload_ok
 
 
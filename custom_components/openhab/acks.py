@@ -0,0 +1,190 @@
+"""Command acknowledgement tracking for openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import statistics
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER
+
+# Commands not confirmed within this many seconds count as timed out
+COMMAND_ACK_TIMEOUT = 10.0
+# Waits (seconds) after each targeted poll of an unconfirmed command over REST
+ACK_POLL_DELAYS = (1.0, 2.0, 4.0)
+# Latencies kept per platform for the distribution
+LATENCY_SAMPLES = 200
+
+# Commands that move a state instead of naming it; any change confirms them
+RELATIVE_COMMANDS = frozenset(
+    (
+        "UP",
+        "DOWN",
+        "STOP",
+        "MOVE",
+        "INCREASE",
+        "DECREASE",
+        "NEXT",
+        "PREVIOUS",
+        "REWIND",
+        "FASTFORWARD",
+        "REFRESH",
+    )
+)
+
+
+def _numbers(value: str) -> list[float] | None:
+    """Return the numeric parts of `42`, `21.5 °C` or `120,100,50`, if any."""
+    try:
+        return [float(part) for part in value.split(" ", 1)[0].split(",")]
+    except ValueError:
+        return None
+
+
+def state_confirms(command: str, state: str) -> bool:
+    """Return True if an item state is the result of a non-relative command."""
+    if command == state:
+        return True
+    numbers = _numbers(state)
+    if numbers is None:
+        return False
+    if command in ("ON", "OFF") and len(numbers) in (1, 3):
+        # Dimmer and Color items report the brightness
+        return (numbers[-1] > 0) == (command == "ON")
+    expected = _numbers(command)
+    return (
+        expected is not None
+        and len(expected) == len(numbers)
+        and all(abs(a - b) < 0.01 for a, b in zip(expected, numbers))
+    )
+
+
+class CommandHandle:
+    """Correlation handle of one sent command.
+
+    The future resolves to the command-to-confirmation latency in seconds, or
+    None if the command timed out or was superseded by a newer command.
+    """
+
+    __slots__ = ("item_name", "command", "platform", "baseline", "sent_at", "future")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        item_name: str,
+        command: str,
+        platform: str,
+        baseline: str | None,
+    ) -> None:
+        """Start the handle at the moment the command is sent."""
+        self.item_name = item_name
+        self.command = command
+        self.platform = platform
+        self.baseline = baseline
+        self.sent_at = time.monotonic()
+        self.future: asyncio.Future[float | None] = hass.loop.create_future()
+
+    @property
+    def done(self) -> bool:
+        """Return True once the command is confirmed, timed out or superseded."""
+        return self.future.done()
+
+    def confirmed_by(self, state: str) -> bool:
+        """Return True if the reported state acknowledges the command."""
+        if self.command in RELATIVE_COMMANDS:
+            return state != self.baseline
+        return state_confirms(self.command, state)
+
+    async def async_wait(self, timeout: float) -> float | None:
+        """Wait up to `timeout` seconds, return the latency if confirmed."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.future), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class CommandTracker:
+    """Pending command handles and per-platform latency distributions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.pending: dict[str, CommandHandle] = {}  # Item name -> newest command
+        self._latencies: dict[str, deque[float]] = {}
+        self._confirmed: dict[str, int] = {}
+        self._timeouts: dict[str, int] = {}
+
+    @callback
+    def track(
+        self, item_name: str, command: str, platform: str, baseline: str | None
+    ) -> CommandHandle:
+        """Return the handle of a command about to be sent."""
+        if (previous := self.pending.pop(item_name, None)) is not None:
+            previous.future.set_result(None)
+        handle = CommandHandle(self.hass, item_name, command, platform, baseline)
+        if baseline is not None and handle.confirmed_by(baseline):
+            # Already in the commanded state, openHAB reports no change
+            handle.future.set_result(0.0)
+            return handle
+        self.pending[item_name] = handle
+        self.hass.loop.call_later(COMMAND_ACK_TIMEOUT, self._expire, handle)
+        return handle
+
+    @callback
+    def discard(self, handle: CommandHandle) -> None:
+        """Forget a command that was not sent, without counting a timeout."""
+        if self.pending.get(handle.item_name) is handle:
+            del self.pending[handle.item_name]
+        if not handle.done:
+            handle.future.set_result(None)
+
+    @callback
+    def confirm(self, item_name: str, state: str) -> None:
+        """Resolve the item's pending command if the new state acknowledges it."""
+        handle = self.pending.get(item_name)
+        if handle is None or not handle.confirmed_by(state):
+            return
+        del self.pending[item_name]
+        latency = time.monotonic() - handle.sent_at
+        handle.future.set_result(latency)
+        self._latencies.setdefault(
+            handle.platform, deque(maxlen=LATENCY_SAMPLES)
+        ).append(latency)
+        self._confirmed[handle.platform] = self._confirmed.get(handle.platform, 0) + 1
+
+    @callback
+    def _expire(self, handle: CommandHandle) -> None:
+        """Time out a command that was never confirmed."""
+        if handle.done:
+            return
+        if self.pending.get(handle.item_name) is handle:
+            del self.pending[handle.item_name]
+        handle.future.set_result(None)
+        self._timeouts[handle.platform] = self._timeouts.get(handle.platform, 0) + 1
+        LOGGER.debug(
+            "Command %s to %s not confirmed within %.0f s",
+            handle.command,
+            handle.item_name,
+            COMMAND_ACK_TIMEOUT,
+        )
+
+    def latency_stats(self) -> dict[str, dict[str, Any]]:
+        """Return count, timeouts and latency percentiles (ms) per platform."""
+        result: dict[str, dict[str, Any]] = {}
+        for platform in sorted({*self._confirmed, *self._timeouts}):
+            latencies = sorted(self._latencies.get(platform, ()))
+            stats: dict[str, Any] = {
+                "confirmed": self._confirmed.get(platform, 0),
+                "timeouts": self._timeouts.get(platform, 0),
+            }
+            if latencies:
+                stats["median_ms"] = round(statistics.median(latencies) * 1000, 1)
+                stats["p90_ms"] = round(
+                    latencies[int(0.9 * (len(latencies) - 1))] * 1000, 1
+                )
+                stats["max_ms"] = round(latencies[-1] * 1000, 1)
+            result[platform] = stats
+        return result
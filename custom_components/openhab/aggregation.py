@@ -0,0 +1,151 @@
+"""Windowed aggregation of high-frequency numeric items."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import fnmatch
+import re
+from typing import Any, NamedTuple
+
+from .const import CONF_AGGREGATE, LOGGER
+from .item_filter import split_option
+from .models import OpenHABItem
+from .utils import str_to_quantity
+
+AGGREGATE_FUNCTIONS = ("mean", "min", "max", "last")
+
+
+class AggregateRule(NamedTuple):
+    """Aggregate function and window length in seconds."""
+
+    function: str
+    window: int
+
+
+def parse_aggregate_rules(
+    value: str | None,
+) -> tuple[dict[str, AggregateRule], list[tuple[re.Pattern, AggregateRule]]]:
+    """Parse `Energy_*=mean/60, Number:Power=max/10` into type and name rules."""
+    by_type: dict[str, AggregateRule] = {}
+    by_name: list[tuple[re.Pattern, AggregateRule]] = []
+    for entry in sorted(split_option(value)):
+        key, _, spec = entry.partition("=")
+        function, _, window = spec.strip().partition("/")
+        try:
+            rule = AggregateRule(function.strip(), int(window))
+        except ValueError:
+            rule = None
+        if (
+            rule is None
+            or rule.function not in AGGREGATE_FUNCTIONS
+            or rule.window < 1
+        ):
+            LOGGER.warning("Ignoring invalid aggregate entry: %s", entry)
+            continue
+        key = key.strip()
+        if key == "Number" or key.startswith("Number:"):
+            by_type[key] = rule
+        else:
+            by_name.append((re.compile(fnmatch.translate(key)), rule))
+    return by_type, by_name
+
+
+class _Window:
+    """Running count, sum, min, max and last value of one item in one window."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "last", "raw")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.last = 0.0
+        self.raw: dict[str, Any] = {}
+
+    def add(self, value: float, raw: dict[str, Any]) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.last = value
+        self.raw = raw
+
+    def result(self, function: str) -> float:
+        if function == "mean":
+            return self.total / self.count
+        if function == "min":
+            return self.minimum
+        if function == "max":
+            return self.maximum
+        return self.last
+
+
+class Aggregator:
+    """Fold every update of matching Number items into per-window aggregates.
+
+    Updates are accumulated incrementally and `flush` turns each window into a
+    single item whose state is the aggregate, so Home Assistant sees one write
+    per item and window. Item name rules take precedence over type rules.
+    """
+
+    def __init__(self, rules: str | None = None) -> None:
+        """Compile the aggregate rules."""
+        self._by_type, self._by_name = parse_aggregate_rules(rules)
+        self.active = bool(self._by_type or self._by_name)
+        self._rules: dict[str, AggregateRule | None] = {}
+        self._windows: dict[str, _Window] = {}
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> Aggregator:
+        """Build the aggregator from config entry options."""
+        return cls(options.get(CONF_AGGREGATE))
+
+    @property
+    def windows(self) -> set[int]:
+        """Return the distinct window lengths in seconds."""
+        return {rule.window for rule in self._by_type.values()} | {
+            rule.window for _, rule in self._by_name
+        }
+
+    def rule(self, item: OpenHABItem) -> AggregateRule | None:
+        """Return the aggregate rule of an item, cached by name."""
+        if item.name not in self._rules:
+            rule = None
+            if item.type_.startswith("Number"):
+                rule = next(
+                    (rule for pattern, rule in self._by_name if pattern.match(item.name)),
+                    None,
+                )
+                if rule is None:
+                    rule = self._by_type.get(item.type_) or self._by_type.get("Number")
+            self._rules[item.name] = rule
+        return self._rules[item.name]
+
+    def add(self, item: OpenHABItem, raw: dict[str, Any]) -> bool:
+        """Accumulate an update, return True if the item is aggregated."""
+        if not self.active or self.rule(item) is None:
+            return False
+        if isinstance(item._state, (int, float)):
+            self._windows.setdefault(item.name, _Window()).add(float(item._state), raw)
+        return True
+
+    def flush(self, window: int) -> dict[str, OpenHABItem]:
+        """Close the current window of the given length, return the aggregate items."""
+        result: dict[str, OpenHABItem] = {}
+        for item_name in list(self._windows):
+            rule = self._rules.get(item_name)
+            if rule is None or rule.window != window:
+                continue
+            current = self._windows.pop(item_name)
+            unit = str_to_quantity(current.raw.get("state", ""))[1]
+            value = round(current.result(rule.function), 6)
+            result[item_name] = OpenHABItem.from_raw(
+                {**current.raw, "state": f"{value} {unit}".strip()}
+            )
+        return result
+
+    def describe(self, item_name: str) -> str | None:
+        """Return e.g. `mean/60s` for an aggregated item."""
+        rule = self._rules.get(item_name)
+        return f"{rule.function}/{rule.window}s" if rule else None
+
@@ -1,13 +1,25 @@
 """Sample API Client."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
+import time
 from typing import Any
+from urllib.parse import urlencode
 
 import requests
 from requests.auth import AuthBase
 from openhab import OpenHAB
 
+from .command_queue import CommandQueue, is_unreachable
 from .const import CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN, LOGGER
+from .models import OpenHABItem, build_items, decode_items
+from .profiler import RefreshProfiler
+from .traffic import TrafficRecorder
+from .websocket import OpenHABWebSocket
+
+# Semantic tags (Location/Equipment/Point) for the semantic model index
+ITEM_METADATA = "metadata=semantics"
 
 
 class OpenHABTokenAuth(AuthBase):
@@ -48,6 +60,10 @@ class OpenHABApiClient:
         self._password = password
         self._auth_token = auth_token
         self._auth_type = auth_type
+        self.profiler: RefreshProfiler | None = None
+        self.websocket: OpenHABWebSocket | None = None
+        self.recorder: TrafficRecorder | None = None
+        self.command_queue = CommandQueue(hass, self._async_send_command)
 
         LOGGER.info("Initializing OpenHAB client with URL: %s, auth_type: %s", self._rest_url, auth_type)
 
@@ -64,32 +80,212 @@ class OpenHABApiClient:
             LOGGER.info("Creating OpenHAB client without auth")
             self.openhab = OpenHAB(self._rest_url)
 
+    async def _async_job(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking client call in the executor, profiled if requested."""
+        if self.profiler is not None:
+            return await self.profiler.async_run_job(target, *args)
+        return await self.hass.async_add_executor_job(target, *args)
+
     async def async_get_version(self) -> str:
         """Get all items from the API."""
-        info = await self.hass.async_add_executor_job(self.openhab.req_get, "/")
+        info = await self._async_job(self.openhab.req_get, "/")
         runtime_info = info["runtimeInfo"]
         return f"{runtime_info['version']} {runtime_info['buildString']}"
 
-    async def async_get_items(self) -> dict[str, Any]:
-        """Get all items from the API."""
-        return await self.hass.async_add_executor_job(self.openhab.fetch_all_items)
+    async def async_get_items_raw(self, group: str | None = None) -> list[dict[str, Any]]:
+        """Get all items, or only the (nested) members of a group, as raw dicts."""
+        if group is None:
+            return await self._async_job(
+                self._req_get_fast, f"/items?recursive=false&{ITEM_METADATA}"
+            )
+        raw_group = await self._async_job(
+            self._req_get_fast, f"/items/{group}?recursive=true&{ITEM_METADATA}"
+        )
+        return _flatten_members(raw_group)
+
+    async def async_get_group_raw(self, group: str) -> dict[str, Any]:
+        """Get a group without its members, with its semantic tags."""
+        return await self._async_job(
+            self._req_get_fast, f"/items/{group}?recursive=false&{ITEM_METADATA}"
+        )
+
+    async def async_get_item_raw(self, item_name: str) -> dict[str, Any]:
+        """Get a single item as raw dict from the REST API."""
+        return await self._async_job(self._req_get_fast, f"/items/{item_name}")
+
+    async def async_get_items_raw_by_name(
+        self, item_names: Iterable[str]
+    ) -> list[dict[str, Any]]:
+        """Get the given items concurrently, raising the first error if any failed."""
+        results = await asyncio.gather(
+            *(self.async_get_item_raw(name) for name in item_names),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def async_get_items_metadata(
+        self, namespaces: Iterable[str]
+    ) -> list[dict[str, Any]]:
+        """Get only the names and the given metadata namespaces of all items."""
+        query = f"recursive=false&fields=name,metadata&metadata={','.join(namespaces)}"
+        return await self._async_job(self._req_get_fast, f"/items?{query}")
+
+    async def async_get_item_metadata(
+        self, item_name: str, namespaces: Iterable[str]
+    ) -> dict[str, Any]:
+        """Get one item with the given metadata namespaces."""
+        return await self._async_job(
+            self._req_get_fast, f"/items/{item_name}?metadata={','.join(namespaces)}"
+        )
+
+    async def async_get_things_raw(self) -> list[dict[str, Any]]:
+        """Get all Things with their status and channel links."""
+        return await self._async_job(self._req_get_fast, "/things")
+
+    async def async_get_sitemap(self, sitemap_name: str) -> dict[str, Any]:
+        """Get the full widget tree of a sitemap."""
+        return await self._async_job(self._req_get_fast, f"/sitemaps/{sitemap_name}")
 
-    async def async_get_items_raw(self) -> list[dict[str, Any]]:
-        """Get all items as raw dicts from the REST API."""
-        return await self.hass.async_add_executor_job(
-            self.openhab.req_get, "/items?recursive=false"
+    async def async_build_items(
+        self, raw_items: list[dict[str, Any]]
+    ) -> dict[str, OpenHABItem]:
+        """Build typed items from already fetched raw items."""
+        return await self._async_job(build_items, raw_items)
+
+    def _req_get_fast(self, uri_path: str) -> Any:
+        """GET a REST path and decode the body with the fast JSON decoder."""
+        start = time.monotonic()
+        response = self.openhab.session.get(
+            f"{self._rest_url}{uri_path}", timeout=self.openhab.timeout
+        )
+        response.raise_for_status()
+        body = decode_items(response.content)
+        if self.recorder is not None:
+            self.recorder.rest(uri_path, body, time.monotonic() - start)
+        return body
+
+    def start_recording(self, recorder: TrafficRecorder) -> None:
+        """Capture REST responses, WebSocket frames and commands."""
+        self.recorder = recorder
+        if self.websocket is not None:
+            self.websocket.recorder = recorder
+
+    def stop_recording(self) -> TrafficRecorder | None:
+        """Stop capturing and return the recorder."""
+        recorder, self.recorder = self.recorder, None
+        if self.websocket is not None:
+            self.websocket.recorder = None
+        return recorder
+
+    async def async_get_persistence(
+        self,
+        item_name: str,
+        start: str,
+        end: str,
+        service_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Get persisted states of an item between two ISO timestamps."""
+        query = urlencode(
+            {
+                key: value
+                for key, value in (
+                    ("starttime", start),
+                    ("endtime", end),
+                    ("serviceId", service_id),
+                )
+                if value
+            }
+        )
+        return await self._async_job(
+            self.openhab.req_get, f"/persistence/items/{item_name}?{query}"
         )
 
     async def async_get_item(self, item_name: str) -> dict[str, Any]:
         """Get item from the API."""
         return await self.hass.async_add_executor_job(self.openhab.get_item, item_name)
 
-    async def async_send_command(self, item_name: str, command: str) -> None:
-        """Set Item state"""
-        item = await self.hass.async_add_executor_job(self.async_get_item, item_name)
-        await item.command(command)
+    def enable_websocket(self) -> OpenHABWebSocket:
+        """Use the openHAB 4 WebSocket as transport for commands and state events."""
+        if self.websocket is None:
+            self.websocket = OpenHABWebSocket(
+                self.hass,
+                self._base_url,
+                self._auth_type,
+                self._auth_token,
+                self._username,
+                self._password,
+            )
+            self.websocket.recorder = self.recorder
+        return self.websocket
+
+    async def async_send_command(self, item_name: str, command: str) -> bool:
+        """Send a command to an item, queued while openHAB is unreachable.
+
+        Returns True if the command was sent, False if it was queued.
+        """
+        if len(self.command_queue):
+            # Keep the order behind commands waiting for openHAB to return
+            self.command_queue.enqueue(item_name, command)
+            return False
+        start = time.monotonic()
+        try:
+            await self._async_send_command(item_name, command)
+        except Exception as error:  # pylint: disable=broad-except
+            if not is_unreachable(error):
+                raise
+            LOGGER.warning(
+                "openHAB unreachable, queued command %s to %s: %s",
+                command,
+                item_name,
+                error,
+            )
+            self.command_queue.enqueue(item_name, command)
+            return False
+        if self.recorder is not None:
+            self.recorder.command(item_name, command, time.monotonic() - start)
+        return True
+
+    async def _async_send_command(self, item_name: str, command: str) -> None:
+        """Send a command over the WebSocket, falling back to REST."""
+        if self.websocket is not None and self.websocket.connected:
+            try:
+                await self.websocket.async_send_command(item_name, command)
+                return
+            except ConnectionError as error:
+                LOGGER.debug("WebSocket command failed, using REST: %s", error)
+        await self._async_job(self.openhab.req_post, f"/items/{item_name}", command)
+
+    async def async_update_item(self, item_name: str, state: str) -> None:
+        """Post a state update to an item without sending a command."""
+        await self._async_job(self._req_put_state, item_name, state)
+
+    def _req_put_state(self, item_name: str, state: str) -> None:
+        """PUT a plain text state to the item's state endpoint."""
+        response = self.openhab.session.put(
+            f"{self._rest_url}/items/{item_name}/state",
+            data=state.encode(),
+            headers={"Content-Type": "text/plain"},
+            timeout=self.openhab.timeout,
+        )
+        response.raise_for_status()
+
 
-    async def async_update_item(self, item_name: str, command: str) -> None:
-        """Set Item state"""
-        item = await self.hass.async_add_executor_job(self.async_get_item, item_name)
-        await item.update(command)
+def _flatten_members(raw_group: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten a recursive group response into a list without nested members."""
+    result: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    pending = [raw_group]
+    while pending:
+        raw_item = pending.pop()
+        if raw_item.get("name") in seen:
+            continue
+        seen.add(raw_item.get("name"))
+        members = raw_item.get("members")
+        if members:
+            pending.extend(members)
+            raw_item = {key: value for key, value in raw_item.items() if key != "members"}
+        result.append(raw_item)
+    return result
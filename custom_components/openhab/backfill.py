@@ -0,0 +1,162 @@
+"""Backfill openHAB persistence history into long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DEFAULT_BACKFILL_CONCURRENCY, DOMAIN, LOGGER
+from .utils import sanitize_entity_id, str_to_quantity
+
+if TYPE_CHECKING:
+    from .coordinator import OpenHABDataUpdateCoordinator
+
+BACKFILL_CHUNK = timedelta(days=1)
+STORAGE_VERSION = 1
+# Timestamp format documented for the persistence REST endpoint
+PERSISTENCE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000%z"
+
+
+class _HourlyAggregator:
+    """Fold data points into hourly mean/min/max buckets."""
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        self.unit: str | None = None
+        self._buckets: dict[datetime, list[float]] = {}  # hour -> [sum, count, min, max]
+
+    def add(self, timestamp_ms: int, state: str) -> None:
+        """Add one persisted state."""
+        value, unit = str_to_quantity(str(state))
+        if value is None:
+            return
+        if self.unit is None and unit:
+            self.unit = unit
+        hour = dt_util.utc_from_timestamp(timestamp_ms / 1000).replace(
+            minute=0, second=0, microsecond=0
+        )
+        bucket = self._buckets.get(hour)
+        if bucket is None:
+            self._buckets[hour] = [value, 1, value, value]
+            return
+        bucket[0] += value
+        bucket[1] += 1
+        bucket[2] = min(bucket[2], value)
+        bucket[3] = max(bucket[3], value)
+
+    def pop_statistics(self) -> list[StatisticData]:
+        """Return the aggregated hours and reset the buckets."""
+        statistics = [
+            StatisticData(start=hour, mean=total / count, min=minimum, max=maximum)
+            for hour, (total, count, minimum, maximum) in sorted(self._buckets.items())
+        ]
+        self._buckets = {}
+        return statistics
+
+
+def item_unit(
+    coordinator: OpenHABDataUpdateCoordinator, item_name: str
+) -> str | None:
+    """Return the unit the item's sensor reports, persisted states rarely have one."""
+    item = (coordinator.data or {}).get(item_name)
+    if item is not None and item.unit_of_measure:
+        return str(item.unit_of_measure)
+    raw_item = coordinator.raw_items.get(item_name, {})
+    if unit := raw_item.get("unitSymbol"):
+        return unit
+    # A pattern such as `%.1f °C`; `%unit%` is resolved by openHAB only
+    pattern = raw_item.get("stateDescription", {}).get("pattern") or ""
+    unit = pattern.partition(" ")[2].strip().replace("%%", "%")
+    return unit if unit and unit != "%unit%" else None
+
+
+def statistic_id_for_item(item_name: str) -> str:
+    """Return the external statistic id used for an openHAB item."""
+    return f"{DOMAIN}:{sanitize_entity_id(item_name)}"
+
+
+async def async_backfill_statistics(
+    hass: HomeAssistant,
+    coordinator: OpenHABDataUpdateCoordinator,
+    entry_id: str,
+    item_names: Iterable[str],
+    start: datetime,
+    end: datetime,
+    service_id: str | None = None,
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY,
+) -> None:
+    """Import persisted history of numeric items as hourly external statistics.
+
+    History is fetched in day-sized, hour-aligned chunks so memory stays bounded,
+    and the position reached per item is stored so an interrupted run resumes.
+    """
+    store: Store[dict[str, str]] = Store(
+        hass,
+        STORAGE_VERSION,
+        f"{DOMAIN}.backfill_{entry_id}",
+    )
+    progress: dict[str, str] = await store.async_load() or {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Only whole hours are imported, so a resumed run never rewrites a partial hour
+    start = start.replace(minute=0, second=0, microsecond=0)
+    end = end.replace(minute=0, second=0, microsecond=0)
+
+    async def async_backfill_item(item_name: str) -> None:
+        """Page through one item's history chunk by chunk."""
+        async with semaphore:
+            raw_item = coordinator.raw_items.get(item_name, {})
+            progress_key = f"{item_name}|{service_id or ''}"
+            chunk_start = start
+            if progress_key in progress:
+                chunk_start = max(start, dt_util.parse_datetime(progress[progress_key]))
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=raw_item.get("label") or item_name,
+                source=DOMAIN,
+                statistic_id=statistic_id_for_item(item_name),
+                unit_of_measurement=item_unit(coordinator, item_name),
+            )
+            imported = 0
+            while chunk_start < end:
+                chunk_end = min(chunk_start + BACKFILL_CHUNK, end)
+                try:
+                    history = await coordinator.api.async_get_persistence(
+                        item_name,
+                        chunk_start.strftime(PERSISTENCE_TIME_FORMAT),
+                        chunk_end.strftime(PERSISTENCE_TIME_FORMAT),
+                        service_id,
+                    )
+                except Exception as error:  # pylint: disable=broad-except
+                    LOGGER.warning(
+                        "Backfill of %s stopped at %s: %s", item_name, chunk_start, error
+                    )
+                    return
+
+                aggregator = _HourlyAggregator()
+                for point in history.get("data", []):
+                    aggregator.add(point["time"], point["state"])
+                statistics = aggregator.pop_statistics()
+                if statistics:
+                    if metadata["unit_of_measurement"] is None:
+                        # Only when the item defines no unit
+                        metadata["unit_of_measurement"] = aggregator.unit
+                    async_add_external_statistics(hass, metadata, statistics)
+                    imported += len(statistics)
+
+                chunk_start = chunk_end
+                progress[progress_key] = chunk_start.isoformat()
+                store.async_delay_save(lambda: progress, 10)
+
+            LOGGER.info("Backfilled %d hourly statistics for %s", imported, item_name)
+
+    await asyncio.gather(*(async_backfill_item(name) for name in item_names))
+    await store.async_save(progress)
+
@@ -0,0 +1,103 @@
+"""Classify openHAB items into Home Assistant platforms."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from .const import (
+    BINARY_SENSOR,
+    CLIMATE,
+    COVER,
+    DEVICE_TRACKER,
+    ITEMS_MAP,
+    LIGHT,
+    MEDIA_PLAYER,
+    NUMBER,
+    SELECT,
+    SENSOR,
+    SWITCH,
+)
+from .models import OpenHABItem
+from .templates import THERMOSTAT
+
+
+def _has_range(state_desc: Mapping[str, Any]) -> bool:
+    return (
+        state_desc.get("minimum") is not None
+        and state_desc.get("maximum") is not None
+    )
+
+
+def _command_options(raw_item: Mapping[str, Any]) -> list:
+    return raw_item.get("commandDescription", {}).get("commandOptions", [])
+
+
+def is_number(item: OpenHABItem, raw_item: Mapping[str, Any]) -> bool:
+    """Writable Number item with a min/max range, i.e. a setpoint."""
+    if not item.type_ or not item.type_.startswith("Number"):
+        return False
+    state_desc = raw_item.get("stateDescription", {})
+    return not state_desc.get("readOnly", True) and _has_range(state_desc)
+
+
+def is_select(item: OpenHABItem, raw_item: Mapping[str, Any]) -> bool:
+    """Writable String item with command options."""
+    if item.type_ != "String":
+        return False
+    state_desc = raw_item.get("stateDescription", {})
+    return not state_desc.get("readOnly", False) and bool(_command_options(raw_item))
+
+
+def is_sensor(item: OpenHABItem, raw_item: Mapping[str, Any]) -> bool:
+    """Read-only Number/String item, or another sensor item type."""
+    if not item.type_ or item.type_ not in ITEMS_MAP[SENSOR]:
+        return False
+    state_desc = raw_item.get("stateDescription", {})
+    is_read_only = state_desc.get("readOnly", True)
+    if item.type_.startswith("Number"):
+        return is_read_only or not _has_range(state_desc)
+    if item.type_ == "String":
+        return is_read_only or not _command_options(raw_item)
+    return True
+
+
+def is_climate_mode(item: OpenHABItem, raw_item: Mapping[str, Any]) -> bool:
+    """Writable String mode item with command options, the anchor of a thermostat."""
+    return THERMOSTAT.is_anchor(item, raw_item)
+
+
+def _of_types(platform: str) -> Callable[[OpenHABItem, Mapping[str, Any]], bool]:
+    item_types = ITEMS_MAP[platform]
+    return lambda item, raw_item: item.type_ in item_types
+
+
+PLATFORM_PREDICATES: dict[str, Callable[[OpenHABItem, Mapping[str, Any]], bool]] = {
+    BINARY_SENSOR: _of_types(BINARY_SENSOR),
+    CLIMATE: is_climate_mode,
+    COVER: _of_types(COVER),
+    DEVICE_TRACKER: _of_types(DEVICE_TRACKER),
+    LIGHT: _of_types(LIGHT),
+    MEDIA_PLAYER: _of_types(MEDIA_PLAYER),
+    NUMBER: is_number,
+    SELECT: is_select,
+    SENSOR: is_sensor,
+    SWITCH: _of_types(SWITCH),
+}
+
+
+def platforms_with_items(
+    items: Mapping[str, OpenHABItem],
+    raw_items: Mapping[str, Mapping[str, Any]],
+    platforms: Iterable[str],
+) -> list[str]:
+    """Return the given platforms that have at least one matching item."""
+    remaining = [platform for platform in platforms if platform in PLATFORM_PREDICATES]
+    found: set[str] = set()
+    for item in items.values():
+        raw_item = raw_items.get(item.name, {})
+        for platform in remaining:
+            if platform not in found and PLATFORM_PREDICATES[platform](item, raw_item):
+                found.add(platform)
+        if len(found) == len(remaining):
+            break
+    return [platform for platform in remaining if platform in found]
@@ -14,7 +14,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, LOGGER, NAME
+from .const import CLIMATE, DOMAIN, LOGGER, NAME
+from .templates import THERMOSTAT, match_templates
 from .utils import sanitize_entity_id, strip_ip
 
 
@@ -57,72 +58,34 @@ async def async_setup_entry(
     """Set up climate platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
+    matches = match_templates(
+        [THERMOSTAT],
+        coordinator.item_to_group,
+        coordinator.data or {},
+        coordinator.raw_items,
+    )
     entities = []
-    
-    # Find groups that are thermostats (have mode + temperature items)
-    for group_name, group_info in coordinator.groups.items():
-        # Find items belonging to this group
-        group_items = {
-            name: coordinator.data.get(name)
-            for name, parent in coordinator.item_to_group.items()
-            if parent == group_name and coordinator.data.get(name)
-        }
-        
-        if not group_items:
+    for match in matches[THERMOSTAT.name]:
+        group_info = coordinator.groups.get(match.group_name)
+        if group_info is None:
             continue
-        
-        # Check if this group has thermostat items
-        mode_item = None
-        current_temp_item = None
-        temp_items = {}  # keyword -> item mapping
-        raw_mode_item = None
-        
-        for item_name, item in group_items.items():
-            if not item or not item.type_:
-                continue
-                
-            name_lower = item_name.lower()
-            raw_item = coordinator.raw_items.get(item_name, {})
-            state_desc = raw_item.get("stateDescription", {})
-            
-            # Find Mode item (String with commandOptions, not read-only)
-            if item.type_ == "String" and "_mode" in name_lower:
-                cmd_opts = raw_item.get("commandDescription", {}).get("commandOptions", [])
-                if cmd_opts and not state_desc.get("readOnly", False):
-                    mode_item = item
-                    raw_mode_item = raw_item
-            
-            # Find current temperature (read-only Number:Temperature)
-            if item.type_.startswith("Number") and state_desc.get("readOnly", False):
-                if "room_temperature" in name_lower or "floor_temperature" in name_lower:
-                    if current_temp_item is None or "room" in name_lower:
-                        current_temp_item = item
-            
-            # Collect all writable temperature setpoints
-            # Match patterns like Manual_temperature, At_Home_temperature, etc. (case insensitive)
-            if item.type_.startswith("Number") and not state_desc.get("readOnly", True):
-                # Map various naming patterns to standard keywords
-                temp_patterns = [
-                    ("manual_temperature", ["manual_temperature"]),
-                    ("at_home_temperature", ["at_home_temperature", "athome_temperature", "home_temperature"]),
-                    ("away_temperature", ["away_temperature"]),
-                    ("vacation_temperature", ["vacation_temperature"]),
-                    ("frost_protection_temperature", ["frost_protection_temperature", "frostprotection_temperature"]),
-                ]
-                for keyword, patterns in temp_patterns:
-                    if any(p in name_lower for p in patterns):
-                        temp_items[keyword] = item
-                        break
-        
-        # Create climate entity if we have the required items
-        if mode_item and current_temp_item and temp_items:
-            LOGGER.info("Creating climate entity for group: %s with %d temp setpoints", 
-                       group_name, len(temp_items))
-            entities.append(OpenHABClimate(
-                hass, coordinator, group_info, 
-                mode_item, raw_mode_item,
-                current_temp_item, temp_items
-            ))
+        mode_item = match.members["mode"]
+        LOGGER.debug(
+            "Creating climate entity for group: %s with %d temp setpoints",
+            match.group_name,
+            len(match.members["setpoints"]),
+        )
+        entities.append(
+            OpenHABClimate(
+                hass,
+                coordinator,
+                group_info,
+                mode_item,
+                coordinator.raw_items.get(mode_item.name, {}),
+                match.members["current_temperature"],
+                match.members["setpoints"],
+            )
+        )
 
     LOGGER.info("Setting up %d climate entities", len(entities))
     async_add_entities(entities)
@@ -132,6 +95,7 @@ class OpenHABClimate(ClimateEntity):
     """openHAB Climate class."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE |
@@ -203,22 +167,13 @@ class OpenHABClimate(ClimateEntity):
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        group_name = self._group_info.get("name", "")
-        group_label = self._group_info.get("label", group_name)
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self._host}_{group_name}")},
-            name=group_label,
-            model="Thermostat",
-            manufacturer="openHAB",
-            via_device=(DOMAIN, self._host),
-        )
+        """Return the cached device of the thermostat group."""
+        return self.coordinator.devices.device_info(self._group_info.get("name"))
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.is_online
+        return self.coordinator.is_item_available(self._mode_item.name)
 
     @property
     def current_temperature(self) -> float | None:
@@ -240,15 +195,9 @@ class OpenHABClimate(ClimateEntity):
         temp_keyword = MODE_TO_TEMP_KEYWORD.get(current_mode, "manual_temperature")
         target_item = self._temp_items.get(temp_keyword)
         
-        LOGGER.debug("Mode: %s -> keyword: %s -> item: %s (available: %s)", 
-                    current_mode, temp_keyword, 
-                    target_item.name if target_item else None,
-                    list(self._temp_items.keys()))
-        
         # Fallback to first available temp item if mode-specific not found
         if not target_item:
             target_item = next(iter(self._temp_items.values()), None)
-            LOGGER.debug("Fallback to: %s", target_item.name if target_item else None)
         
         if target_item:
             item = self.coordinator.data.get(target_item.name)
@@ -299,12 +248,9 @@ class OpenHABClimate(ClimateEntity):
             target_item = self._get_current_target_item()
             if target_item:
                 LOGGER.debug("Setting %s to %s (mode-based)", target_item.name, temp)
-                await self.hass.async_add_executor_job(
-                    self.coordinator.api.openhab.req_post,
-                    f"/items/{target_item.name}",
-                    str(temp),
+                await self.coordinator.async_send_command(
+                    target_item.name, str(temp), CLIMATE
                 )
-                await self.coordinator.async_request_refresh()
             else:
                 LOGGER.warning("No temperature item found for current mode")
 
@@ -313,24 +259,20 @@ class OpenHABClimate(ClimateEntity):
         openhab_mode = HVAC_MODE_TO_OPENHAB.get(hvac_mode)
         if openhab_mode:
             LOGGER.debug("Setting %s to %s", self._mode_item.name, openhab_mode)
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.openhab.req_post,
-                f"/items/{self._mode_item.name}",
-                openhab_mode,
+            await self.coordinator.async_send_command(
+                self._mode_item.name, openhab_mode, CLIMATE
             )
-            await self.coordinator.async_request_refresh()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         command = self._preset_map.get(preset_mode, preset_mode)
         LOGGER.debug("Setting %s to %s (command: %s)", self._mode_item.name, preset_mode, command)
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._mode_item.name}",
-            command,
+        await self.coordinator.async_send_command(
+            self._mode_item.name, command, CLIMATE
         )
-        await self.coordinator.async_request_refresh()
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        await self.coordinator.async_request_refresh()
+    async def async_added_to_hass(self) -> None:
+        """Write state on coordinator updates instead of being polled."""
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state)
+        )
@@ -0,0 +1,150 @@
+"""Outbound command queue for an unreachable openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import requests
+
+from .const import LOGGER
+
+# Commands waiting beyond this many items drop the oldest one
+COMMAND_QUEUE_SIZE = 200
+# Queued commands older than this (seconds) are dropped instead of sent
+COMMAND_EXPIRY = 300
+# Spacing (seconds) between replayed commands so recovery is not a burst
+COMMAND_DRAIN_INTERVAL = 0.2
+COMMAND_RETRY_MIN = 2
+COMMAND_RETRY_MAX = 60
+STORAGE_VERSION = 1
+
+
+def is_unreachable(error: Exception) -> bool:
+    """Return True if a failed command means openHAB is down or restarting."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, "response", None)
+    return (
+        isinstance(error, requests.HTTPError)
+        and response is not None
+        and response.status_code >= 500
+    )
+
+
+class CommandQueue:
+    """Hold commands while openHAB is unreachable and replay them afterwards.
+
+    A newer command for an item replaces its queued one, so only the latest
+    intent is replayed. The queue retries the oldest command with backoff and,
+    once openHAB answers, drains one command per COMMAND_DRAIN_INTERVAL.
+    Queued commands can be kept in HA storage across restarts.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, send: Callable[[str, str], Awaitable[None]]
+    ) -> None:
+        """Initialize an empty queue that replays through `send`."""
+        self.hass = hass
+        self._send = send
+        self._commands: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._store: Store | None = None
+        self._task: asyncio.Task | None = None
+        # Called with the item name and command after each replayed command
+        self.on_replayed: Callable[[str, str], None] | None = None
+        self.dropped = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._commands)
+
+    async def async_persist(self, storage_key: str) -> None:
+        """Keep the queue in HA storage and restore commands left from before."""
+        self._store = Store(self.hass, STORAGE_VERSION, storage_key)
+        if stored := await self._store.async_load():
+            for item_name, command, queued_at in stored.get("commands", []):
+                self._commands.setdefault(item_name, (command, queued_at))
+            if self._commands:
+                LOGGER.info("Restored %d queued openHAB commands", len(self._commands))
+                self._async_start()
+
+    @callback
+    def enqueue(self, item_name: str, command: str) -> None:
+        """Queue a command, replacing a queued one of the same item."""
+        self._commands.pop(item_name, None)
+        if len(self._commands) >= COMMAND_QUEUE_SIZE:
+            dropped, _ = self._commands.popitem(last=False)
+            self.dropped += 1
+            LOGGER.warning("Command queue full, dropped command to %s", dropped)
+        self._commands[item_name] = (command, time.time())
+        self._async_save()
+        self._async_start()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop replaying; persisted commands are replayed after the next setup."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _async_start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_drain(), "openhab_command_queue"
+            )
+
+    @callback
+    def _async_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._data, 1.0)
+
+    def _data(self) -> dict[str, list]:
+        return {
+            "commands": [
+                [item_name, command, queued_at]
+                for item_name, (command, queued_at) in self._commands.items()
+            ]
+        }
+
+    async def _async_drain(self) -> None:
+        """Replay queued commands oldest first until the queue is empty."""
+        retry = COMMAND_RETRY_MIN
+        replayed = 0
+        while self._commands:
+            item_name, entry = next(iter(self._commands.items()))
+            command, queued_at = entry
+            if time.time() - queued_at > COMMAND_EXPIRY:
+                del self._commands[item_name]
+                self.expired += 1
+                LOGGER.warning("Dropped expired command %s to %s", command, item_name)
+                self._async_save()
+                continue
+            try:
+                await self._send(item_name, command)
+            except Exception as error:  # pylint: disable=broad-except
+                if is_unreachable(error):
+                    await asyncio.sleep(retry)
+                    retry = min(retry * 2, COMMAND_RETRY_MAX)
+                    continue
+                LOGGER.warning(
+                    "Dropped queued command %s to %s: %s", command, item_name, error
+                )
+            else:
+                replayed += 1
+                if self.on_replayed is not None:
+                    self.on_replayed(item_name, command)
+            retry = COMMAND_RETRY_MIN
+            if self._commands.get(item_name) == entry:
+                # Not superseded while it was being sent
+                del self._commands[item_name]
+            self._async_save()
+            await asyncio.sleep(COMMAND_DRAIN_INTERVAL)
+        if replayed:
+            LOGGER.info("openHAB reachable, replayed %d queued commands", replayed)
+        else:
+            LOGGER.debug("Command queue drained")
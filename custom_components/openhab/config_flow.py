@@ -2,32 +2,63 @@
 from __future__ import annotations
 
 from homeassistant import config_entries
+from homeassistant.components.zeroconf import ZeroconfServiceInfo
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 import voluptuous as vol
 
-from .api import OpenHABApiClient
 from .const import (
     AUTH_TYPES,
+    CONF_AGGREGATE,
     CONF_AUTH_TOKEN,
     CONF_AUTH_TYPE,
     CONF_AUTH_TYPE_BASIC,
     CONF_AUTH_TYPE_TOKEN,
     CONF_BASE_URL,
+    CONF_DEBUG_CHANGED_ONLY,
+    CONF_DEADBAND,
+    CONF_DEBUG_SAMPLE_RATE,
+    CONF_METADATA_NAMESPACES,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_MIRROR,
     CONF_PASSWORD,
+    CONF_PERSIST_COMMANDS,
+    CONF_ROLLING_STATS,
+    CONF_ROUND_TO_PRECISION,
+    CONF_TRANSPORT,
     CONF_USERNAME,
+    DEFAULT_DEBUG_SAMPLE_RATE,
     DOMAIN,
+    FILTER_OPTIONS,
     LOGGER,
     PLATFORMS,
+    TRANSPORT_REST,
+    TRANSPORTS,
+)
+from .discovery import (
+    async_probe_hosts,
+    async_probe_version,
+    async_validate_credentials,
+    auth_kwargs,
+    base_url_from_host,
 )
 from .utils import strip_ip
 
+CONF_DISCOVERED_URL = "openhab_url"
+
 
 class OpenHABFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for openHAB."""
 
     VERSION = 1
     data = None
+    _discovered_version = ""
 
     async def async_step_user(
         self,
@@ -39,20 +70,41 @@ class OpenHABFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         LOGGER.info(user_input)
 
         if user_input is not None:
+            # Same unique_id as zeroconf, so discovery skips configured instances
+            await self.async_set_unique_id(strip_ip(user_input[CONF_BASE_URL]))
+            self._abort_if_unique_id_configured()
             self.data = user_input
             return await self.async_step_credentials(user_input)
 
         if user_input is None:
             user_input = {}
 
+        # Offer the live instances found by zeroconf, probed concurrently
+        discovered = await async_probe_hosts(self.hass, self._discovered_urls())
+        if discovered:
+            base_url_field = SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        SelectOptionDict(value=url, label=f"{url} ({version})")
+                        for url, version in discovered.items()
+                    ],
+                    custom_value=True,
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            )
+            default_url = next(iter(discovered))
+        else:
+            base_url_field = str
+            default_url = "http://"
+
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
                     vol.Required(
                         CONF_BASE_URL,
-                        default=user_input.get(CONF_BASE_URL, "http://"),
-                    ): str,
+                        default=user_input.get(CONF_BASE_URL, default_url),
+                    ): base_url_field,
                     vol.Required(
                         CONF_AUTH_TYPE,
                         default=user_input.get(CONF_AUTH_TYPE, CONF_AUTH_TYPE_TOKEN),
@@ -62,6 +114,59 @@ class OpenHABFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_zeroconf(self, discovery_info: ZeroconfServiceInfo):
+        """Handle an openHAB instance discovered via zeroconf."""
+        base_url = base_url_from_host(discovery_info.host, discovery_info.port)
+        await self.async_set_unique_id(strip_ip(base_url))
+        self._abort_if_unique_id_configured()
+        self._async_abort_entries_match({CONF_BASE_URL: base_url})
+
+        version = await async_probe_version(self.hass, base_url)
+        if version is None:
+            return self.async_abort(reason="cannot_connect")
+
+        self.context[CONF_DISCOVERED_URL] = base_url
+        self.context["title_placeholders"] = {"name": strip_ip(base_url)}
+        self._discovered_version = version
+        return await self.async_step_zeroconf_confirm()
+
+    async def async_step_zeroconf_confirm(
+        self,
+        user_input: dict[str, str] | None = None,
+    ):
+        """Confirm a discovered instance and pick the authentication type."""
+        base_url = self.context[CONF_DISCOVERED_URL]
+        if user_input is not None:
+            self.data = {CONF_BASE_URL: base_url, **user_input}
+            return await self.async_step_credentials(dict(self.data))
+
+        return self.async_show_form(
+            step_id="zeroconf_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_AUTH_TYPE, default=CONF_AUTH_TYPE_TOKEN): vol.In(
+                        AUTH_TYPES
+                    ),
+                }
+            ),
+            description_placeholders={
+                "base_url": base_url,
+                "version": self._discovered_version,
+            },
+        )
+
+    def _discovered_urls(self) -> list[str]:
+        """Return URLs found by zeroconf flows that are not configured yet."""
+        configured = {
+            entry.data.get(CONF_BASE_URL) for entry in self._async_current_entries()
+        }
+        return [
+            flow["context"][CONF_DISCOVERED_URL]
+            for flow in self._async_in_progress(include_uninitialized=True)
+            if CONF_DISCOVERED_URL in flow["context"]
+            and flow["context"][CONF_DISCOVERED_URL] not in configured
+        ]
+
     async def async_step_credentials(
         self,
         user_input: dict[str, str] | None = None,
@@ -85,7 +190,11 @@ class OpenHABFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=strip_ip(user_input[CONF_BASE_URL]), data=user_input
                 )
-            errors["base"] = "auth"
+            # The version endpoint needs no authentication
+            if await async_probe_version(self.hass, user_input[CONF_BASE_URL]) is None:
+                errors["base"] = "cannot_connect"
+            else:
+                errors["base"] = "auth"
 
         if user_input is None:
             user_input = {}
@@ -127,15 +236,11 @@ class OpenHABFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         password: str,
     ):
         """Return true if credentials is valid."""
-        try:
-            client = OpenHABApiClient(
-                self.hass, base_url, auth_type, auth_token, username, password
-            )
-            await client.async_get_version()
-            return True
-        except Exception as error:  # pylint: disable=broad-except
-            LOGGER.error("Failed to connect to openHAB: %s", error)
-            return False
+        return await async_validate_credentials(
+            self.hass,
+            base_url,
+            **auth_kwargs(auth_type, auth_token, username, password),
+        )
 
 
 class OpenHABOptionsFlowHandler(config_entries.OptionsFlow):
@@ -163,8 +268,57 @@ class OpenHABOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(x, default=self.options.get(x, True)): bool
-                    for x in sorted(PLATFORMS)
+                    **{
+                        vol.Required(x, default=self.options.get(x, True)): bool
+                        for x in sorted(PLATFORMS)
+                    },
+                    **{
+                        vol.Optional(x, default=self.options.get(x, "")): str
+                        for x in FILTER_OPTIONS
+                    },
+                    vol.Optional(
+                        CONF_TRANSPORT,
+                        default=self.options.get(CONF_TRANSPORT, TRANSPORT_REST),
+                    ): vol.In(TRANSPORTS),
+                    vol.Optional(
+                        CONF_METADATA_NAMESPACES,
+                        default=self.options.get(CONF_METADATA_NAMESPACES, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_DEADBAND, default=self.options.get(CONF_DEADBAND, "")
+                    ): str,
+                    vol.Optional(
+                        CONF_ROUND_TO_PRECISION,
+                        default=self.options.get(CONF_ROUND_TO_PRECISION, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_MIN_WRITE_INTERVAL,
+                        default=self.options.get(CONF_MIN_WRITE_INTERVAL, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_AGGREGATE, default=self.options.get(CONF_AGGREGATE, "")
+                    ): str,
+                    vol.Optional(
+                        CONF_ROLLING_STATS,
+                        default=self.options.get(CONF_ROLLING_STATS, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_MIRROR, default=self.options.get(CONF_MIRROR, "")
+                    ): str,
+                    vol.Optional(
+                        CONF_PERSIST_COMMANDS,
+                        default=self.options.get(CONF_PERSIST_COMMANDS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEBUG_SAMPLE_RATE,
+                        default=self.options.get(
+                            CONF_DEBUG_SAMPLE_RATE, DEFAULT_DEBUG_SAMPLE_RATE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_DEBUG_CHANGED_ONLY,
+                        default=self.options.get(CONF_DEBUG_CHANGED_ONLY, False),
+                    ): bool,
                 }
             ),
         )
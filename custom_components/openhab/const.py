@@ -10,6 +10,8 @@ VERSION = "1.2.1"
 ATTRIBUTION = "Data provided by openHAB REST API"
 ISSUE_URL = "https://github.com/KingKongKent/Hacs-openhab/issues"
 DATA_COORDINATOR_UPDATE_INTERVAL = timedelta(seconds=15)
+# Safety resync interval while item state changes stream over the WebSocket
+WEBSOCKET_UPDATE_INTERVAL = timedelta(minutes=5)
 LOGGER: Logger = getLogger(__package__)
 
 # Platforms
@@ -27,6 +29,21 @@ SWITCH = "switch"
 PLATFORMS = [BINARY_SENSOR, CLIMATE, COVER, DEVICE_TRACKER, LIGHT, MEDIA_PLAYER, NUMBER, SELECT, SENSOR, SWITCH]
 
 
+# Services
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_CYCLES = "cycles"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+ATTR_ITEMS = "items"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_PERSISTENCE_SERVICE = "persistence_service"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+SERVICE_RECORD_TRAFFIC = "record_traffic"
+ATTR_DURATION = "duration"
+ATTR_REDACT = "redact"
+SERVICE_COMMAND_LATENCY = "command_latency"
+
 # Configuration and options
 CONF_ENABLED = "enabled"
 CONF_BASE_URL = "base_url"
@@ -39,8 +56,53 @@ CONF_AUTH_TYPE_TOKEN = "token"
 
 AUTH_TYPES = [CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN]
 
+CONF_INCLUDE_GROUPS = "include_groups"
+CONF_EXCLUDE_GROUPS = "exclude_groups"
+CONF_INCLUDE_TAGS = "include_tags"
+CONF_EXCLUDE_TAGS = "exclude_tags"
+CONF_INCLUDE_ITEMS = "include_items"
+CONF_EXCLUDE_ITEMS = "exclude_items"
+CONF_ITEM_TYPES = "item_types"
+CONF_SITEMAPS = "sitemaps"
+FILTER_OPTIONS = [
+    CONF_INCLUDE_GROUPS,
+    CONF_EXCLUDE_GROUPS,
+    CONF_INCLUDE_TAGS,
+    CONF_EXCLUDE_TAGS,
+    CONF_INCLUDE_ITEMS,
+    CONF_EXCLUDE_ITEMS,
+    CONF_ITEM_TYPES,
+    CONF_SITEMAPS,
+]
+
+CONF_TRANSPORT = "transport"
+TRANSPORT_REST = "rest"
+TRANSPORT_WEBSOCKET = "websocket"
+TRANSPORTS = [TRANSPORT_REST, TRANSPORT_WEBSOCKET]
+
+CONF_METADATA_NAMESPACES = "metadata_namespaces"
+# Metadata namespace with per-item Home Assistant overrides
+METADATA_NAMESPACE_HA = "ha"
+
+CONF_DEADBAND = "deadband"
+CONF_ROUND_TO_PRECISION = "round_to_precision"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+CONF_AGGREGATE = "aggregate"
+CONF_ROLLING_STATS = "rolling_stats"
+
+# Home Assistant entity_id=openHAB item pairs whose state is pushed to openHAB
+CONF_MIRROR = "mirror"
+
+# Keep commands queued while openHAB is unreachable across HA restarts
+CONF_PERSIST_COMMANDS = "persist_commands"
+
+CONF_DEBUG_SAMPLE_RATE = "debug_sample_rate"
+CONF_DEBUG_CHANGED_ONLY = "debug_changed_only"
+
 # Defaults
 DEFAULT_NAME = DOMAIN
+DEFAULT_DEBUG_SAMPLE_RATE = 1
+DEFAULT_BACKFILL_CONCURRENCY = 4
 
 ITEMS_MAP = {
     BINARY_SENSOR: ["Contact"],
@@ -1,14 +1,46 @@
 """Data update coordinator for integration openHAB."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .acks import ACK_POLL_DELAYS, CommandHandle, CommandTracker
+from .aggregation import Aggregator
 from .api import ApiClientException, OpenHABApiClient
-from .const import DATA_COORDINATOR_UPDATE_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    CONF_DEBUG_CHANGED_ONLY,
+    CONF_DEBUG_SAMPLE_RATE,
+    CONF_METADATA_NAMESPACES,
+    CONF_SITEMAPS,
+    DATA_COORDINATOR_UPDATE_INTERVAL,
+    DEFAULT_DEBUG_SAMPLE_RATE,
+    DOMAIN,
+    LOGGER,
+    WEBSOCKET_UPDATE_INTERVAL,
+)
+from .debug_logging import ITEM_LOGGER, ItemLogSampler
+from .devices import DeviceSync
+from .governor import RefreshGovernor
+from .metadata import MetadataCache
+from .item_filter import ItemFilter, split_option
+from .models import OpenHABItem
+from .profiler import RefreshProfiler
+from .rolling import RollingStats
+from .semantic import SemanticIndex
+from .sitemaps import SITEMAP_ITEM_FETCH_LIMIT, SitemapScope
+from .state_filter import StateFilter
+from .things import ThingIndex
+from .utils import sanitize_entity_id, strip_ip
 
 
 class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
@@ -16,15 +48,56 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, api: OpenHABApiClient) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: OpenHABApiClient,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
         """Initialize."""
         self.api = api
+        self.options: Mapping[str, Any] = options or {}
         self.platforms: list[str] = []
         self.version: str = ""
         self.is_online = False
         self.groups: dict[str, dict] = {}  # Group name -> group info
-        self.item_to_group: dict[str, str] = {}  # Item name -> parent group name
+        self._group_parents: dict[str, list[str]] = {}  # Group name -> groupNames
+        # Groups above the include group, by the include group's parents
+        self._outer_groups: list[dict] = []
+        self._outer_groups_key: tuple[str, ...] | None = None
+        self.item_to_group: dict[str, str] = {}  # Item name -> device group name
+        self.semantic = SemanticIndex()
         self.raw_items: dict[str, dict] = {}  # Item name -> raw item dict
+        self.item_filter = ItemFilter.from_options(self.options)
+        self.state_filter = StateFilter.from_options(self.options)
+        self.aggregator = Aggregator.from_options(self.options)
+        self.rolling = RollingStats.from_options(self.options)
+        sitemaps = split_option(self.options.get(CONF_SITEMAPS))
+        self.sitemap_scope = SitemapScope(sitemaps) if sitemaps else None
+        self._log_sampler = ItemLogSampler(
+            self.options.get(CONF_DEBUG_SAMPLE_RATE, DEFAULT_DEBUG_SAMPLE_RATE),
+            self.options.get(CONF_DEBUG_CHANGED_ONLY, False),
+        )
+
+        self.profiler = RefreshProfiler(
+            hass, sanitize_entity_id(strip_ip(api._base_url))
+        )
+        api.profiler = self.profiler
+        self.governor = RefreshGovernor(self)
+        self._refresh_lock = asyncio.Lock()
+        self.things = ThingIndex()
+        self.metadata = MetadataCache(
+            split_option(self.options.get(CONF_METADATA_NAMESPACES))
+        )
+        self.devices = DeviceSync(self)
+        self.commands = CommandTracker(hass)
+        # Item name -> platform of its command waiting in the command queue
+        self._queued_platforms: dict[str, str] = {}
+        api.command_queue.on_replayed = self._async_command_replayed
+        self._pending_state_items: set[str] = set()
+        self._state_flush_handle: asyncio.TimerHandle | None = None
+        self._release_handle: asyncio.TimerHandle | None = None
+        self._release_at = 0.0  # Monotonic time of the scheduled release
 
         super().__init__(
             hass,
@@ -33,23 +106,323 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=DATA_COORDINATOR_UPDATE_INTERVAL,
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def async_request_refresh(self) -> None:
+        """Request a full refresh through the refresh governor."""
+        self.governor.async_request()
+
+    async def async_request_item_refresh(self, *item_names: str) -> None:
+        """Request fresh state of only the given items through the governor."""
+        if self.api.websocket is not None and self.api.websocket.connected:
+            # The state change arrives as a WebSocket event
+            return
+        self.governor.async_request(item_names)
+
+    async def async_send_command(
+        self, item_name: str, command: str, platform: str
+    ) -> CommandHandle | None:
+        """Send a command and track it until openHAB reports the new state.
+
+        Returns None if openHAB is unreachable and the command was queued; it
+        is tracked from the moment the queue replays it.
+        """
+        handle = self.commands.track(
+            item_name, command, platform, self.raw_items.get(item_name, {}).get("state")
+        )
+        try:
+            sent = await self.api.async_send_command(item_name, command)
+        except Exception:
+            self.commands.discard(handle)
+            raise
+        if not sent:
+            self.commands.discard(handle)
+            self._queued_platforms[item_name] = platform
+            return None
+        self._async_poll_unconfirmed(handle)
+        return handle
+
+    @callback
+    def _async_command_replayed(self, item_name: str, command: str) -> None:
+        """Track a queued command once it has been sent."""
+        handle = self.commands.track(
+            item_name,
+            command,
+            self._queued_platforms.pop(item_name, DOMAIN),
+            self.raw_items.get(item_name, {}).get("state"),
+        )
+        self._async_poll_unconfirmed(handle)
+
+    @callback
+    def _async_poll_unconfirmed(self, handle: CommandHandle) -> None:
+        """Without WebSocket events, poll only the item until it is confirmed."""
+        if not handle.done and (
+            self.api.websocket is None or not self.api.websocket.connected
+        ):
+            self.hass.async_create_background_task(
+                self._async_poll_command(handle), f"{DOMAIN}_ack_{handle.item_name}"
+            )
+
+    async def _async_poll_command(self, handle: CommandHandle) -> None:
+        """Request targeted refreshes of the item, backing off, until confirmed."""
+        for delay in ACK_POLL_DELAYS:
+            self.governor.async_request([handle.item_name])
+            await handle.async_wait(delay)
+            if handle.done:
+                return
+
+    async def async_refresh_items(self, item_names: Iterable[str]) -> None:
+        """Fetch the given items and notify listeners, without a full download."""
+        item_names = [name for name in item_names if name in self.raw_items]
+        if not item_names or self.data is None:
+            return
+        results = await asyncio.gather(
+            *(self.api.async_get_item_raw(name) for name in item_names),
+            return_exceptions=True,
+        )
+        raw_items = [result for result in results if isinstance(result, dict)]
+        if len(raw_items) != len(results):
+            LOGGER.debug("Item refresh failed, falling back to a full refresh")
+            self.governor.async_request()
+        if not raw_items:
+            return
+        items = await self.api.async_build_items(raw_items)
+        for raw_item in raw_items:
+            self.raw_items[raw_item["name"]] = raw_item
+            self.commands.confirm(raw_item["name"], raw_item.get("state", ""))
+        self.data.update(self._filter_states(items))
+        super().async_update_listeners()
+
+    def async_enable_websocket(self) -> bool:
+        """Stream item state changes over the openHAB 4 WebSocket."""
+        major = self.version.split(".")[0]
+        if not major.isdigit() or int(major) < 4:
+            LOGGER.warning(
+                "WebSocket transport needs openHAB 4 or later (found %s), using REST",
+                self.version,
+            )
+            return False
+        websocket = self.api.enable_websocket()
+        websocket.type_lookup = lambda item_name: self.raw_items.get(
+            item_name, {}
+        ).get("type")
+        websocket.on_state = self.async_handle_item_state
+        websocket.on_thing_status = self.async_handle_thing_status
+        websocket.on_item_updated = self.async_handle_item_updated
+        websocket.on_connection = self._async_websocket_connection
+        websocket.start()
+        return True
+
+    @callback
+    def _async_websocket_connection(self, connected: bool) -> None:
+        """Poll rarely while events stream in, normally when the socket is down."""
+        self.update_interval = (
+            WEBSOCKET_UPDATE_INTERVAL if connected else DATA_COORDINATOR_UPDATE_INTERVAL
+        )
+
+    @callback
+    def async_handle_item_state(self, item_name: str, state: str) -> None:
+        """Apply a state change pushed by openHAB, batched per loop tick."""
+        raw_item = self.raw_items.get(item_name)
+        if raw_item is None:
+            return
+        raw_item["state"] = state
+        self.commands.confirm(item_name, state)
+        self._pending_state_items.add(item_name)
+        if self._state_flush_handle is None:
+            self._state_flush_handle = self.hass.loop.call_soon(
+                self._async_flush_item_states
+            )
+
+    @callback
+    def async_handle_thing_status(self, thing_uid: str, status: str) -> None:
+        """Apply a Thing status change pushed by openHAB."""
+        if self.things.set_status(thing_uid, status):
+            super().async_update_listeners()
+
+    @callback
+    def async_handle_item_updated(self, item_name: str) -> None:
+        """Re-read the cached metadata of an item whose definition changed."""
+        if self.metadata.namespaces and item_name in self.raw_items:
+            self.hass.async_create_task(self._async_reload_item_metadata(item_name))
+
+    async def _async_reload_item_metadata(self, item_name: str) -> None:
+        """Reload one item's metadata and notify listeners if it changed."""
+        if await self.metadata.async_reload_item(self.api, item_name):
+            super().async_update_listeners()
+
+    def is_item_available(self, item_name: str) -> bool:
+        """Return True if openHAB is reachable and the item's Thing is ONLINE."""
+        return self.is_online and self.things.is_available(item_name)
+
+    async def _async_refresh_things(self) -> None:
+        """Re-read Thing status and channel links at low frequency."""
+        try:
+            raw_things = await self.api.async_get_things_raw()
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug("Could not fetch Things for availability: %s", error)
+            self.things.postpone()
+            return
+        self.things.update(raw_things)
+
+    @callback
+    def _async_flush_item_states(self) -> None:
+        """Rebuild changed items and notify listeners once per batch."""
+        self._state_flush_handle = None
+        item_names, self._pending_state_items = self._pending_state_items, set()
+        if self.data is None:
+            return
+        dispatch = False
+        for item_name in item_names:
+            raw_item = self.raw_items[item_name]
+            item = OpenHABItem.from_raw(raw_item)
+            self.rolling.add(item)
+            if self.aggregator.add(item, raw_item) and item_name in self.data:
+                continue
+            if self.state_filter.accept(item, self.data.get(item_name), raw_item):
+                self.data[item_name] = item
+                dispatch = True
+        self._async_schedule_release()
+        if dispatch:
+            super().async_update_listeners()
+
+    def _filter_states(self, items: dict[str, OpenHABItem]) -> dict[str, OpenHABItem]:
+        """Keep the last dispatched item for aggregated or insignificant changes."""
+        if self.rolling.active:
+            for item in items.values():
+                self.rolling.add(item)
+        if self.data is None:
+            # First refresh: entities start from the raw state
+            for item_name, item in items.items():
+                self.aggregator.add(item, self.raw_items[item_name])
+            return items
+        if not self.state_filter.active and not self.aggregator.active:
+            return items
+        for item_name, item in items.items():
+            previous = self.data.get(item_name)
+            if previous is None:
+                self.aggregator.add(item, self.raw_items[item_name])
+            elif self.aggregator.add(item, self.raw_items[item_name]):
+                items[item_name] = previous
+            elif not self.state_filter.accept(
+                item, previous, self.raw_items[item_name]
+            ):
+                items[item_name] = previous
+        self._async_schedule_release()
+        return items
+
+    @callback
+    def _async_schedule_release(self) -> None:
+        """Time the dispatch of the next state held back by the write interval."""
+        release_at = self.state_filter.next_release
+        if release_at is None:
+            return
+        if self._release_handle is not None:
+            if self._release_at <= release_at:
+                return
+            self._release_handle.cancel()
+        self._release_at = release_at
+        self._release_handle = self.hass.loop.call_later(
+            max(release_at - time.monotonic(), 0), self._async_release_held
+        )
+
+    @callback
+    def _async_release_held(self) -> None:
+        """Dispatch the held-back states whose write interval has passed."""
+        self._release_handle = None
+        released = self.state_filter.release()
+        if released and self.data is not None:
+            for item in released:
+                self.data[item.name] = item
+            super().async_update_listeners()
+        self._async_schedule_release()
+
+    @callback
+    def async_cancel_release(self) -> None:
+        """Stop dispatching held-back states, on unload."""
+        if self._release_handle is not None:
+            self._release_handle.cancel()
+            self._release_handle = None
+
+    @callback
+    def async_start_aggregation(self) -> CALLBACK_TYPE:
+        """Publish the aggregated items at the end of each window."""
+        unsubscribes = [
+            async_track_time_interval(
+                self.hass,
+                partial(self._async_publish_aggregates, window),
+                timedelta(seconds=window),
+            )
+            for window in self.aggregator.windows
+        ]
+
+        @callback
+        def _async_stop() -> None:
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+
+        return _async_stop
+
+    @callback
+    def _async_publish_aggregates(
+        self, window: int, _now: datetime | None = None
+    ) -> None:
+        """Write one aggregated state per item for a closed window."""
+        items = self.aggregator.flush(window)
+        if items and self.data is not None:
+            self.data.update(items)
+            super().async_update_listeners()
+
+    async def _async_update_data(self) -> dict[str, OpenHABItem]:
         """Update data via library."""
+        if self._refresh_lock.locked():
+            # A cycle is already in flight, reuse its result instead of overlapping
+            async with self._refresh_lock:
+                return self.data
+        async with self._refresh_lock:
+            self.profiler.cycle_started()
+            try:
+                return await self._async_fetch_data()
+            except BaseException:
+                # Only successful cycles reach async_update_listeners, which
+                # finishes them after the entity writes
+                self.profiler.cycle_finished()
+                raise
+
+    async def _async_fetch_data(self) -> dict[str, OpenHABItem]:
+        """Fetch, filter and parse all items."""
+        self.governor.full_refresh_started()
         try:
             if self.version is None or len(self.version) == 0:
                 self.version = await self.api.async_get_version()
                 LOGGER.info("Connected to openHAB version: %s", self.version)
 
-            items = await self.api.async_get_items()
-            self.is_online = bool(items)
-            
-            # Fetch raw items and groups for device hierarchy
+            # Fetch raw items once, filter them, then build Items for the rest
             await self._fetch_raw_items_and_groups()
-            
+            for item_name in list(self.commands.pending):
+                if raw_item := self.raw_items.get(item_name):
+                    self.commands.confirm(item_name, raw_item.get("state", ""))
+            with self.profiler.phase("parse_items"):
+                items = await self.api.async_build_items(list(self.raw_items.values()))
+                items = self._filter_states(items)
+            with self.profiler.phase("sync_devices"):
+                self.devices.async_sync(items)
+            self.is_online = bool(items)
+            if self.things.needs_refresh():
+                with self.profiler.phase("fetch_things"):
+                    await self._async_refresh_things()
+            if self.metadata.needs_load():
+                with self.profiler.phase("fetch_metadata"):
+                    await self.metadata.async_load(self.api, self.raw_items)
+
             if items:
-                LOGGER.info("Fetched %d items from openHAB", len(items))
-                for item_name, item in items.items():
-                    LOGGER.debug("Item: %s, Type: %s", item_name, item.type_)
+                LOGGER.debug("Fetched %d items from openHAB", len(items))
+                if ITEM_LOGGER.isEnabledFor(logging.DEBUG):
+                    for item_name, item in self._log_sampler.sample(items):
+                        ITEM_LOGGER.debug(
+                            "Item: %s, Type: %s, State: %s",
+                            item_name,
+                            item.type_,
+                            item._raw_state,
+                        )
             else:
                 LOGGER.warning("No items fetched from openHAB. Make sure you have Items (not just Things) configured in openHAB.")
             
@@ -60,31 +433,138 @@ class OpenHABDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _fetch_raw_items_and_groups(self) -> None:
         """Fetch raw items and groups for device hierarchy."""
+        scope_names = None
+        scope_changed = False
+        if self.sitemap_scope is not None:
+            scope_names, scope_changed = await self.sitemap_scope.async_item_names(
+                self.api
+            )
+
+            if scope_names is None:
+                # Never import everything because the sitemaps are unreachable
+                sitemaps = ", ".join(self.sitemap_scope.sitemaps)
+                raise UpdateFailed(f"Could not resolve sitemaps {sitemaps}")
+
+        with self.profiler.phase("fetch_raw_items"):
+            raw_items_list = None
+            if (
+                scope_names is not None
+                and not scope_changed
+                and self.groups
+                and len(scope_names) <= SITEMAP_ITEM_FETCH_LIMIT
+            ):
+                # Small sitemap scope: poll only its items, keep the group index
+                try:
+                    raw_items_list = await self.api.async_get_items_raw_by_name(
+                        scope_names
+                    )
+                    index_groups = False
+                except Exception as error:  # pylint: disable=broad-except
+                    LOGGER.debug(
+                        "Scoped item fetch failed, fetching all items: %s", error
+                    )
+            if raw_items_list is None:
+                raw_items_list = await self.api.async_get_items_raw(
+                    group=self.item_filter.fetch_group
+                )
+                index_groups = True
+
+        outer_groups: list[dict] = []
+        if index_groups and self.item_filter.fetch_group is not None:
+            with self.profiler.phase("fetch_outer_groups"):
+                outer_groups = await self._async_outer_groups(raw_items_list)
+
+        with self.profiler.phase("classify_groups"):
+            self._index_raw_items(
+                raw_items_list, scope_names, index_groups, outer_groups
+            )
+
+        LOGGER.debug("Fetched %d raw items, %d groups, %d item-to-group mappings", 
+                   len(self.raw_items), len(self.groups), len(self.item_to_group))
+
+    async def _async_outer_groups(self, raw_items_list: list[dict]) -> list[dict]:
+        """Return the groups above the fetched include group, for its Locations.
+
+        They are fetched again only when the include group's parents change.
+        """
+        fetch_group = self.item_filter.fetch_group
+        parents = next(
+            (
+                tuple(raw_item.get("groupNames", []))
+                for raw_item in raw_items_list
+                if raw_item.get("name") == fetch_group
+            ),
+            (),
+        )
+        if parents == self._outer_groups_key:
+            return self._outer_groups
+        outer_groups = []
+        seen: set[str] = set()
+        pending = list(parents)
         try:
-            raw_items_list = await self.api.async_get_items_raw()
-            
-            self.raw_items = {}
+            while pending:
+                group = pending.pop()
+                if group in seen:
+                    continue
+                seen.add(group)
+                raw_group = await self.api.async_get_group_raw(group)
+                raw_group.pop("members", None)
+                outer_groups.append(raw_group)
+                pending.extend(raw_group.get("groupNames", []))
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug("Could not fetch the groups above %s: %s", fetch_group, error)
+            return self._outer_groups
+        self._outer_groups = outer_groups
+        self._outer_groups_key = parents
+        return outer_groups
+
+    def _index_raw_items(
+        self,
+        raw_items_list: list[dict],
+        scope_names: frozenset[str] | None = None,
+        index_groups: bool = True,
+        outer_groups: list[dict] | None = None,
+    ) -> None:
+        """Index groups from all raw items, and filtered raw items by name.
+
+        `outer_groups` only feed the semantic index, they are not devices.
+        """
+        self.raw_items = {}
+        self.item_to_group = {}
+
+        if index_groups:
+            with self.profiler.phase("semantic_index"):
+                self.semantic.update([*raw_items_list, *(outer_groups or ())])
             self.groups = {}
-            self.item_to_group = {}
-            
+            self._group_parents = {}
             for raw_item in raw_items_list:
-                item_name = raw_item.get("name", "")
-                self.raw_items[item_name] = raw_item
-                
                 if raw_item.get("type") == "Group":
+                    item_name = raw_item.get("name", "")
+                    self._group_parents[item_name] = raw_item.get("groupNames", [])
                     self.groups[item_name] = {
                         "name": item_name,
                         "label": raw_item.get("label", item_name),
                         "tags": raw_item.get("tags", []),
                         "category": raw_item.get("category", ""),
                     }
-                
-                # Map items to their parent groups
-                group_names = raw_item.get("groupNames", [])
-                if group_names:
-                    self.item_to_group[item_name] = group_names[0]
-            
-            LOGGER.info("Fetched %d raw items, %d groups, %d item-to-group mappings", 
-                       len(self.raw_items), len(self.groups), len(self.item_to_group))
-        except Exception as e:
-            LOGGER.warning("Could not fetch raw items: %s", e)
+
+        # Scoped fetches lack the groups, resolve nesting from the last full index
+        for raw_item in self.item_filter.filter(raw_items_list, self._group_parents):
+            item_name = raw_item.get("name", "")
+            if scope_names is not None and item_name not in scope_names:
+                continue
+            self.raw_items[item_name] = raw_item
+
+            # Map items to their equipment, else their first parent group
+            equipment = self.semantic.equipment.get(item_name)
+            if equipment in self.groups and equipment != item_name:
+                self.item_to_group[item_name] = equipment
+            elif group_names := raw_item.get("groupNames"):
+                self.item_to_group[item_name] = group_names[0]
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the entity state writes."""
+        with self.profiler.phase("entity_writes"):
+            super().async_update_listeners()
+        self.profiler.cycle_finished()
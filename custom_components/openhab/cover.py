@@ -44,39 +44,25 @@ class OpenHABCover(OpenHABEntity, CoverEntity):
         """Move the cover to a specific position."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            str(kwargs[ATTR_POSITION]),
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command(str(kwargs[ATTR_POSITION]))
 
     async def async_open_cover(self, **kwargs: dict[str, Any]) -> None:
         """Open the cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "UP"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("UP")
 
     async def async_close_cover(self, **kwargs: dict[str, Any]) -> None:
         """Close cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "DOWN"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("DOWN")
 
     async def async_stop_cover(self, **kwargs: dict[str, Any]) -> None:
         """Close cover."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "STOP"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("STOP")
 
     @property
     def is_closed(self) -> bool:
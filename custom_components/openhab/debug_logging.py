@@ -0,0 +1,86 @@
+"""Off-hot-path and sampled debug logging for openHAB."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+from typing import Any
+
+from .const import LOGGER
+
+# Per-item refresh lines; the rest of the integration logs through LOGGER directly
+ITEM_LOGGER = LOGGER.getChild("items")
+
+_listener: QueueListener | None = None
+_handler: QueueHandler | None = None
+_users = 0
+
+
+class _LazyQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the worker thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record untouched, args are formatted by the listener."""
+        return record
+
+
+class _ParentHandler(logging.Handler):
+    """Hand records from the worker thread to LOGGER's handlers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Dispatch the record as if ITEM_LOGGER had propagated it."""
+        LOGGER.callHandlers(record)
+
+
+def start_log_worker() -> None:
+    """Route ITEM_LOGGER through a background queue worker, shared by all entries."""
+    global _listener, _handler, _users  # pylint: disable=global-statement
+    _users += 1
+    if _listener is not None:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _handler = _LazyQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, _ParentHandler())
+    ITEM_LOGGER.addHandler(_handler)
+    ITEM_LOGGER.propagate = False
+    _listener.start()
+
+
+def stop_log_worker() -> None:
+    """Flush the queue worker and restore normal propagation when unused."""
+    global _listener, _handler, _users  # pylint: disable=global-statement
+    _users = max(_users - 1, 0)
+    if _users or _listener is None:
+        return
+    ITEM_LOGGER.removeHandler(_handler)
+    ITEM_LOGGER.propagate = True
+    _listener.stop()
+    _listener = None
+    _handler = None
+
+
+class ItemLogSampler:
+    """Pick which items get a per-refresh debug line."""
+
+    def __init__(self, sample_rate: int = 1, changed_only: bool = False) -> None:
+        """Log one in `sample_rate` items, optionally only changed ones."""
+        self.sample_rate = max(int(sample_rate), 1)
+        self.changed_only = changed_only
+        self._cycle = 0
+        self._last_states: dict[str, Any] = {}
+
+    def sample(self, items: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+        """Yield the (name, item) pairs to log for this refresh."""
+        self._cycle += 1
+        for index, (item_name, item) in enumerate(items.items()):
+            raw_state = item._raw_state
+            if self.changed_only and self._last_states.get(item_name) == raw_state:
+                continue
+            # Rotate the offset so every item is eventually sampled
+            if (index + self._cycle) % self.sample_rate:
+                continue
+            if self.changed_only:
+                # Only emitted states count as seen, so skipped changes log later
+                self._last_states[item_name] = raw_state
+            yield item_name, item
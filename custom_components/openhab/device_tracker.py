@@ -8,6 +8,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DEVICE_TRACKER, DOMAIN, ITEMS_MAP
 from .device_classes_map import SENSOR_DEVICE_CLASS_MAP
 from .entity import OpenHABEntity
+from .utils import str_to_location
 
 
 async def async_setup_entry(
@@ -35,26 +36,22 @@ class OpenHABTracker(OpenHABEntity, TrackerEntity):
         """Return the latitude."""
         return self.item.label if len(self.item.label) > 0 else self.item.name
 
+    def _parse_state(self, raw_state: str) -> tuple[float, float]:
+        """Parse the "lat,lon,alt" state once per state change."""
+        return str_to_location(raw_state)
+
     @property
     def latitude(self):
         """Return the latitude."""
-        if (
-            self.item._state is not None
-            and self.item._state != "NULL"
-            and self.item._state != "UNDEF"
-        ):
-            return float(self.item._state.split(",")[0])
+        if self._parsed_state is not None:
+            return self._parsed_state[0]
         return None
 
     @property
     def longitude(self):
         """Return the longitude."""
-        if (
-            self.item._state is not None
-            and self.item._state != "NULL"
-            and self.item._state != "UNDEF"
-        ):
-            return float(self.item._state.split(",")[1])
+        if self._parsed_state is not None:
+            return self._parsed_state[1]
         return None
 
     @property
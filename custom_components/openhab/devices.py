@@ -0,0 +1,175 @@
+"""Device registry sync for openHAB groups."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
+
+from .classify import PLATFORM_PREDICATES
+from .const import DOMAIN, LOGGER, NAME, VERSION
+from .models import OpenHABItem
+from .utils import strip_ip
+
+if TYPE_CHECKING:
+    from .coordinator import OpenHABDataUpdateCoordinator
+
+
+def group_model(tags: list[str]) -> str:
+    """Return the device model shown for a group."""
+    return "Thermostat" if "Equipment" in tags else "Device"
+
+
+class DeviceSync:
+    """Keep one device per openHAB group that owns at least one entity.
+
+    DeviceInfo objects are built once per group and reused by all its entities.
+    `async_sync` writes the devices to the registry in one pass, only touches
+    groups whose label, tags or semantic location changed since the last sync,
+    and removes the entry's devices of groups that no longer own an entity.
+    """
+
+    def __init__(self, coordinator: OpenHABDataUpdateCoordinator) -> None:
+        """Initialize the sync for one coordinator."""
+        self._coordinator = coordinator
+        self._base_url = coordinator.api._base_url
+        self.host = strip_ip(self._base_url)
+        self.hub_identifier = (DOMAIN, self.host)
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._signatures: dict[str, tuple] = {}
+        self._hub_info: DeviceInfo | None = None
+        self._hub_version: str | None = None
+        self._synced_hub_version: str | None = None
+        self._synced_groups: set[str] | None = None
+
+    def hub_device_info(self) -> DeviceInfo:
+        """Return the device of the openHAB server itself."""
+        version = self._coordinator.version or VERSION
+        if self._hub_info is None or version != self._hub_version:
+            self._hub_version = version
+            self._hub_info = DeviceInfo(
+                identifiers={self.hub_identifier},
+                name=f"{NAME} - {self.host}",
+                model=version,
+                manufacturer=NAME,
+                configuration_url=self._base_url,
+            )
+        return self._hub_info
+
+    def device_info(self, group_name: str | None) -> DeviceInfo:
+        """Return the cached device of a group, or the server device."""
+        if group_name is None or group_name not in self._coordinator.groups:
+            return self.hub_device_info()
+        info = self._device_infos.get(group_name)
+        if info is None:
+            info = self._build(group_name)
+        return info
+
+    def _signature(
+        self, group_name: str
+    ) -> tuple[str, tuple[str, ...], str | None]:
+        group = self._coordinator.groups[group_name]
+        return (
+            group.get("label") or group_name,
+            tuple(group.get("tags", [])),
+            self._coordinator.semantic.location_label(group_name),
+        )
+
+    def _build(self, group_name: str) -> DeviceInfo:
+        """Build and cache the DeviceInfo of a group."""
+        label, tags, area = self._signature(group_name)
+        info = DeviceInfo(
+            identifiers={(DOMAIN, f"{self.host}_{group_name}")},
+            name=label,
+            model=group_model(list(tags)),
+            manufacturer="openHAB",
+            via_device=self.hub_identifier,
+        )
+        if area:
+            info["suggested_area"] = area
+        self._device_infos[group_name] = info
+        return info
+
+    def _device_groups(self, items: Mapping[str, OpenHABItem]) -> set[str]:
+        """Return the groups with at least one item on a loaded platform."""
+        coordinator = self._coordinator
+        predicates = [
+            PLATFORM_PREDICATES[platform]
+            for platform in coordinator.platforms
+            if platform in PLATFORM_PREDICATES
+        ]
+        device_groups: set[str] = set()
+        for item_name, group_name in coordinator.item_to_group.items():
+            if group_name in device_groups or group_name not in coordinator.groups:
+                continue
+            item = items.get(item_name)
+            if item is None:
+                continue
+            raw_item = coordinator.raw_items.get(item_name, {})
+            if any(predicate(item, raw_item) for predicate in predicates):
+                device_groups.add(group_name)
+        return device_groups
+
+    @callback
+    def async_sync(self, items: Mapping[str, OpenHABItem]) -> None:
+        """Create or update the devices of changed groups, remove stale ones."""
+        entry = self._coordinator.config_entry
+        if entry is None or not self._coordinator.platforms:
+            # Platforms are known after the first refresh, their entities add
+            # the devices themselves
+            return
+        registry = dr.async_get(self._coordinator.hass)
+        device_groups = self._device_groups(items)
+        changed = [
+            group_name
+            for group_name in device_groups
+            if self._signatures.get(group_name) != self._signature(group_name)
+        ]
+        hub_info = self.hub_device_info()
+        if (
+            not changed
+            and self._synced_hub_version == self._hub_version
+            and self._synced_groups == device_groups
+        ):
+            return
+
+        if self._synced_hub_version != self._hub_version:
+            self._synced_hub_version = self._hub_version
+            registry.async_get_or_create(config_entry_id=entry.entry_id, **hub_info)
+        for group_name in changed:
+            self._signatures[group_name] = self._signature(group_name)
+            registry.async_get_or_create(
+                config_entry_id=entry.entry_id, **self._build(group_name)
+            )
+        if self._synced_groups != device_groups:
+            self._synced_groups = device_groups
+            self._async_remove_stale(registry, entry.entry_id, device_groups)
+        for group_name in set(self._device_infos) - device_groups:
+            del self._device_infos[group_name]
+            self._signatures.pop(group_name, None)
+        LOGGER.debug(
+            "Synced %d of %d openHAB group devices", len(changed), len(device_groups)
+        )
+
+    @callback
+    def _async_remove_stale(
+        self, registry: dr.DeviceRegistry, entry_id: str, device_groups: set[str]
+    ) -> None:
+        """Detach the entry from its devices of groups without entities.
+
+        HA keeps devices whose entities are gone, so renamed, regrouped or
+        filtered groups are removed here. A device used by another config
+        entry only loses this entry, otherwise it is deleted.
+        """
+        identifiers = {(DOMAIN, f"{self.host}_{group}") for group in device_groups}
+        identifiers.add(self.hub_identifier)
+        removed = 0
+        for device in dr.async_entries_for_config_entry(registry, entry_id):
+            if device.identifiers & identifiers:
+                continue
+            registry.async_update_device(device.id, remove_config_entry_id=entry_id)
+            removed += 1
+        if removed:
+            LOGGER.info("Removed %d openHAB group devices without entities", removed)
@@ -0,0 +1,90 @@
+"""Discovery and lightweight probing of openHAB instances."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN, LOGGER
+
+PROBE_TIMEOUT = 3
+
+
+def auth_kwargs(
+    auth_type: str | None,
+    auth_token: str | None = None,
+    username: str | None = None,
+    password: str | None = None,
+) -> dict[str, Any]:
+    """Return aiohttp request kwargs for the configured openHAB authentication."""
+    if auth_type == CONF_AUTH_TYPE_TOKEN and auth_token:
+        return {"headers": {"X-OPENHAB-TOKEN": auth_token}}
+    if auth_type == CONF_AUTH_TYPE_BASIC and username:
+        return {"auth": aiohttp.BasicAuth(username, password or "")}
+    return {}
+
+
+async def _async_get_json(
+    hass: HomeAssistant, url: str, timeout: float, **kwargs: Any
+) -> Any | None:
+    """GET a JSON document with a short timeout, None on any failure."""
+    session = async_get_clientsession(hass)
+    try:
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+        LOGGER.debug("openHAB probe of %s failed: %s", url, error)
+        return None
+
+
+async def async_probe_version(
+    hass: HomeAssistant, base_url: str, timeout: float = PROBE_TIMEOUT
+) -> str | None:
+    """Return the openHAB version at base_url, None if it does not answer."""
+    info = await _async_get_json(hass, f"{base_url.rstrip('/')}/rest/", timeout)
+    if not isinstance(info, dict) or "runtimeInfo" not in info:
+        return None
+    runtime_info = info["runtimeInfo"]
+    return f"{runtime_info.get('version', '')} {runtime_info.get('buildString', '')}".strip()
+
+
+async def async_validate_credentials(
+    hass: HomeAssistant, base_url: str, timeout: float = PROBE_TIMEOUT, **kwargs: Any
+) -> bool:
+    """Return True if the items endpoint accepts the given authentication."""
+    items = await _async_get_json(
+        hass,
+        f"{base_url.rstrip('/')}/rest/items?recursive=false&fields=name",
+        timeout,
+        **kwargs,
+    )
+    return items is not None
+
+
+async def async_probe_hosts(
+    hass: HomeAssistant, base_urls: Iterable[str]
+) -> dict[str, str]:
+    """Probe candidate base URLs concurrently, return the live ones with their version."""
+    base_urls = list(dict.fromkeys(base_urls))
+    versions = await asyncio.gather(
+        *(async_probe_version(hass, base_url) for base_url in base_urls)
+    )
+    return {
+        base_url: version
+        for base_url, version in zip(base_urls, versions)
+        if version is not None
+    }
+
+
+def base_url_from_host(host: str, port: int | None) -> str:
+    """Build an http base URL from a discovered host and port."""
+    if ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port or 8080}"
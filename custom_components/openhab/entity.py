@@ -6,12 +6,13 @@ from typing import Any, List
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from openhab import items
 
-from .const import ATTRIBUTION, DOMAIN, NAME, VERSION
+from .const import ATTRIBUTION, DOMAIN, METADATA_NAMESPACE_HA
 from .coordinator import OpenHABDataUpdateCoordinator
 from .icons_map import ICONS_MAP, ITEM_TYPE_MAP
-from .utils import sanitize_entity_id, strip_ip
+from .models import OpenHABItem
+from .rolling import ROLLING_ATTRIBUTES
+from .utils import UNDEFINED_STATES, sanitize_entity_id, strip_ip
 
 
 class OpenHABEntity(CoordinatorEntity):
@@ -20,12 +21,13 @@ class OpenHABEntity(CoordinatorEntity):
     coordinator: OpenHABDataUpdateCoordinator
     _attr_device_class_map: List | None
     _attr_has_entity_name = True
+    _unrecorded_attributes = ROLLING_ATTRIBUTES
 
     def __init__(
         self,
         hass: HomeAssistant,
         coordinator: OpenHABDataUpdateCoordinator,
-        item: items.Item,
+        item: OpenHABItem,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
@@ -40,11 +42,8 @@ class OpenHABEntity(CoordinatorEntity):
         self._base_url = self.coordinator.api._base_url
         self._host = strip_ip(self._base_url)
 
-        # Check if this item belongs to a group (device)
+        # The item's group is its device, see DeviceSync
         self._parent_group = self.coordinator.item_to_group.get(item.name)
-        self._group_info = None
-        if self._parent_group:
-            self._group_info = self.coordinator.groups.get(self._parent_group)
 
         # Set the unique_id attribute - let HA generate entity_id automatically
         sanitized_host = sanitize_entity_id(self._host)
@@ -54,10 +53,48 @@ class OpenHABEntity(CoordinatorEntity):
         if self.item.unit_of_measure:
             self._attr_native_unit_of_measurement = str(self.item.unit_of_measure)
 
+        # Typed value parsed from the raw state, refreshed once per state change
+        self._last_raw_state: str | None = None
+        self._parsed_state: Any = None
+        self._update_parsed_state()
+
+    def _parse_state(self, raw_state: str) -> Any:
+        """Parse a defined raw state into a typed value, override in platforms."""
+        return None
+
+    def _update_parsed_state(self) -> None:
+        """Re-parse the item state if the raw state changed."""
+        raw_state = self.item._raw_state if self.item else None
+        if raw_state == self._last_raw_state:
+            return
+        self._last_raw_state = raw_state
+        if raw_state is None or raw_state in UNDEFINED_STATES:
+            self._parsed_state = None
+            return
+        try:
+            self._parsed_state = self._parse_state(raw_state)
+        except (IndexError, ValueError):
+            self._parsed_state = None
+
+    async def async_send_command(self, command: str) -> None:
+        """Send a command to the item and track its acknowledgement."""
+        await self.coordinator.async_send_command(
+            self._id, command, self.platform.domain if self.platform else DOMAIN
+        )
+
+    def item_metadata(self, namespace: str) -> dict[str, Any] | None:
+        """Return a cached metadata namespace of the item, if configured and set."""
+        return self.coordinator.metadata.get(self._id, namespace)
+
+    def _ha_metadata_config(self, key: str) -> Any:
+        """Return an override from the item's `ha` metadata config."""
+        metadata = self.item_metadata(METADATA_NAMESPACE_HA)
+        return metadata.get("config", {}).get(key) if metadata else None
+
     @property
     def available(self):
         """Return True if entity is available."""
-        return self.coordinator.is_online
+        return self.coordinator.is_item_available(self._id)
 
     @property
     def name(self) -> str:
@@ -66,41 +103,14 @@ class OpenHABEntity(CoordinatorEntity):
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device info - use group as device if available."""
-        version = VERSION
-        oh_version = self.coordinator.version
-        if oh_version is not None:
-            version = oh_version
-
-        # If item belongs to a group, use that group as the device
-        if self._group_info:
-            group_name = self._group_info.get("name", "")
-            group_label = self._group_info.get("label", group_name)
-            tags = self._group_info.get("tags", [])
-            
-            # Determine device type from tags
-            device_model = "Thermostat" if "Equipment" in tags else "Device"
-            
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"{self._host}_{group_name}")},
-                name=group_label,
-                model=device_model,
-                manufacturer="openHAB",
-                via_device=(DOMAIN, self._host),
-            )
-
-        # Fallback to main openHAB device
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._host)},
-            name=f"{NAME} - {self._host}",
-            model=version,
-            manufacturer=NAME,
-            configuration_url=self._base_url,
-        )
+        """Return the cached device of the item's group, or the server device."""
+        return self.coordinator.devices.device_info(self._parent_group)
 
     @property
     def device_class(self):
         """Return the device class"""
+        if device_class := self._ha_metadata_config("device_class"):
+            return device_class
         name = self.item.name.lower()
         label = self.item.label.lower()
         device_classes = self._attr_device_class_map
@@ -115,6 +125,8 @@ class OpenHABEntity(CoordinatorEntity):
     @property
     def icon(self) -> str:
         """Return the icon of the switch."""
+        if icon := self._ha_metadata_config("icon"):
+            return icon
         category = self.item.category
         item_type = self.item.type_
         if category in ICONS_MAP:
@@ -156,16 +168,22 @@ class OpenHABEntity(CoordinatorEntity):
         if self.item.quantityType is not None:
             attributes["quantity_type"] = self.item.quantityType
 
+        if aggregate := self.coordinator.aggregator.describe(name):
+            attributes["aggregate"] = aggregate
+        if self.coordinator.rolling.active:
+            attributes.update(self.coordinator.rolling.attributes(name))
+
         return attributes
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self.item = self.coordinator.data.get(self._id)
+        self._update_parsed_state()
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
@@ -0,0 +1,78 @@
+"""Refresh governor for openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import time
+from typing import TYPE_CHECKING
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .coordinator import OpenHABDataUpdateCoordinator
+
+# Minimum time between two full item downloads triggered by requests
+MIN_FULL_REFRESH_SPACING = 2.0
+# Short delay before a per-item refresh so command bursts and state updates settle
+ITEM_REFRESH_DELAY = 0.5
+
+
+class RefreshGovernor:
+    """Single path for refresh requests of all entities of one coordinator.
+
+    Concurrent requests are merged into one pending cycle, full refreshes are
+    spaced by MIN_FULL_REFRESH_SPACING, and per-item requests only fetch the
+    requested items unless a full refresh is already pending.
+    """
+
+    def __init__(self, coordinator: OpenHABDataUpdateCoordinator) -> None:
+        """Initialize the governor."""
+        self._coordinator = coordinator
+        self._pending_full = False
+        self._pending_items: set[str] = set()
+        self._last_full_refresh = 0.0
+        self._task: asyncio.Task | None = None
+
+    def full_refresh_started(self) -> None:
+        """Record the start of a full refresh, scheduled or requested."""
+        self._last_full_refresh = time.monotonic()
+
+    def async_request(self, item_names: Iterable[str] | None = None) -> None:
+        """Queue a full refresh, or a refresh of only the given items."""
+        if item_names is None:
+            self._pending_full = True
+            self._pending_items.clear()
+        elif not self._pending_full:
+            self._pending_items.update(item_names)
+
+        if self._task is None or self._task.done():
+            self._task = self._coordinator.hass.async_create_background_task(
+                self._async_run(), f"{self._coordinator.name}_refresh_governor"
+            )
+
+    def async_cancel(self) -> None:
+        """Drop pending requests and cancel a waiting cycle."""
+        self._pending_full = False
+        self._pending_items.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        """Run merged cycles until no requests are pending."""
+        while self._pending_full or self._pending_items:
+            if self._pending_full:
+                delay = self._last_full_refresh + MIN_FULL_REFRESH_SPACING - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._pending_full = False
+                self._pending_items.clear()
+                await self._coordinator.async_refresh()
+                continue
+
+            await asyncio.sleep(ITEM_REFRESH_DELAY)
+            if self._pending_full:
+                continue
+            item_names, self._pending_items = self._pending_items, set()
+            LOGGER.debug("Refreshing %d items: %s", len(item_names), item_names)
+            await self._coordinator.async_refresh_items(item_names)
@@ -0,0 +1,167 @@
+"""Item import filters for openHAB."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import fnmatch
+import re
+from typing import Any
+
+from .const import (
+    CONF_EXCLUDE_GROUPS,
+    CONF_EXCLUDE_ITEMS,
+    CONF_EXCLUDE_TAGS,
+    CONF_INCLUDE_GROUPS,
+    CONF_INCLUDE_ITEMS,
+    CONF_INCLUDE_TAGS,
+    CONF_ITEM_TYPES,
+)
+
+
+def split_option(value: str | Iterable[str] | None) -> frozenset[str]:
+    """Split a comma separated option value into a set of stripped entries."""
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        value = value.split(",")
+    return frozenset(entry.strip() for entry in value if entry.strip())
+
+
+def compile_name_patterns(patterns: Iterable[str]) -> re.Pattern | None:
+    """Compile name globs and /regex/ entries into a single pattern."""
+    parts = []
+    for pattern in patterns:
+        if len(pattern) > 2 and pattern.startswith("/") and pattern.endswith("/"):
+            parts.append(f"(?:{pattern[1:-1]})\\Z")
+        else:
+            parts.append(fnmatch.translate(pattern))
+    if not parts:
+        return None
+    return re.compile("|".join(parts))
+
+
+class ItemFilter:
+    """Compiled include/exclude filter applied to raw items before they are stored.
+
+    Every include criterion that is set must match (any entry within it), and
+    matching any exclude criterion drops the item. Group membership is
+    transitive through nested groups.
+    """
+
+    def __init__(
+        self,
+        include_groups: frozenset[str] = frozenset(),
+        exclude_groups: frozenset[str] = frozenset(),
+        include_tags: frozenset[str] = frozenset(),
+        exclude_tags: frozenset[str] = frozenset(),
+        include_items: frozenset[str] = frozenset(),
+        exclude_items: frozenset[str] = frozenset(),
+        item_types: frozenset[str] = frozenset(),
+    ) -> None:
+        """Compile the filter."""
+        self.include_groups = include_groups
+        self.exclude_groups = exclude_groups
+        self.include_tags = include_tags
+        self.exclude_tags = exclude_tags
+        self.include_items = compile_name_patterns(sorted(include_items))
+        self.exclude_items = compile_name_patterns(sorted(exclude_items))
+        self.item_types = item_types
+        self.is_empty = not (
+            include_groups
+            or exclude_groups
+            or include_tags
+            or exclude_tags
+            or include_items
+            or exclude_items
+            or item_types
+        )
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> ItemFilter:
+        """Build the filter from config entry options."""
+        return cls(
+            include_groups=split_option(options.get(CONF_INCLUDE_GROUPS)),
+            exclude_groups=split_option(options.get(CONF_EXCLUDE_GROUPS)),
+            include_tags=split_option(options.get(CONF_INCLUDE_TAGS)),
+            exclude_tags=split_option(options.get(CONF_EXCLUDE_TAGS)),
+            include_items=split_option(options.get(CONF_INCLUDE_ITEMS)),
+            exclude_items=split_option(options.get(CONF_EXCLUDE_ITEMS)),
+            item_types=split_option(options.get(CONF_ITEM_TYPES)),
+        )
+
+    @property
+    def fetch_group(self) -> str | None:
+        """Return the group the fetch can be scoped to, if there is exactly one."""
+        if len(self.include_groups) == 1:
+            return next(iter(self.include_groups))
+        return None
+
+    def filter(
+        self,
+        raw_items: list[dict[str, Any]],
+        group_parents: Mapping[str, list[str]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the raw items that pass the filter.
+
+        `group_parents` adds the membership of groups missing from `raw_items`,
+        so nested groups resolve the same when only some items were fetched.
+        """
+        if self.is_empty:
+            return raw_items
+
+        parents = dict(group_parents or {})
+        parents.update(
+            (raw_item.get("name", ""), raw_item.get("groupNames", []))
+            for raw_item in raw_items
+        )
+        ancestors_cache: dict[str, frozenset[str]] = {}
+
+        def ancestors(item_name: str) -> frozenset[str]:
+            """Return all groups the item is a (nested) member of."""
+            if item_name in ancestors_cache:
+                return ancestors_cache[item_name]
+            ancestors_cache[item_name] = frozenset()  # guard against cycles
+            result = set()
+            for group_name in parents.get(item_name, []):
+                result.add(group_name)
+                result |= ancestors(group_name)
+            ancestors_cache[item_name] = frozenset(result)
+            return ancestors_cache[item_name]
+
+        return [
+            raw_item
+            for raw_item in raw_items
+            if self._matches(raw_item, ancestors if self._uses_groups else None)
+        ]
+
+    @property
+    def _uses_groups(self) -> bool:
+        """Return True if group membership has to be resolved."""
+        return bool(self.include_groups or self.exclude_groups)
+
+    def _matches(self, raw_item: dict[str, Any], ancestors) -> bool:
+        """Return True if a single raw item passes the filter."""
+        item_name = raw_item.get("name", "")
+        if self.item_types:
+            item_type = raw_item.get("type", "")
+            if (
+                item_type not in self.item_types
+                and item_type.split(":")[0] not in self.item_types
+            ):
+                return False
+        if self.include_items and not self.include_items.match(item_name):
+            return False
+        if self.exclude_items and self.exclude_items.match(item_name):
+            return False
+        if self.include_tags or self.exclude_tags:
+            tags = raw_item.get("tags", [])
+            if self.include_tags and self.include_tags.isdisjoint(tags):
+                return False
+            if self.exclude_tags and not self.exclude_tags.isdisjoint(tags):
+                return False
+        if ancestors is not None:
+            groups = ancestors(item_name)
+            if self.include_groups and self.include_groups.isdisjoint(groups):
+                return False
+            if self.exclude_groups and not self.exclude_groups.isdisjoint(groups):
+                return False
+        return True
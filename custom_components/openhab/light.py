@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, ITEMS_MAP, LIGHT
 from .entity import OpenHABEntity
-from .utils import hsv_to_str
+from .utils import hsv_to_str, str_to_hsv
 
 
 async def async_setup_entry(
@@ -42,10 +42,16 @@ class OpenHABLightColor(OpenHABEntity, LightEntity):
     _attr_color_mode = ColorMode.BRIGHTNESS
     _attr_supported_color_modes = {ColorMode.BRIGHTNESS, ColorMode.HS}
 
+    def _parse_state(self, raw_state: str) -> tuple[float, float, float]:
+        """Parse the "h,s,b" state once per state change."""
+        return str_to_hsv(raw_state)
+
     @property
     def is_on(self):
         """Return true if light is on."""
-        return self.item._state[2] > 0
+        if self._parsed_state is None:
+            return False
+        return self._parsed_state[2] > 0
 
     async def async_turn_on(self, **kwargs):
         """Instruct the light to turn on."""
@@ -53,25 +59,15 @@ class OpenHABLightColor(OpenHABEntity, LightEntity):
             return
         if ATTR_HS_COLOR in kwargs:
             return print(kwargs[ATTR_HS_COLOR])
-        hsv = self.item._state
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            data=hsv_to_str([hsv[0], hsv[1], 100]),
-        )
-        await self.coordinator.async_request_refresh()
+        hsv = self._parsed_state or (0, 0, 0)
+        await self.async_send_command(hsv_to_str([hsv[0], hsv[1], 100]))
 
     async def async_turn_off(self, **kwargs):
         """Instruct the light to turn off."""
         if not self.item:
             return
-        hsv = self.item._state
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self._id}",
-            data=hsv_to_str([hsv[0], hsv[1], 0]),
-        )
-        await self.coordinator.async_request_refresh()
+        hsv = self._parsed_state or (0, 0, 0)
+        await self.async_send_command(hsv_to_str([hsv[0], hsv[1], 0]))
 
     # @property
     # def color_mode(self) -> str | None:
@@ -79,10 +75,11 @@ class OpenHABLightColor(OpenHABEntity, LightEntity):
     #     return COLOR_MODE_HS
 
     @property
-    def hs_color(self) -> tuple[float, float]:
+    def hs_color(self) -> tuple[float, float] | None:
         """Return the hs color value."""
-        hsv = self.item._state
-        return [hsv[0], hsv[1]]
+        if self._parsed_state is None:
+            return None
+        return (self._parsed_state[0], self._parsed_state[1])
 
 
 class OpenHABLightDimmer(OpenHABEntity, LightEntity):
@@ -110,22 +107,12 @@ class OpenHABLightDimmer(OpenHABEntity, LightEntity):
             return
         if ATTR_BRIGHTNESS in kwargs:
             brightness = int(kwargs[ATTR_BRIGHTNESS] / 255) * 100
-            await self.hass.async_add_executor_job(
-                self.coordinator.api.openhab.req_post,
-                f"/items/{self._id}",
-                str(brightness),
-            )
-            return await self.coordinator.async_request_refresh()
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "ON"
-        )
-        await self.coordinator.async_request_refresh()
+            await self.async_send_command(str(brightness))
+            return
+        await self.async_send_command("ON")
 
     async def async_turn_off(self, **kwargs):
         """Instruct the light to turn off."""
         if not self.item:
             return
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post, f"/items/{self._id}", "OFF"
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("OFF")
@@ -39,15 +39,10 @@ async def async_setup_entry(
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    for item in coordinator.data.values():
-        # if item.type_ == ITEMS_MAP[MEDIA_PLAYER]:
-        if item.name == "Tv_MediaPlayer":
-            print(item.type_)
-
     async_add_entities(
         OpenHABPlayer(hass, coordinator, item)
         for item in coordinator.data.values()
-        if item.type_ == ITEMS_MAP[MEDIA_PLAYER]
+        if item.type_ in ITEMS_MAP[MEDIA_PLAYER]
     )
 
 
@@ -66,15 +61,6 @@ class OpenHABPlayer(OpenHABEntity, MediaPlayerEntity):
     #     super().__init__(hass, coordinator, item)
     #     self._state = STATE_OFF
 
-    async def async_update(self) -> None:
-        """Update openHAB Player entity."""
-        await self.coordinator.async_request_refresh()
-        # self._state = PLAYBACK_DICT[self.item._state]
-
-    @property
-    def should_poll(self) -> bool:
-        return True
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -94,32 +80,28 @@ class OpenHABPlayer(OpenHABEntity, MediaPlayerEntity):
 
     async def async_turn_on(self) -> None:
         """Turn on."""
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_item_refresh(self._id)
 
     async def async_turn_off(self) -> None:
         """Turn off."""
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_item_refresh(self._id)
 
     async def async_media_play(self) -> None:
         """Play."""
-        await self.hass.async_add_executor_job(self.item.play)
-        await self.coordinator.async_refresh()
+        await self.async_send_command("PLAY")
 
     async def async_media_pause(self) -> None:
         """Pause."""
-        await self.hass.async_add_executor_job(self.item.pause)
-        await self.coordinator.async_refresh()
+        await self.async_send_command("PAUSE")
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
-        await self.hass.async_add_executor_job(self.item.next)
-        await self.coordinator.async_refresh()
+        await self.async_send_command("NEXT")
 
     async def async_media_previous_track(self) -> None:
         """Send the previous track command."""
-        await self.hass.async_add_executor_job(self.item.previous)
-        await self.coordinator.async_refresh()
+        await self.async_send_command("PREVIOUS")
 
     async def async_set_volume_level(self, volume: str) -> None:
         """Set volume level, range 0..1."""
-        await self.coordinator.async_refresh()
\ No newline at end of file
+        await self.coordinator.async_request_item_refresh(self._id)
\ No newline at end of file
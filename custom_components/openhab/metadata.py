@@ -0,0 +1,74 @@
+"""On-demand item metadata cache."""
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .api import OpenHABApiClient
+
+# Cached namespaces are re-read at most this often (seconds) without WebSocket
+# ItemUpdatedEvents to invalidate them
+METADATA_REFRESH_INTERVAL = 3600
+
+
+class MetadataCache:
+    """Metadata of the configured namespaces for the imported items.
+
+    Loaded with one `fields=name,metadata` request when first needed and
+    re-read per item when openHAB reports the item as updated, so refresh
+    cycles never carry metadata.
+    """
+
+    def __init__(self, namespaces: Iterable[str]) -> None:
+        """Initialize the cache for the given namespaces."""
+        self.namespaces = tuple(namespaces)
+        self._metadata: dict[str, dict[str, dict[str, Any]]] = {}
+        self._loaded_at: float | None = None
+
+    def needs_load(self) -> bool:
+        """Return True if namespaces are configured and the cache is stale."""
+        return bool(self.namespaces) and (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= METADATA_REFRESH_INTERVAL
+        )
+
+    async def async_load(
+        self, api: OpenHABApiClient, item_names: Collection[str]
+    ) -> None:
+        """Load the namespaces of all imported items in one request."""
+        self._loaded_at = time.monotonic()
+        try:
+            raw_items = await api.async_get_items_metadata(self.namespaces)
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.warning("Could not fetch item metadata: %s", error)
+            return
+        self._metadata = {
+            raw_item["name"]: raw_item["metadata"]
+            for raw_item in raw_items
+            if raw_item.get("metadata") and raw_item.get("name") in item_names
+        }
+        LOGGER.debug("Loaded metadata of %d items", len(self._metadata))
+
+    async def async_reload_item(self, api: OpenHABApiClient, item_name: str) -> bool:
+        """Re-read one item's namespaces, return True if they changed."""
+        try:
+            raw_item = await api.async_get_item_metadata(item_name, self.namespaces)
+        except Exception as error:  # pylint: disable=broad-except
+            LOGGER.debug("Could not fetch metadata of %s: %s", item_name, error)
+            return False
+        metadata = raw_item.get("metadata") or {}
+        if metadata == self._metadata.get(item_name, {}):
+            return False
+        if metadata:
+            self._metadata[item_name] = metadata
+        else:
+            self._metadata.pop(item_name, None)
+        return True
+
+    def get(self, item_name: str, namespace: str) -> dict[str, Any] | None:
+        """Return `{"value": ..., "config": {...}}` of a namespace, if set."""
+        return self._metadata.get(item_name, {}).get(namespace)
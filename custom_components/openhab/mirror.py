@@ -0,0 +1,142 @@
+"""Mirror Home Assistant entity states into openHAB items."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import CONF_MIRROR, LOGGER
+from .item_filter import split_option
+
+if TYPE_CHECKING:
+    from .api import OpenHABApiClient
+
+# Wait this long (seconds) after a change so bursts coalesce into one update
+MIRROR_COALESCE_DELAY = 1.0
+# State updates sent concurrently per batch
+MIRROR_BATCH_SIZE = 20
+# Pending items beyond this drop their oldest queued update
+MIRROR_QUEUE_SIZE = 500
+
+HA_TO_OPENHAB_STATES = {
+    STATE_ON: "ON",
+    STATE_OFF: "OFF",
+    STATE_UNAVAILABLE: "UNDEF",
+    STATE_UNKNOWN: "UNDEF",
+}
+
+
+def parse_mirror(value: str | None) -> dict[str, str]:
+    """Parse `sensor.zigbee_temp=Zigbee_Temp, ...` into entity_id -> item name."""
+    mapping: dict[str, str] = {}
+    for entry in split_option(value):
+        entity_id, _, item_name = entry.partition("=")
+        entity_id, item_name = entity_id.strip(), item_name.strip()
+        if "." not in entity_id or not item_name:
+            LOGGER.warning("Ignoring invalid mirror entry: %s", entry)
+            continue
+        mapping[entity_id] = item_name
+    return mapping
+
+
+def openhab_state(state: State) -> str:
+    """Return the openHAB state string of a Home Assistant state."""
+    if state.state in HA_TO_OPENHAB_STATES:
+        return HA_TO_OPENHAB_STATES[state.state]
+    unit = state.attributes.get("unit_of_measurement")
+    return f"{state.state} {unit}" if unit else state.state
+
+
+class StateMirror:
+    """Push state changes of selected entities to openHAB items.
+
+    Changes are coalesced per item, so only the latest state of a burst is
+    sent, and sent as concurrent batches of MIRROR_BATCH_SIZE updates. When
+    more than MIRROR_QUEUE_SIZE items are pending, the oldest is dropped.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api: OpenHABApiClient, mapping: Mapping[str, str]
+    ) -> None:
+        """Initialize the mirror for entity_id -> item name pairs."""
+        self.hass = hass
+        self.api = api
+        self.mapping = dict(mapping)
+        self.dropped = 0
+        self._pending: OrderedDict[str, str] = OrderedDict()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_options(
+        cls, hass: HomeAssistant, api: OpenHABApiClient, options: Mapping[str, Any]
+    ) -> StateMirror | None:
+        """Build the mirror from config entry options, None if nothing is mirrored."""
+        mapping = parse_mirror(options.get(CONF_MIRROR))
+        return cls(hass, api, mapping) if mapping else None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Send the current states and follow changes, return the stop callback."""
+        for entity_id in self.mapping:
+            if (state := self.hass.states.get(entity_id)) is not None:
+                self._async_enqueue(entity_id, state)
+        unsubscribe = async_track_state_change_event(
+            self.hass, list(self.mapping), self._async_state_changed
+        )
+
+        @callback
+        def _async_stop() -> None:
+            unsubscribe()
+            self._pending.clear()
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+        return _async_stop
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Queue the new state of a mirrored entity."""
+        if (state := event.data.get("new_state")) is not None:
+            self._async_enqueue(event.data["entity_id"], state)
+
+    @callback
+    def _async_enqueue(self, entity_id: str, state: State) -> None:
+        """Replace the item's pending update, dropping the oldest when full."""
+        item_name = self.mapping[entity_id]
+        if item_name not in self._pending and len(self._pending) >= MIRROR_QUEUE_SIZE:
+            dropped, _ = self._pending.popitem(last=False)
+            self.dropped += 1
+            LOGGER.debug("Mirror queue full, dropped pending update of %s", dropped)
+        self._pending[item_name] = openhab_state(state)
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "openhab_state_mirror"
+            )
+
+    async def _async_run(self) -> None:
+        """Send pending updates in batches until the queue is empty."""
+        while self._pending:
+            await asyncio.sleep(MIRROR_COALESCE_DELAY)
+            while self._pending:
+                batch = [
+                    self._pending.popitem(last=False)
+                    for _ in range(min(MIRROR_BATCH_SIZE, len(self._pending)))
+                ]
+                results = await asyncio.gather(
+                    *(
+                        self.api.async_update_item(item_name, state)
+                        for item_name, state in batch
+                    ),
+                    return_exceptions=True,
+                )
+                for (item_name, _), result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        LOGGER.warning(
+                            "Could not mirror state to %s: %s", item_name, result
+                        )
@@ -0,0 +1,157 @@
+"""Typed item structs decoded from the openHAB REST API."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+from typing import Any
+
+from .utils import UNDEFINED_STATES, str_to_hsv, str_to_quantity
+
+_UNDEFINED = (None, *UNDEFINED_STATES)
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    json_loads = json.loads
+
+
+@dataclass(slots=True)
+class StateDescription:
+    """stateDescription of an item."""
+
+    minimum: float | None = None
+    maximum: float | None = None
+    step: float | None = None
+    pattern: str | None = None
+    read_only: bool = False
+    options: list[dict[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any] | None) -> StateDescription | None:
+        """Build from the raw stateDescription dict."""
+        if not raw:
+            return None
+        return cls(
+            minimum=raw.get("minimum"),
+            maximum=raw.get("maximum"),
+            step=raw.get("step"),
+            pattern=raw.get("pattern"),
+            read_only=raw.get("readOnly", False),
+            options=raw.get("options", []),
+        )
+
+
+def parse_state(item_type: str, raw_state: str | None) -> Any:
+    """Parse a raw state like python-openhab does for the item type."""
+    if raw_state is None or raw_state in UNDEFINED_STATES:
+        return None
+    base_type = item_type.split(":")[0]
+    try:
+        if base_type == "Number":
+            return str_to_quantity(raw_state)[0]
+        if base_type == "Dimmer":
+            return float(raw_state)
+        if base_type == "Rollershutter":
+            return int(float(raw_state))
+        if base_type == "Color":
+            return str_to_hsv(raw_state)
+        if base_type == "DateTime":
+            return datetime.fromisoformat(raw_state)
+    except (ValueError, IndexError):
+        return raw_state
+    return raw_state
+
+
+# Marks a stateDescription that was not converted yet, None is a valid result
+_NOT_CONVERTED = object()
+
+
+class OpenHABItem:
+    """Item state and metadata consumed by the coordinator and platforms.
+
+    Attribute names match python-openhab's Item so entities can use either.
+    Built straight from the raw REST dict, the stateDescription is only
+    converted when it is read.
+    """
+
+    __slots__ = (
+        "name",
+        "type_",
+        "label",
+        "category",
+        "tags",
+        "groupNames",
+        "editable",
+        "_raw_state",
+        "_state",
+        "unit_of_measure",
+        "quantityType",
+        "group",
+        "members",
+        "_raw_state_description",
+        "_state_description",
+    )
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        """Initialize from the raw REST dict of an item."""
+        item_type = raw.get("type", "")
+        self.group = item_type == "Group"
+        if self.group:
+            # Typed groups (Group:Switch) behave like their base item type
+            item_type = raw.get("groupType", item_type)
+        raw_state = raw.get("state")
+        unit = raw.get("unitSymbol", "")
+        if item_type.startswith("Number") and raw_state not in _UNDEFINED:
+            # Parse value and unit in one pass for the most common item type
+            state, state_unit = str_to_quantity(raw_state)
+            unit = unit or state_unit
+        else:
+            state = parse_state(item_type, raw_state)
+
+        self.name: str = raw["name"]
+        self.type_: str = item_type
+        self.label: str = raw.get("label", "")
+        self.category: str = raw.get("category", "")
+        self.tags: list[str] = raw.get("tags", [])
+        self.groupNames: list[str] = raw.get("groupNames", [])
+        self.editable: bool = raw.get("editable", False)
+        self._raw_state: str | None = raw_state
+        self._state: Any = state
+        self.unit_of_measure: str = unit
+        self.quantityType: str | None = (
+            item_type.split(":", 1)[1] if ":" in item_type else None
+        )
+        self.members: dict[str, OpenHABItem] = {}
+        self._raw_state_description = raw.get("stateDescription")
+        self._state_description: StateDescription | None | object = _NOT_CONVERTED
+
+    @classmethod
+    def from_raw(cls, raw: dict[str, Any]) -> OpenHABItem:
+        """Build an item from its raw REST dict."""
+        return cls(raw)
+
+    @property
+    def state_description(self) -> StateDescription | None:
+        """Return the typed stateDescription, converted on first access."""
+        if self._state_description is _NOT_CONVERTED:
+            self._state_description = StateDescription.from_raw(
+                self._raw_state_description
+            )
+        return self._state_description
+
+    def __repr__(self) -> str:
+        """Return a short representation."""
+        return f"<{self.type_} - {self.name} : {self._state}>"
+
+
+def decode_items(payload: bytes | str) -> list[dict[str, Any]]:
+    """Decode an /items response body with the fastest available JSON library."""
+    return json_loads(payload)
+
+
+def build_items(raw_items: list[dict[str, Any]]) -> dict[str, OpenHABItem]:
+    """Build typed items keyed by name from raw item dicts."""
+    return {raw_item["name"]: OpenHABItem(raw_item) for raw_item in raw_items}
@@ -7,8 +7,10 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .classify import is_number
 from .const import DOMAIN, LOGGER
 from .entity import OpenHABEntity
+from .utils import normalize_temperature_unit, str_to_quantity
 
 
 async def async_setup_entry(
@@ -19,40 +21,11 @@ async def async_setup_entry(
     """Set up number platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    
-    LOGGER.info("Number platform: coordinator.data has %d items, raw_items has %d items", 
-                len(coordinator.data) if coordinator.data else 0, 
-                len(coordinator.raw_items) if coordinator.raw_items else 0)
-    
-    for item in coordinator.data.values():
-        # Skip items with no type
-        if not item.type_:
-            continue
-            
-        # Only Number items that are NOT read-only
-        if item.type_.startswith("Number"):
-            raw_item = coordinator.raw_items.get(item.name, {})
-            state_desc = raw_item.get("stateDescription", {})
-            is_read_only = state_desc.get("readOnly", True)
-            has_min = state_desc.get("minimum") is not None
-            has_max = state_desc.get("maximum") is not None
-            
-            LOGGER.debug("Number check: %s - type=%s, readOnly=%s, hasMin=%s, hasMax=%s", 
-                        item.name, item.type_, is_read_only, has_min, has_max)
-            
-            # Skip read-only items (like current temperature readings)
-            if is_read_only:
-                continue
-            
-            # Must have min/max defined (indicates it's a setpoint)
-            if has_min and has_max:
-                LOGGER.info("Adding number entity: %s (min=%s, max=%s, step=%s)", 
-                           item.name, 
-                           state_desc.get("minimum"),
-                           state_desc.get("maximum"),
-                           state_desc.get("step", 0.5))
-                entities.append(OpenHABNumber(hass, coordinator, item, raw_item))
+    entities = [
+        OpenHABNumber(hass, coordinator, item, coordinator.raw_items.get(item.name, {}))
+        for item in coordinator.data.values()
+        if is_number(item, coordinator.raw_items.get(item.name, {}))
+    ]
 
     LOGGER.info("Setting up %d number entities", len(entities))
     async_add_entities(entities)
@@ -76,32 +49,28 @@ class OpenHABNumber(OpenHABEntity, NumberEntity):
         self._attr_native_max_value = float(state_desc.get("maximum", 35))
         self._attr_native_step = float(state_desc.get("step", 0.5))
 
+    def _parse_state(self, raw_state: str) -> tuple[float | None, str]:
+        """Parse the QuantityType state into a float and normalized unit."""
+        value, unit = str_to_quantity(raw_state)
+        if self.item.unit_of_measure:
+            unit = str(self.item.unit_of_measure)
+        return value, normalize_temperature_unit(unit) or UnitOfTemperature.CELSIUS
+
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        if self.item._state is None:
+        if self._parsed_state is None:
             return None
-        if isinstance(self.item._state, (int, float)):
-            return float(self.item._state)
-        return None
+        return self._parsed_state[0]
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement."""
-        if self.item.unit_of_measure:
-            uom = str(self.item.unit_of_measure)
-            if "°C" in uom or "celsius" in uom.lower():
-                return UnitOfTemperature.CELSIUS
-            if "°F" in uom or "fahrenheit" in uom.lower():
-                return UnitOfTemperature.FAHRENHEIT
-        return UnitOfTemperature.CELSIUS
+        if self._parsed_state is None:
+            return UnitOfTemperature.CELSIUS
+        return self._parsed_state[1]
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         LOGGER.debug("Setting %s to %s", self.item.name, value)
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self.item.name}",
-            str(value),
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command(str(value))
@@ -0,0 +1,156 @@
+"""Refresh cycle profiler for openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LOGGER
+
+TOP_ALLOCATIONS = 25
+TOP_FUNCTIONS = 40
+
+
+class RefreshProfiler:
+    """Run the next N coordinator refresh cycles under cProfile and tracemalloc.
+
+    One cProfile instance collects all cycles: it is enabled on the event loop
+    only while a cycle runs and handed to the worker thread for executor jobs,
+    which run one at a time while profiling. Python 3.12+ allows only one
+    active profiler per process. tracemalloc also only runs during cycles.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the profiler for one coordinator."""
+        self.hass = hass
+        self.name = name
+        self._cycles_left = 0
+        self._cycles = 0
+        self._profile: cProfile.Profile | None = None
+        self._running = False
+        self._job_lock = asyncio.Lock()
+        self._phases: dict[str, float] = {}
+        self._allocations: dict[tracemalloc.Traceback, list[int]] = {}
+        self._started_tracemalloc = False
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profiled cycle is running."""
+        return self._running
+
+    def arm(self, cycles: int) -> None:
+        """Profile the next `cycles` refresh cycles."""
+        if self._cycles_left:
+            LOGGER.warning("Refresh profiling already armed for %s", self.name)
+            return
+        self._cycles_left = self._cycles = max(int(cycles), 1)
+        LOGGER.info("Profiling the next %d refresh cycles of %s", self._cycles, self.name)
+
+    def cycle_started(self) -> None:
+        """Start collecting at the beginning of a refresh cycle."""
+        if not self._cycles_left or self._running:
+            return
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self._phases = {}
+            self._allocations = {}
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._running = True
+        self._profile.enable()
+
+    def cycle_finished(self) -> None:
+        """Pause collecting after a cycle, write the results after the last one."""
+        if not self._running or self._profile is None:
+            return
+        self._running = False
+        self._profile.disable()
+        for stat in tracemalloc.take_snapshot().statistics("traceback"):
+            totals = self._allocations.setdefault(stat.traceback, [0, 0])
+            totals[0] += stat.size
+            totals[1] += stat.count
+        if self._started_tracemalloc:
+            # Nothing outside the profiled cycles is traced
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._cycles_left -= 1
+        if self._cycles_left:
+            return
+        profile, self._profile = self._profile, None
+        allocations = sorted(
+            self._allocations.items(), key=lambda entry: entry[1][0], reverse=True
+        )[:TOP_ALLOCATIONS]
+        self._allocations = {}
+        self.hass.async_add_executor_job(
+            self._write_results, profile, dict(self._phases), allocations
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Accumulate wall time spent in a named phase of the cycle."""
+        if not self._running:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    async def async_run_job(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run an executor job, profiled in the worker thread during a cycle."""
+        if not self._running:
+            return await self.hass.async_add_executor_job(target, *args)
+        async with self._job_lock:
+            profile = self._profile
+            if not self._running or profile is None:
+                return await self.hass.async_add_executor_job(target, *args)
+            # Move the single profiler from the loop to the worker and back
+            profile.disable()
+            try:
+                return await self.hass.async_add_executor_job(
+                    profile.runcall, target, *args
+                )
+            finally:
+                if self._running and self._profile is profile:
+                    profile.enable()
+
+    def _write_results(
+        self,
+        profile: cProfile.Profile,
+        phases: dict[str, float],
+        allocations: list[tuple[tracemalloc.Traceback, list[int]]],
+    ) -> None:
+        """Write pstats and a text report with the top allocation sites."""
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        base = self.hass.config.path(f"{DOMAIN}_profile_{self.name}_{timestamp}")
+
+        stats = pstats.Stats(profile)
+        stats.dump_stats(f"{base}.prof")
+
+        report = io.StringIO()
+        report.write(f"openHAB refresh profile for {self.name}, {self._cycles} cycles\n\n")
+        report.write("Phase wall time (s):\n")
+        for name, seconds in phases.items():
+            report.write(f"  {name:<20} {seconds:.4f}\n")
+        report.write(f"\nTop {TOP_ALLOCATIONS} allocation sites:\n")
+        for traceback, (size, count) in allocations:
+            report.write(
+                f"  {traceback[0]}: size={size / 1024:.1f} KiB, count={count}\n"
+            )
+        report.write(f"\nTop {TOP_FUNCTIONS} functions by cumulative time:\n")
+        stats.stream = report
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+        with open(f"{base}.txt", "w", encoding="utf-8") as file:
+            file.write(report.getvalue())
+        LOGGER.info("Wrote refresh profile to %s.prof and %s.txt", base, base)
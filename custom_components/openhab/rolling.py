@@ -0,0 +1,187 @@
+"""Per-item ring buffers with rolling statistics."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+import fnmatch
+import re
+import time
+from typing import Any
+
+from .const import CONF_ROLLING_STATS, LOGGER
+from .item_filter import split_option
+from .models import OpenHABItem
+
+# Samples kept per item; older samples are overwritten
+ROLLING_BUFFER_SIZE = 512
+# Change with every write, so they are kept out of the recorder
+ROLLING_ATTRIBUTES = frozenset(
+    ("rolling_window", "rolling_min", "rolling_max", "rolling_mean", "rolling_rate")
+)
+
+
+def parse_rolling_windows(
+    value: str | None,
+) -> tuple[dict[str, float], list[tuple[re.Pattern, float]]]:
+    """Parse `Power_*=15, Number:Temperature=60` (minutes) into type and name rules."""
+    by_type: dict[str, float] = {}
+    by_name: list[tuple[re.Pattern, float]] = []
+    for entry in sorted(split_option(value)):
+        key, _, minutes = entry.partition("=")
+        key = key.strip()
+        try:
+            window = float(minutes) * 60
+        except ValueError:
+            window = 0
+        if window <= 0:
+            LOGGER.warning("Ignoring invalid rolling statistics entry: %s", entry)
+            continue
+        if key == "Number" or key.startswith("Number:"):
+            by_type[key] = window
+        else:
+            by_name.append((re.compile(fnmatch.translate(key)), window))
+    return by_type, by_name
+
+
+class RingBuffer:
+    """Fixed-size buffer of (monotonic time, value) samples in two flat arrays.
+
+    Samples are written in time order, so the buffer holds at most two sorted
+    runs, `[head:]` followed by `[:head]`. Window statistics bisect each run and
+    reduce array slices with the builtins instead of walking Python objects.
+    """
+
+    __slots__ = ("times", "values", "head", "full")
+
+    def __init__(self, size: int = ROLLING_BUFFER_SIZE) -> None:
+        """Allocate the buffer."""
+        self.times = array("d", bytes(8 * size))
+        self.values = array("d", bytes(8 * size))
+        self.head = 0
+        self.full = False
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        self.times[self.head] = timestamp
+        self.values[self.head] = value
+        self.head += 1
+        if self.head == len(self.times):
+            self.head = 0
+            self.full = True
+
+    def last(self) -> float | None:
+        """Return the newest value, None if the buffer is empty."""
+        if not self.full and self.head == 0:
+            return None
+        return self.values[self.head - 1]
+
+    def value_before(self, timestamp: float) -> float | None:
+        """Return the value of the newest kept sample before `timestamp`."""
+        runs = [(self.head, len(self.times))] if self.full else []
+        runs.append((0, self.head))
+        value = None
+        for start, end in runs:
+            index = bisect_left(self.times, timestamp, start, end)
+            if index > start:
+                value = self.values[index - 1]
+        return value
+
+    def window(self, since: float) -> tuple[array, array]:
+        """Return the times and values of the samples at or after `since`."""
+        runs = [(self.head, len(self.times))] if self.full else []
+        runs.append((0, self.head))
+        times, values = array("d"), array("d")
+        for start, end in runs:
+            first = bisect_left(self.times, since, start, end)
+            times.extend(self.times[first:end])
+            values.extend(self.values[first:end])
+        return times, values
+
+
+class RollingStats:
+    """Ring buffers of configured Number items and their rolling statistics.
+
+    Every received change is appended, including changes that the state filter
+    or aggregation hold back, while repeated polls of the same value are not.
+    A value holds until the next change, so the mean is weighted by time, and
+    statistics are only computed when an entity writes its attributes.
+    """
+
+    def __init__(self, windows: str | None = None) -> None:
+        """Compile the window rules."""
+        self._by_type, self._by_name = parse_rolling_windows(windows)
+        self.active = bool(self._by_type or self._by_name)
+        self._windows: dict[str, float | None] = {}
+        self._buffers: dict[str, RingBuffer] = {}
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> RollingStats:
+        """Build the statistics from config entry options."""
+        return cls(options.get(CONF_ROLLING_STATS))
+
+    def _window(self, item: OpenHABItem) -> float | None:
+        """Return the window length in seconds of an item, cached by name."""
+        if item.name not in self._windows:
+            window = None
+            if item.type_.startswith("Number"):
+                window = next(
+                    (rule for pattern, rule in self._by_name if pattern.match(item.name)),
+                    None,
+                )
+                if window is None:
+                    window = self._by_type.get(item.type_) or self._by_type.get(
+                        "Number"
+                    )
+            self._windows[item.name] = window
+        return self._windows[item.name]
+
+    def add(self, item: OpenHABItem) -> None:
+        """Append the item's numeric state to its buffer."""
+        if (
+            not self.active
+            or not isinstance(item._state, (int, float))
+            or self._window(item) is None
+        ):
+            return
+        value = float(item._state)
+        buffer = self._buffers.get(item.name)
+        if buffer is None:
+            buffer = self._buffers[item.name] = RingBuffer()
+        elif buffer.last() == value:
+            # Unchanged value from a poll or a repeated event
+            return
+        buffer.append(time.monotonic(), value)
+
+    def attributes(self, item_name: str) -> dict[str, Any]:
+        """Return min, max, mean and rate of change per minute over the window."""
+        buffer = self._buffers.get(item_name)
+        window = self._windows.get(item_name)
+        if buffer is None or window is None:
+            return {}
+        now = time.monotonic()
+        since = now - window
+        times, values = buffer.window(since)
+        # The value held when the window opened counts from its start
+        held = buffer.value_before(since)
+        starts = ([since] if held is not None else []) + list(times)
+        levels = ([held] if held is not None else []) + list(values)
+        if not levels:
+            return {}
+        ends = starts[1:] + [now]
+        duration = now - starts[0]
+        area = sum(
+            level * (end - start) for level, start, end in zip(levels, starts, ends)
+        )
+        mean = area / duration if duration > 0 else levels[-1]
+        attributes = {
+            "rolling_window": f"{window / 60:g} min",
+            "rolling_min": min(levels),
+            "rolling_max": max(levels),
+            "rolling_mean": round(mean, 6),
+        }
+        if len(values) > 1 and times[-1] > times[0]:
+            attributes["rolling_rate"] = round(
+                (values[-1] - values[0]) / (times[-1] - times[0]) * 60, 6
+            )
+        return attributes
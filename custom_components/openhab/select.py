@@ -6,6 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .classify import is_select
 from .const import DOMAIN, LOGGER
 from .entity import OpenHABEntity
 
@@ -18,24 +19,11 @@ async def async_setup_entry(
     """Set up select platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for item in coordinator.data.values():
-        # Only String items with commandOptions that are NOT read-only
-        if item.type_ == "String":
-            raw_item = coordinator.raw_items.get(item.name, {})
-            state_desc = raw_item.get("stateDescription", {})
-            cmd_desc = raw_item.get("commandDescription", {})
-            cmd_opts = cmd_desc.get("commandOptions", [])
-            
-            # Skip read-only items (those are for sensor platform)
-            if state_desc.get("readOnly", False):
-                continue
-            
-            # Must have command options to be a select
-            if cmd_opts:
-                LOGGER.info("Adding select entity: %s with %d options (readOnly=%s)", 
-                           item.name, len(cmd_opts), state_desc.get("readOnly"))
-                entities.append(OpenHABSelect(hass, coordinator, item, raw_item))
+    entities = [
+        OpenHABSelect(hass, coordinator, item, coordinator.raw_items.get(item.name, {}))
+        for item in coordinator.data.values()
+        if is_select(item, coordinator.raw_items.get(item.name, {}))
+    ]
 
     LOGGER.info("Setting up %d select entities", len(entities))
     async_add_entities(entities)
@@ -79,9 +67,4 @@ class OpenHABSelect(OpenHABEntity, SelectEntity):
         # Convert label back to command
         command = self._labels_map.get(option, option)
         LOGGER.debug("Setting %s to %s (command: %s)", self.item.name, option, command)
-        await self.hass.async_add_executor_job(
-            self.coordinator.api.openhab.req_post,
-            f"/items/{self.item.name}",
-            command,
-        )
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command(command)
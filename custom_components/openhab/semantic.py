@@ -0,0 +1,136 @@
+"""openHAB semantic model index."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+LOCATION = "Location"
+EQUIPMENT = "Equipment"
+POINT = "Point"
+ROLES = (LOCATION, EQUIPMENT, POINT)
+
+
+def semantic_role(raw_item: Mapping[str, Any]) -> str | None:
+    """Return Location, Equipment or Point from the semantics metadata or tags."""
+    semantics = raw_item.get("metadata", {}).get("semantics", {}).get("value")
+    if semantics:
+        role = semantics.split("_", 1)[0]
+        if role in ROLES:
+            return role
+    tags = raw_item.get("tags", [])
+    for role in ROLES:
+        if role in tags:
+            return role
+    return None
+
+
+class SemanticIndex:
+    """Group DAG of all items with precomputed ancestors and semantic roles.
+
+    Rebuilt only when the structure (membership or roles) changes, so room,
+    equipment and sibling point lookups are dict reads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.roles: dict[str, str] = {}  # Item name -> semantic role
+        self.labels: dict[str, str] = {}  # Group name -> label
+        self.parents: dict[str, tuple[str, ...]] = {}
+        self.ancestors: dict[str, tuple[str, ...]] = {}  # Nearest first
+        self.locations: dict[str, str] = {}  # Item name -> nearest Location
+        self.equipment: dict[str, str] = {}  # Item name -> nearest Equipment
+        self.points: dict[str, tuple[str, ...]] = {}  # Equipment -> its Points
+        self._structure: int | None = None
+
+    def update(self, raw_items: Iterable[Mapping[str, Any]]) -> bool:
+        """Rebuild from raw items if the structure changed, return True if it did."""
+        raw_items = list(raw_items)
+        structure = hash(
+            tuple(
+                (
+                    raw_item.get("name"),
+                    tuple(raw_item.get("groupNames", [])),
+                    semantic_role(raw_item),
+                )
+                for raw_item in raw_items
+            )
+        )
+        if structure == self._structure:
+            return False
+        self._structure = structure
+        self._build(raw_items)
+        return True
+
+    def _build(self, raw_items: list[Mapping[str, Any]]) -> None:
+        """Compute parents, ancestors, roles and the lookups derived from them."""
+        self.parents = {
+            raw_item["name"]: tuple(raw_item.get("groupNames", []))
+            for raw_item in raw_items
+            if raw_item.get("name")
+        }
+        self.roles = {}
+        self.labels = {}
+        for raw_item in raw_items:
+            name = raw_item.get("name")
+            if not name:
+                continue
+            if role := semantic_role(raw_item):
+                self.roles[name] = role
+            if raw_item.get("type") == "Group":
+                self.labels[name] = raw_item.get("label") or name
+
+        self.ancestors = {}
+        for name in self.parents:
+            self._ancestors(name, set())
+
+        self.locations = {}
+        self.equipment = {}
+        points: dict[str, list[str]] = {}
+        for name, ancestors in self.ancestors.items():
+            role = self.roles.get(name)
+            chain = (name, *ancestors) if role in (LOCATION, EQUIPMENT) else ancestors
+            location = next((a for a in chain if self.roles.get(a) == LOCATION), None)
+            if location is not None:
+                self.locations[name] = location
+            equipment = next((a for a in chain if self.roles.get(a) == EQUIPMENT), None)
+            if equipment is not None:
+                self.equipment[name] = equipment
+                if role == POINT:
+                    points.setdefault(equipment, []).append(name)
+        self.points = {name: tuple(members) for name, members in points.items()}
+
+    def _ancestors(self, name: str, visiting: set[str]) -> tuple[str, ...]:
+        """Return all ancestors of an item, nearest first, memoized and cycle-safe."""
+        if name in self.ancestors:
+            return self.ancestors[name]
+        visiting.add(name)
+        result: list[str] = []
+        seen: set[str] = set()
+        parents = self.parents.get(name, ())
+        # Breadth first: direct parents before their ancestors
+        for parent in parents:
+            if parent not in seen and parent not in visiting:
+                seen.add(parent)
+                result.append(parent)
+        for parent in parents:
+            if parent in visiting:
+                continue
+            for ancestor in self._ancestors(parent, visiting):
+                if ancestor not in seen and ancestor != name:
+                    seen.add(ancestor)
+                    result.append(ancestor)
+        visiting.discard(name)
+        self.ancestors[name] = tuple(result)
+        return self.ancestors[name]
+
+    def location_label(self, name: str) -> str | None:
+        """Return the label of the room or other location an item is in."""
+        location = self.locations.get(name)
+        return self.labels.get(location) if location else None
+
+    def sibling_points(self, name: str) -> tuple[str, ...]:
+        """Return the other Points of the item's equipment."""
+        equipment = self.equipment.get(name)
+        if equipment is None:
+            return ()
+        return tuple(point for point in self.points.get(equipment, ()) if point != name)
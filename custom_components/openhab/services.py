@@ -0,0 +1,204 @@
+"""Services for openHAB."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import time
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+import homeassistant.util.dt as dt_util
+import voluptuous as vol
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    ATTR_DURATION,
+    ATTR_END,
+    ATTR_ITEMS,
+    ATTR_MAX_CONCURRENCY,
+    ATTR_PERSISTENCE_SERVICE,
+    ATTR_REDACT,
+    ATTR_START,
+    DEFAULT_BACKFILL_CONCURRENCY,
+    DOMAIN,
+    LOGGER,
+    SERVICE_BACKFILL_STATISTICS,
+    SERVICE_COMMAND_LATENCY,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_RECORD_TRAFFIC,
+)
+from .coordinator import OpenHABDataUpdateCoordinator
+from .traffic import DEFAULT_RECORD_DURATION, TrafficRecorder
+
+SERVICES = [
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_BACKFILL_STATISTICS,
+    SERVICE_RECORD_TRAFFIC,
+    SERVICE_COMMAND_LATENCY,
+]
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+
+BACKFILL_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_PERSISTENCE_SERVICE): cv.string,
+        vol.Optional(
+            ATTR_MAX_CONCURRENCY, default=DEFAULT_BACKFILL_CONCURRENCY
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+
+RECORD_TRAFFIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_RECORD_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=10, max=3600)
+        ),
+        vol.Optional(ATTR_REDACT, default=True): cv.boolean,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    }
+)
+
+COMMAND_LATENCY_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): str})
+
+
+async def _async_record_traffic(
+    hass: HomeAssistant,
+    coordinator: OpenHABDataUpdateCoordinator,
+    recorder: TrafficRecorder,
+    duration: int,
+) -> None:
+    """Record for `duration` seconds, then write the recording."""
+    coordinator.api.start_recording(recorder)
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        coordinator.api.stop_recording()
+        count = await hass.async_add_executor_job(recorder.write)
+        LOGGER.info("Wrote %d openHAB traffic records to %s", count, recorder.path)
+        if recorder.dropped:
+            LOGGER.warning(
+                "Dropped %d traffic records over the size limit", recorder.dropped
+            )
+
+
+def _coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> Iterator[tuple[str, OpenHABDataUpdateCoordinator]]:
+    """Yield the coordinators targeted by a service call."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    for coordinator_entry_id, coordinator in hass.data[DOMAIN].items():
+        if entry_id and coordinator_entry_id != entry_id:
+            continue
+        yield coordinator_entry_id, coordinator
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        return
+
+    async def async_profile_refresh(call: ServiceCall) -> None:
+        """Profile the next refresh cycles of one or all openHAB instances."""
+        for _, coordinator in _coordinators(hass, call):
+            coordinator.profiler.arm(call.data[ATTR_CYCLES])
+            await coordinator.async_request_refresh()
+
+    async def async_backfill(call: ServiceCall) -> None:
+        """Start importing persistence history into long-term statistics."""
+        start = dt_util.as_utc(call.data[ATTR_START])
+        end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+        # Imported on demand, it pulls in the recorder
+        backfill = await async_import_module(hass, f"{__package__}.backfill")
+        for entry_id, coordinator in _coordinators(hass, call):
+            entry = hass.config_entries.async_get_entry(entry_id)
+            entry.async_create_background_task(
+                hass,
+                backfill.async_backfill_statistics(
+                    hass,
+                    coordinator,
+                    entry_id,
+                    call.data[ATTR_ITEMS],
+                    start,
+                    end,
+                    call.data.get(ATTR_PERSISTENCE_SERVICE),
+                    call.data[ATTR_MAX_CONCURRENCY],
+                ),
+                f"{DOMAIN}_backfill_{entry_id}",
+            )
+
+    async def async_record_traffic(call: ServiceCall) -> None:
+        """Record REST, WebSocket and command traffic for later replay."""
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        for entry_id, coordinator in _coordinators(hass, call):
+            if coordinator.api.recorder is not None:
+                LOGGER.warning("Traffic recording already running for %s", entry_id)
+                continue
+            recorder = TrafficRecorder(
+                hass.config.path(f"{DOMAIN}_traffic_{entry_id}_{timestamp}.jsonl.gz"),
+                call.data[ATTR_REDACT],
+            )
+            entry = hass.config_entries.async_get_entry(entry_id)
+            entry.async_create_background_task(
+                hass,
+                _async_record_traffic(
+                    hass, coordinator, recorder, call.data[ATTR_DURATION]
+                ),
+                f"{DOMAIN}_record_traffic_{entry_id}",
+            )
+
+    async def async_command_latency(call: ServiceCall) -> ServiceResponse:
+        """Return command-to-confirmation latencies per instance and platform."""
+        return {
+            entry_id: coordinator.commands.latency_stats()
+            for entry_id, coordinator in _coordinators(hass, call)
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_STATISTICS,
+        async_backfill,
+        schema=BACKFILL_STATISTICS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RECORD_TRAFFIC,
+        async_record_traffic,
+        schema=RECORD_TRAFFIC_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMMAND_LATENCY,
+        async_command_latency,
+        schema=COMMAND_LATENCY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services when the last entry is unloaded."""
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,74 @@
+"""Sitemap-scoped item selection for openHAB."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import time
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .api import OpenHABApiClient
+
+# How long a resolved widget tree is trusted before it is fetched and compared again
+SITEMAP_RESOLVE_INTERVAL = 600
+# Up to this many scoped items are polled one by one instead of downloading /items
+SITEMAP_ITEM_FETCH_LIMIT = 50
+
+
+def collect_item_names(sitemap: dict[str, Any]) -> set[str]:
+    """Return the names of all items referenced by a sitemap's widget tree."""
+    names: set[str] = set()
+    pending: list[dict[str, Any]] = [sitemap.get("homepage", sitemap)]
+    while pending:
+        node = pending.pop()
+        item = node.get("item")
+        if item and item.get("name"):
+            names.add(item["name"])
+        pending.extend(node.get("widgets", []))
+        linked_page = node.get("linkedPage")
+        if linked_page:
+            pending.extend(linked_page.get("widgets", []))
+    return names
+
+
+class SitemapScope:
+    """Cached set of items shown on the configured sitemaps."""
+
+    def __init__(self, sitemaps: Iterable[str]) -> None:
+        """Initialize the scope for the given sitemap names."""
+        self.sitemaps = sorted(sitemaps)
+        self._item_names: frozenset[str] | None = None
+        self._resolved_at = 0.0
+
+    async def async_item_names(
+        self, api: OpenHABApiClient
+    ) -> tuple[frozenset[str] | None, bool]:
+        """Return the scoped item names and whether they changed since last time.
+
+        The widget trees are only fetched again once SITEMAP_RESOLVE_INTERVAL
+        has passed, None is returned while no sitemap could be resolved.
+        """
+        if (
+            self._item_names is not None
+            and time.monotonic() - self._resolved_at < SITEMAP_RESOLVE_INTERVAL
+        ):
+            return self._item_names, False
+
+        names: set[str] = set()
+        for sitemap in self.sitemaps:
+            try:
+                names |= collect_item_names(await api.async_get_sitemap(sitemap))
+            except Exception as error:  # pylint: disable=broad-except
+                LOGGER.warning("Could not resolve sitemap %s: %s", sitemap, error)
+                return self._item_names, False
+
+        item_names = frozenset(names)
+        changed = item_names != self._item_names
+        if changed:
+            LOGGER.info(
+                "Sitemaps %s reference %d items", ", ".join(self.sitemaps), len(item_names)
+            )
+        self._item_names = item_names
+        self._resolved_at = time.monotonic()
+        return item_names, changed
@@ -0,0 +1,173 @@
+"""Significant-change filtering for numeric item states."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import fnmatch
+import re
+import time
+from typing import Any, NamedTuple
+
+from .classify import is_sensor
+from .const import (
+    CONF_DEADBAND,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_ROUND_TO_PRECISION,
+    LOGGER,
+)
+from .item_filter import split_option
+from .models import OpenHABItem
+
+PRECISION_PATTERN = re.compile(r"%\.(\d+)f")
+
+
+class Deadband(NamedTuple):
+    """Smallest change that is passed on, absolute or relative to the last value."""
+
+    value: float
+    relative: bool
+
+
+def parse_deadbands(
+    value: str | None,
+) -> tuple[dict[str, Deadband], list[tuple[re.Pattern, Deadband]]]:
+    """Parse `Number:Power=5, Outdoor_*=2%` into type and item name rules."""
+    by_type: dict[str, Deadband] = {}
+    by_name: list[tuple[re.Pattern, Deadband]] = []
+    for entry in sorted(split_option(value)):
+        key, _, threshold = entry.partition("=")
+        key, threshold = key.strip(), threshold.strip()
+        relative = threshold.endswith("%")
+        try:
+            deadband = Deadband(float(threshold.rstrip("%")), relative)
+        except ValueError:
+            LOGGER.warning("Ignoring invalid deadband entry: %s", entry)
+            continue
+        if key == "Number" or key.startswith("Number:"):
+            by_type[key] = deadband
+        else:
+            by_name.append((re.compile(fnmatch.translate(key)), deadband))
+    return by_type, by_name
+
+
+class StateFilter:
+    """Decide which numeric state changes are significant enough to dispatch.
+
+    A change is dropped if it stays within the item's deadband or rounds to the
+    same value at the stateDescription precision. A change arriving sooner than
+    the minimum write interval after the last dispatched one is held back, and
+    the latest held-back state is returned by `release` once the interval has
+    passed. Only sensor items are filtered, so setpoints and other writable
+    items always follow their commands. Item name rules take precedence over
+    item type rules, and `Number` matches every Number.
+    """
+
+    def __init__(
+        self,
+        deadbands: str | None = None,
+        round_to_precision: bool = False,
+        min_interval: float = 0,
+    ) -> None:
+        """Compile the filter."""
+        self._by_type, self._by_name = parse_deadbands(deadbands)
+        self.round_to_precision = round_to_precision
+        self.min_interval = min_interval
+        self.active = bool(
+            self._by_type or self._by_name or round_to_precision or min_interval
+        )
+        self._deadbands: dict[str, Deadband | None] = {}
+        self._precisions: dict[str, int | None] = {}
+        self._dispatched_at: dict[str, float] = {}
+        self._sensors: dict[str, bool] = {}
+        self._held: dict[str, tuple[float, OpenHABItem]] = {}  # Name -> (due, item)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> StateFilter:
+        """Build the filter from config entry options."""
+        return cls(
+            deadbands=options.get(CONF_DEADBAND),
+            round_to_precision=options.get(CONF_ROUND_TO_PRECISION, False),
+            min_interval=options.get(CONF_MIN_WRITE_INTERVAL, 0),
+        )
+
+    def _deadband(self, item: OpenHABItem) -> Deadband | None:
+        """Return the deadband rule of an item, cached by name."""
+        if item.name not in self._deadbands:
+            deadband = next(
+                (rule for pattern, rule in self._by_name if pattern.match(item.name)),
+                None,
+            )
+            if deadband is None:
+                deadband = self._by_type.get(item.type_) or self._by_type.get("Number")
+            self._deadbands[item.name] = deadband
+        return self._deadbands[item.name]
+
+    def _precision(self, item: OpenHABItem) -> int | None:
+        """Return the decimals of the item's state pattern, cached by name."""
+        if item.name not in self._precisions:
+            state_description = item.state_description
+            match = (
+                PRECISION_PATTERN.search(state_description.pattern or "")
+                if state_description
+                else None
+            )
+            self._precisions[item.name] = int(match.group(1)) if match else None
+        return self._precisions[item.name]
+
+    def accept(
+        self,
+        item: OpenHABItem,
+        previous: OpenHABItem | None,
+        raw_item: Mapping[str, Any],
+    ) -> bool:
+        """Return True if the item's new state should be dispatched."""
+        # A newer state replaces a held-back one, it is held again if needed
+        self._held.pop(item.name, None)
+        if item.name not in self._sensors:
+            self._sensors[item.name] = is_sensor(item, raw_item)
+        if (
+            previous is None
+            or not self._sensors[item.name]
+            or not item.type_.startswith("Number")
+            or not isinstance(item._state, (int, float))
+            or not isinstance(previous._state, (int, float))
+        ):
+            return True
+        new, old = float(item._state), float(previous._state)
+        if new == old:
+            return True
+
+        if self.round_to_precision:
+            precision = self._precision(item)
+            if precision is not None and round(new, precision) == round(
+                old, precision
+            ):
+                return False
+        deadband = self._deadband(item)
+        if deadband is not None:
+            threshold = deadband.value
+            if deadband.relative:
+                threshold *= abs(old) / 100
+            if abs(new - old) < threshold:
+                return False
+        if self.min_interval:
+            now = time.monotonic()
+            last = self._dispatched_at.get(item.name)
+            if last is not None and now - last < self.min_interval:
+                self._held[item.name] = (last + self.min_interval, item)
+                return False
+            self._dispatched_at[item.name] = now
+        return True
+
+    @property
+    def next_release(self) -> float | None:
+        """Return the monotonic time the next held-back state is due, if any."""
+        return min(due for due, _ in self._held.values()) if self._held else None
+
+    def release(self) -> list[OpenHABItem]:
+        """Return the held-back states that are due, counted as dispatched now."""
+        now = time.monotonic()
+        released = [item for due, item in self._held.values() if due <= now]
+        for item in released:
+            del self._held[item.name]
+            self._dispatched_at[item.name] = now
+        return released
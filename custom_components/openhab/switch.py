@@ -34,18 +34,15 @@ class OpenHABBinarySwitch(OpenHABEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: dict[str, Any]) -> None:
         """Turn on the switch."""
-        await self.hass.async_add_executor_job(self.item.on)
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("ON")
 
     async def async_turn_off(self, **kwargs: dict[str, Any]) -> None:
         """Turn off the switch."""
-        await self.hass.async_add_executor_job(self.item.off)
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("OFF")
 
     async def async_toggle(self, **kwargs: dict[str, Any]) -> None:
         """Turn off the switch."""
-        await self.hass.async_add_executor_job(self.item.toggle)
-        await self.coordinator.async_request_refresh()
+        await self.async_send_command("OFF" if self.is_on else "ON")
 
     @property
     def is_on(self) -> bool:
@@ -0,0 +1,198 @@
+"""Declarative templates for entities composed of several group members."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import re
+from typing import Any, NamedTuple
+
+from .models import OpenHABItem
+
+
+class MemberRole:
+    """One member of a composite entity, matched by type, access, tags and name.
+
+    `slots` lists `(key, name substrings)` in order of preference. A keyed role
+    collects one item per slot key; otherwise the item matching the earliest
+    slot wins. All substrings are compiled into one regex that is searched in
+    the lowercased item name; tags are the fallback when no substring matches.
+    """
+
+    __slots__ = (
+        "name",
+        "item_types",
+        "read_only",
+        "command_options",
+        "tags",
+        "keyed",
+        "required",
+        "_pattern",
+        "_slot_keys",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        item_types: tuple[str, ...],
+        slots: Iterable[tuple[str, Iterable[str]]] = (),
+        tags: Iterable[str] = (),
+        read_only: bool | None = None,
+        command_options: bool = False,
+        keyed: bool = False,
+        required: bool = True,
+    ) -> None:
+        """Compile the role's name patterns."""
+        self.name = name
+        self.item_types = item_types
+        self.read_only = read_only
+        self.command_options = command_options
+        self.tags = frozenset(tags)
+        self.keyed = keyed
+        self.required = required
+        self._slot_keys: list[str] = []
+        alternatives = []
+        for index, (key, substrings) in enumerate(slots):
+            self._slot_keys.append(key)
+            joined = "|".join(re.escape(substring) for substring in substrings)
+            alternatives.append(f"(?P<s{index}>{joined})")
+        self._pattern = re.compile("|".join(alternatives)) if alternatives else None
+
+    def match(
+        self, item: OpenHABItem, raw_item: Mapping[str, Any]
+    ) -> tuple[int, str] | None:
+        """Return (preference, slot key) if the item can fill this role."""
+        if not item.type_ or not item.type_.startswith(self.item_types):
+            return None
+        state_desc = raw_item.get("stateDescription", {})
+        if self.read_only is not None:
+            # String roles default to writable, Number roles need the flag
+            default = False if item.type_ == "String" else None
+            if state_desc.get("readOnly", default) != self.read_only:
+                return None
+        if self.command_options and not raw_item.get("commandDescription", {}).get(
+            "commandOptions"
+        ):
+            return None
+        if self._pattern is not None:
+            found = self._pattern.search(item.name.lower())
+            if found is not None:
+                index = int(found.lastgroup[1:])
+                return index, self._slot_keys[index]
+        if self.tags and self.tags <= set(item.tags):
+            return len(self._slot_keys), self.name
+        return None
+
+
+class CompositeTemplate(NamedTuple):
+    """Members of a composite entity; the first role anchors the template."""
+
+    name: str
+    roles: tuple[MemberRole, ...]
+
+    def is_anchor(self, item: OpenHABItem, raw_item: Mapping[str, Any]) -> bool:
+        """Return True if the item can anchor this template."""
+        return self.roles[0].match(item, raw_item) is not None
+
+
+class CompositeMatch(NamedTuple):
+    """Group that fills a template, with its item per role or per slot key."""
+
+    group_name: str
+    members: dict[str, Any]
+
+
+THERMOSTAT = CompositeTemplate(
+    "thermostat",
+    (
+        MemberRole(
+            "mode",
+            ("String",),
+            slots=[("mode", ["_mode"])],
+            read_only=False,
+            command_options=True,
+        ),
+        MemberRole(
+            "current_temperature",
+            ("Number",),
+            slots=[
+                ("room_temperature", ["room_temperature"]),
+                ("floor_temperature", ["floor_temperature"]),
+            ],
+            tags=["Measurement", "Temperature"],
+            read_only=True,
+        ),
+        MemberRole(
+            "setpoints",
+            ("Number",),
+            slots=[
+                ("manual_temperature", ["manual_temperature"]),
+                (
+                    "at_home_temperature",
+                    ["at_home_temperature", "athome_temperature", "home_temperature"],
+                ),
+                ("away_temperature", ["away_temperature"]),
+                ("vacation_temperature", ["vacation_temperature"]),
+                (
+                    "frost_protection_temperature",
+                    ["frost_protection_temperature", "frostprotection_temperature"],
+                ),
+            ],
+            read_only=False,
+            keyed=True,
+        ),
+    ),
+)
+
+
+def match_templates(
+    templates: Iterable[CompositeTemplate],
+    item_to_group: Mapping[str, str],
+    items: Mapping[str, OpenHABItem],
+    raw_items: Mapping[str, Mapping[str, Any]],
+) -> dict[str, list[CompositeMatch]]:
+    """Match templates against all groups in one pass over the items.
+
+    Returns the matches per template name, in group order of first member.
+    """
+    templates = list(templates)
+    # Template name -> group name -> role name -> (preference, item) or slot dict
+    found: dict[str, dict[str, dict[str, Any]]] = {
+        template.name: {} for template in templates
+    }
+    for item_name, group_name in item_to_group.items():
+        item = items.get(item_name)
+        if item is None:
+            continue
+        raw_item = raw_items.get(item_name, {})
+        for template in templates:
+            for role in template.roles:
+                result = role.match(item, raw_item)
+                if result is None:
+                    continue
+                preference, key = result
+                members = found[template.name].setdefault(group_name, {})
+                if role.keyed:
+                    members.setdefault(role.name, {})[key] = item
+                elif role.name not in members or preference < members[role.name][0]:
+                    members[role.name] = (preference, item)
+
+    matches: dict[str, list[CompositeMatch]] = {}
+    for template in templates:
+        matches[template.name] = []
+        for group_name, members in found[template.name].items():
+            if any(
+                role.required and role.name not in members for role in template.roles
+            ):
+                continue
+            matches[template.name].append(
+                CompositeMatch(
+                    group_name,
+                    {
+                        role.name: members[role.name]
+                        if role.keyed
+                        else members[role.name][1]
+                        for role in template.roles
+                        if role.name in members
+                    },
+                )
+            )
+    return matches
@@ -0,0 +1,61 @@
+"""Thing status index for per-item availability."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# Things and their channel links are re-read at most this often (seconds)
+THING_REFRESH_INTERVAL = 300
+THING_ONLINE = "ONLINE"
+
+
+class ThingIndex:
+    """Map items to the Thing behind their channel link and track Thing status."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.status: dict[str, str] = {}  # Thing UID -> status
+        self.item_to_thing: dict[str, str] = {}  # Item name -> Thing UID
+        self._updated_at: float | None = None
+
+    def needs_refresh(self) -> bool:
+        """Return True if the index is missing or older than the refresh interval."""
+        return (
+            self._updated_at is None
+            or time.monotonic() - self._updated_at >= THING_REFRESH_INTERVAL
+        )
+
+    def update(self, raw_things: list[dict[str, Any]]) -> None:
+        """Rebuild the index from a /rest/things response."""
+        status: dict[str, str] = {}
+        item_to_thing: dict[str, str] = {}
+        for raw_thing in raw_things:
+            thing_uid = raw_thing.get("UID")
+            if not thing_uid:
+                continue
+            status_info = raw_thing.get("statusInfo", {})
+            status[thing_uid] = status_info.get("status", THING_ONLINE)
+            for channel in raw_thing.get("channels", []):
+                for item_name in channel.get("linkedItems", []):
+                    item_to_thing.setdefault(item_name, thing_uid)
+        self.status = status
+        self.item_to_thing = item_to_thing
+        self._updated_at = time.monotonic()
+
+    def postpone(self) -> None:
+        """Wait a full interval before retrying after a failed fetch."""
+        self._updated_at = time.monotonic()
+
+    def set_status(self, thing_uid: str, status: str) -> bool:
+        """Apply a pushed status change, return True if it changed."""
+        if self.status.get(thing_uid) == status:
+            return False
+        self.status[thing_uid] = status
+        return True
+
+    def is_available(self, item_name: str) -> bool:
+        """Return False if the item's Thing is known and not ONLINE."""
+        thing_uid = self.item_to_thing.get(item_name)
+        if thing_uid is None:
+            return True
+        return self.status.get(thing_uid, THING_ONLINE) == THING_ONLINE
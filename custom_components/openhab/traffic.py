@@ -0,0 +1,182 @@
+"""Record openHAB traffic for deterministic replay."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import gzip
+import json
+import re
+import threading
+import time
+from typing import Any
+
+FORMAT_VERSION = 1
+DEFAULT_RECORD_DURATION = 300
+# Serialized records beyond this many bytes are dropped and counted instead
+MAX_RECORDING_BYTES = 64 * 1024 * 1024
+
+# Item/value types whose states can identify a home
+REDACTED_STATES = {"String": "", "Location": "0,0", "Point": "0,0"}
+# Keys dropped from Things, channels and any other non-item object
+REDACTED_KEYS = frozenset(("link", "configuration", "properties", "location"))
+# Enum, numeric, HSB and quantity commands; anything else is free text
+PLAIN_COMMAND = re.compile(r"[A-Z_]+|-?[\d.]+(,-?[\d.]+)*( \S+)?")
+
+
+def _redact_item(raw_item: dict[str, Any]) -> dict[str, Any]:
+    """Drop links and labels and blank free-text and location states."""
+    raw_item = {key: value for key, value in raw_item.items() if key != "link"}
+    if "label" in raw_item:
+        raw_item["label"] = raw_item.get("name", "")
+    item_type = raw_item.get("groupType") or raw_item.get("type") or ""
+    base_type = item_type.split(":")[0]
+    if base_type in REDACTED_STATES:
+        for key in ("state", "transformedState"):
+            if key in raw_item:
+                raw_item[key] = REDACTED_STATES[base_type]
+    if raw_item.get("members"):
+        raw_item["members"] = [
+            _redact_item(member) for member in raw_item["members"]
+        ]
+    return raw_item
+
+
+def redact_body(body: Any) -> Any:
+    """Redact items, Things and sitemap widgets anywhere in a REST response."""
+    if isinstance(body, list):
+        return [redact_body(value) for value in body]
+    if not isinstance(body, dict):
+        return body
+    if "name" in body and "type" in body:
+        return _redact_item(body)
+    redacted = {
+        key: redact_body(value)
+        for key, value in body.items()
+        if key not in REDACTED_KEYS
+    }
+    if "label" in redacted:
+        if "UID" in body:
+            # Things and channels
+            redacted["label"] = body["UID"]
+        elif "widgetId" in body:
+            # Widget labels embed the formatted item state
+            redacted["label"] = redacted.get("item", {}).get("name", "")
+            redacted.pop("state", None)
+    return redacted
+
+
+def redact_command(command: str) -> str:
+    """Blank free-text commands, keep enum, numeric and color commands."""
+    return command if PLAIN_COMMAND.fullmatch(command) else ""
+
+
+def redact_frame(data: str) -> str:
+    """Redact the value of a WebSocket state event."""
+    try:
+        event = json.loads(data)
+        payload = json.loads(event["payload"])
+    except (ValueError, KeyError, TypeError):
+        return data
+    if isinstance(payload, dict) and payload.get("type") in REDACTED_STATES:
+        payload["value"] = REDACTED_STATES[payload["type"]]
+        if "oldValue" in payload:
+            payload["oldValue"] = REDACTED_STATES[payload["type"]]
+        event["payload"] = json.dumps(payload)
+        return json.dumps(event)
+    return data
+
+
+class TrafficRecorder:
+    """Buffer REST responses, WebSocket frames and command timings.
+
+    Records are serialized when appended from the event loop and executor
+    threads, capped at MAX_RECORDING_BYTES, and written as gzipped JSON lines
+    by `write` once recording stops.
+    """
+
+    def __init__(self, path: str, redact: bool = True) -> None:
+        """Initialize a recorder writing to `path`."""
+        self.path = path
+        self.redact = redact
+        self.dropped = 0
+        self._start = time.monotonic()
+        self._started_at = time.time()
+        self._lines: list[str] = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Add a record stamped with the offset from the recording start."""
+        record["t"] = round(time.monotonic() - self._start, 4)
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            if self._size + len(line) > MAX_RECORDING_BYTES:
+                self.dropped += 1
+                return
+            self._size += len(line)
+            self._lines.append(line)
+
+    def rest(self, uri_path: str, body: Any, duration: float) -> None:
+        """Record a decoded REST GET response."""
+        if self.redact:
+            body = redact_body(body)
+        self._append(
+            {
+                "kind": "rest",
+                "uri": uri_path,
+                "duration": round(duration, 4),
+                "body": body,
+            }
+        )
+
+    def frame(self, data: str) -> None:
+        """Record a WebSocket text frame."""
+        if self.redact:
+            data = redact_frame(data)
+        self._append({"kind": "frame", "data": data})
+
+    def command(self, item_name: str, command: str, duration: float) -> None:
+        """Record a command and how long sending it took."""
+        if self.redact:
+            command = redact_command(command)
+        self._append(
+            {
+                "kind": "command",
+                "item": item_name,
+                "command": command,
+                "duration": round(duration, 4),
+            }
+        )
+
+    def write(self) -> int:
+        """Write the recording to disk, return the number of records."""
+        with self._lock:
+            lines = self._lines
+            self._lines = []
+            self._size = 0
+        header = {
+            "version": FORMAT_VERSION,
+            "started": self._started_at,
+            "redacted": self.redact,
+            "dropped": self.dropped,
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps(header) + "\n")
+            for line in lines:
+                file.write(line + "\n")
+        return len(lines)
+
+
+def read_recording(path: str) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Return the header and an iterator over the records of a recording."""
+    file = gzip.open(path, "rt", encoding="utf-8")
+    header = json.loads(file.readline())
+    if header.get("version") != FORMAT_VERSION:
+        file.close()
+        raise ValueError(f"Unsupported recording version {header.get('version')}")
+
+    def _records() -> Iterator[dict[str, Any]]:
+        with file:
+            for line in file:
+                yield json.loads(line)
+
+    return header, _records()
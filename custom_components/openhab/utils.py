@@ -1,4 +1,7 @@
 """Utils"""
+from __future__ import annotations
+
+UNDEFINED_STATES = ("NULL", "UNDEF")
 
 
 def strip_ip(url: str):
@@ -14,9 +17,36 @@ def sanitize_entity_id(text: str) -> str:
 def str_to_hsv(state: str) -> tuple[float, float, float]:
     """Convert state string to hsv tuple"""
     color = state.split(",")
-    return [float(color[0]), float(color[1]), float(color[2])]
+    return (float(color[0]), float(color[1]), float(color[2]))
 
 
 def hsv_to_str(hsv: tuple[float, float, float]) -> str:
     """Convert state string to hsv tuple"""
     return f"{round(hsv[0])},{round(hsv[1])},{round(hsv[2])}"
+
+
+def str_to_location(state: str) -> tuple[float, float]:
+    """Convert "lat,lon[,alt]" state string to a lat/lon tuple"""
+    location = state.split(",")
+    return (float(location[0]), float(location[1]))
+
+
+def str_to_quantity(state: str) -> tuple[float | None, str]:
+    """Split a QuantityType state string ("21.5 °C") into value and unit"""
+    value, _, unit = state.strip().partition(" ")
+    try:
+        return float(value), unit.strip()
+    except ValueError:
+        return None, unit.strip()
+
+
+def normalize_temperature_unit(unit: str | None) -> str | None:
+    """Return the HA temperature unit for an openHAB unit, None if not a temperature"""
+    if not unit:
+        return None
+    unit_lower = unit.lower()
+    if "°c" in unit_lower or "celsius" in unit_lower:
+        return "°C"
+    if "°f" in unit_lower or "fahrenheit" in unit_lower:
+        return "°F"
+    return None
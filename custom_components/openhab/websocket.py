@@ -0,0 +1,241 @@
+"""openHAB 4 WebSocket transport."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import json
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import CONF_AUTH_TYPE_BASIC, CONF_AUTH_TYPE_TOKEN, LOGGER
+from .traffic import TrafficRecorder
+
+WS_HEARTBEAT = 30
+# openHAB closes sessions idle for about 10 s, keep them alive with its PING
+WS_KEEPALIVE = 5
+WS_RECONNECT_MIN = 1
+WS_RECONNECT_MAX = 60
+WS_SOURCE = "homeassistant"
+SUBSCRIBED_EVENTS = [
+    "ItemStateChangedEvent",
+    "ItemUpdatedEvent",
+    "ThingStatusInfoChangedEvent",
+]
+
+# Command strings with a fixed openHAB command type
+COMMAND_TYPES = {
+    "ON": "OnOff",
+    "OFF": "OnOff",
+    "OPEN": "OpenClosed",
+    "CLOSED": "OpenClosed",
+    "UP": "UpDown",
+    "DOWN": "UpDown",
+    "STOP": "StopMove",
+    "MOVE": "StopMove",
+    "PLAY": "PlayPause",
+    "PAUSE": "PlayPause",
+    "NEXT": "NextPrevious",
+    "PREVIOUS": "NextPrevious",
+    "REWIND": "RewindFastforward",
+    "FASTFORWARD": "RewindFastforward",
+    "INCREASE": "IncreaseDecrease",
+    "DECREASE": "IncreaseDecrease",
+    "NULL": "UnDef",
+    "UNDEF": "UnDef",
+}
+
+# Item type -> command type for free-form values
+ITEM_VALUE_TYPES = {
+    "Color": "HSB",
+    "Dimmer": "Percent",
+    "Rollershutter": "Percent",
+    "DateTime": "DateTime",
+    "Location": "Point",
+    "String": "String",
+    "Player": "String",
+}
+
+
+def command_type(item_type: str | None, command: str) -> str:
+    """Return the openHAB type name the WebSocket needs for a command value."""
+    if command in COMMAND_TYPES:
+        return COMMAND_TYPES[command]
+    base_type = (item_type or "String").split(":")[0]
+    if base_type == "Color" and command.count(",") != 2:
+        return "Percent"
+    if base_type == "Number":
+        return "Quantity" if " " in command.strip() else "Decimal"
+    return ITEM_VALUE_TYPES.get(base_type, "String")
+
+
+class OpenHABWebSocket:
+    """Persistent /ws connection that streams item state changes and sends commands."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        base_url: str,
+        auth_type: str,
+        auth_token: str | None,
+        username: str | None,
+        password: str | None,
+    ) -> None:
+        """Initialize the WebSocket transport."""
+        self.hass = hass
+        self._url = f"{base_url.replace('http', 'ws', 1)}/ws"
+        self._kwargs: dict[str, Any] = {"heartbeat": WS_HEARTBEAT}
+        if auth_type == CONF_AUTH_TYPE_TOKEN and auth_token:
+            self._kwargs["params"] = {"accessToken": auth_token}
+        elif auth_type == CONF_AUTH_TYPE_BASIC and username:
+            self._kwargs["auth"] = aiohttp.BasicAuth(username, password or "")
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task | None = None
+        self.on_state: Callable[[str, str], None] | None = None
+        self.on_thing_status: Callable[[str, str], None] | None = None
+        self.on_item_updated: Callable[[str], None] | None = None
+        self.recorder: TrafficRecorder | None = None
+        self.on_connection: Callable[[bool], None] | None = None
+        self.type_lookup: Callable[[str], str | None] = lambda item_name: None
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the socket is open."""
+        return self._ws is not None and not self._ws.closed
+
+    def start(self) -> None:
+        """Start the connection loop in the background."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), "openhab_websocket"
+            )
+
+    async def async_stop(self) -> None:
+        """Close the socket and stop reconnecting."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def async_send_command(self, item_name: str, command: str) -> None:
+        """Send an ItemCommandEvent over the open socket."""
+        if not self.connected:
+            raise ConnectionError("openHAB WebSocket is not connected")
+        payload = {
+            "type": command_type(self.type_lookup(item_name), command),
+            "value": command,
+        }
+        await self._ws.send_json(
+            {
+                "type": "ItemCommandEvent",
+                "topic": f"openhab/items/{item_name}/command",
+                "payload": json.dumps(payload),
+                "source": WS_SOURCE,
+            }
+        )
+
+    async def _async_run(self) -> None:
+        """Connect, listen and reconnect with backoff."""
+        session = async_get_clientsession(self.hass)
+        backoff = WS_RECONNECT_MIN
+        while True:
+            try:
+                async with session.ws_connect(self._url, **self._kwargs) as ws:
+                    self._ws = ws
+                    backoff = WS_RECONNECT_MIN
+                    await ws.send_json(
+                        {
+                            "type": "WebSocketEvent",
+                            "topic": "openhab/websocket/filter/type",
+                            "payload": json.dumps(SUBSCRIBED_EVENTS),
+                            "source": WS_SOURCE,
+                        }
+                    )
+                    LOGGER.info("Connected to openHAB WebSocket %s", self._url)
+                    self._notify_connection(True)
+                    keepalive = asyncio.create_task(self._async_keepalive(ws))
+                    try:
+                        await self._async_receive(ws)
+                    finally:
+                        keepalive.cancel()
+            except asyncio.CancelledError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                LOGGER.warning("openHAB WebSocket error: %s", error)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Unexpected openHAB WebSocket error, reconnecting")
+            self._ws = None
+            self._notify_connection(False)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, WS_RECONNECT_MAX)
+
+    async def _async_receive(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Handle text frames until the socket closes or fails."""
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                if self.recorder is not None:
+                    self.recorder.frame(message.data)
+                try:
+                    self._handle_message(message.data)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception(
+                        "Error handling openHAB WebSocket event: %s", message.data
+                    )
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                break
+
+    async def _async_keepalive(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Send the openHAB heartbeat so the server keeps a quiet session open."""
+        while not ws.closed:
+            await asyncio.sleep(WS_KEEPALIVE)
+            try:
+                await ws.send_json(
+                    {
+                        "type": "WebSocketEvent",
+                        "topic": "openhab/websocket/heartbeat",
+                        "payload": "PING",
+                        "source": WS_SOURCE,
+                    }
+                )
+            except (ConnectionError, aiohttp.ClientError):
+                # The receive loop notices the closed socket and reconnects
+                return
+
+    def _notify_connection(self, connected: bool) -> None:
+        """Tell the owner that the socket went up or down."""
+        if self.on_connection is not None:
+            self.on_connection(connected)
+
+    def _handle_message(self, data: str) -> None:
+        """Dispatch item state, item definition and Thing status changes."""
+        try:
+            event = json.loads(data)
+            event_type = event.get("type")
+            if event_type == "ItemStateChangedEvent":
+                item_name = event["topic"].split("/")[2]
+                state = json.loads(event["payload"])["value"]
+            elif event_type == "ThingStatusInfoChangedEvent":
+                thing_uid = event["topic"].split("/")[2]
+                # Payload is [new status info, old status info]
+                status = json.loads(event["payload"])[0]["status"]
+            elif event_type == "ItemUpdatedEvent":
+                item_name = event["topic"].split("/")[2]
+            else:
+                return
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+            LOGGER.debug("Ignoring unexpected WebSocket message: %s", data)
+            return
+
+        # Callback errors are bugs, not malformed messages: let them propagate
+        if event_type == "ItemStateChangedEvent":
+            if self.on_state is not None:
+                self.on_state(item_name, state)
+        elif event_type == "ThingStatusInfoChangedEvent":
+            if self.on_thing_status is not None:
+                self.on_thing_status(thing_uid, status)
+        elif self.on_item_updated is not None:
+            self.on_item_updated(item_name)
@@ -0,0 +1,111 @@
+"""Benchmark /items decoding: stdlib json + python-openhab vs fast JSON + typed structs.
+
+Usage: python scripts/benchmark_item_decoding.py [item_count ...]
+"""
+from __future__ import annotations
+
+import gc
+import importlib
+import json
+from pathlib import Path
+import random
+import sys
+import time
+import types
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "openhab"
+ITEM_TYPES = [
+    ("Switch", lambda: random.choice(["ON", "OFF"])),
+    ("Contact", lambda: random.choice(["OPEN", "CLOSED"])),
+    ("Dimmer", lambda: str(random.randint(0, 100))),
+    ("Color", lambda: f"{random.randint(0, 360)},{random.randint(0, 100)},{random.randint(0, 100)}"),
+    ("Number:Temperature", lambda: f"{random.uniform(5, 30):.1f} °C"),
+    ("Number:Power", lambda: f"{random.uniform(0, 3000):.1f} W"),
+    ("String", lambda: random.choice(["MANUAL", "SCHEDULE", "AWAY"])),
+    ("Rollershutter", lambda: str(random.randint(0, 100))),
+]
+
+
+def load_models():
+    """Import models.py without importing Home Assistant."""
+    package = types.ModuleType("openhab_component")
+    package.__path__ = [str(COMPONENT_DIR)]
+    sys.modules["openhab_component"] = package
+    return importlib.import_module("openhab_component.models")
+
+
+def synthetic_payload(count: int) -> bytes:
+    """Return an /items?recursive=false response body with `count` items."""
+    random.seed(count)
+    items = []
+    for index in range(count):
+        item_type, state = ITEM_TYPES[index % len(ITEM_TYPES)]
+        items.append(
+            {
+                "link": f"http://openhab:8080/rest/items/Item_{index}",
+                "state": state(),
+                "stateDescription": {
+                    "minimum": 5,
+                    "maximum": 35,
+                    "step": 0.5,
+                    "pattern": "%.1f %unit%",
+                    "readOnly": index % 3 == 0,
+                    "options": [],
+                },
+                "editable": False,
+                "type": item_type,
+                "name": f"Item_{index}",
+                "label": f"Item {index}",
+                "category": "temperature",
+                "tags": ["Point"],
+                "groupNames": [f"gGroup_{index // 20}"],
+            }
+        )
+    return json.dumps(items).encode()
+
+
+def best_of(func, payload: bytes, rounds: int = 3) -> float:
+    """Return the best wall time of `rounds` runs."""
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark for each requested item count."""
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000]
+    models = load_models()
+    try:
+        from openhab import OpenHAB  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        sys.exit(
+            "python-openhab is required for the baseline: pip install python-openhab"
+        )
+    client = OpenHAB("http://localhost:8080/rest")
+
+    def baseline(payload: bytes) -> None:
+        raw_items = json.loads(payload)
+        {raw["name"]: client.json_to_item(raw) for raw in raw_items}
+
+    def fast(payload: bytes) -> None:
+        models.build_items(models.decode_items(payload))
+
+    baseline_name = "json + python-openhab"
+    print(f"decoder: {models.json_loads.__module__}")
+    print(f"{'items':>8} {baseline_name:>24} {'fast + structs':>16} {'speedup':>8}")
+    for count in counts:
+        payload = synthetic_payload(count)
+        baseline_time = best_of(baseline, payload)
+        fast_time = best_of(fast, payload)
+        print(
+            f"{count:>8} {baseline_time * 1000:>21.1f} ms {fast_time * 1000:>13.1f} ms "
+            f"{baseline_time / fast_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Benchmark composite-entity template matching against the per-group scan it replaced.
+
+Builds synthetic thermostat groups plus unrelated items and times the old
+climate setup loop (every group scans all items) and `match_templates` (one
+pass). Exits with status 1 if template matching time per item grows more than
+3x from the smallest to the largest size, i.e. setup is no longer linear.
+
+Usage: python scripts/benchmark_templates.py [group_count ...]
+"""
+from __future__ import annotations
+
+import gc
+import importlib
+from pathlib import Path
+import sys
+import time
+import types
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "openhab"
+# Items per group that are not thermostat members
+FILLER_ITEMS = 6
+MAX_GROWTH = 3.0
+LEGACY_MAX_GROUPS = 1_000
+
+
+def load_component():
+    """Import models.py and templates.py without importing Home Assistant."""
+    package = types.ModuleType("openhab_component")
+    package.__path__ = [str(COMPONENT_DIR)]
+    sys.modules["openhab_component"] = package
+    return (
+        importlib.import_module("openhab_component.models"),
+        importlib.import_module("openhab_component.templates"),
+    )
+
+
+def synthetic_items(groups: int) -> list[dict]:
+    """Return raw items: every other group is a thermostat, all have filler items."""
+    raw_items = []
+
+    def add(name, item_type, group, read_only, state="0", options=None):
+        raw = {
+            "name": name,
+            "type": item_type,
+            "state": state,
+            "groupNames": [group],
+            "tags": [],
+            "stateDescription": {"readOnly": read_only},
+        }
+        if options:
+            raw["commandDescription"] = {"commandOptions": options}
+        raw_items.append(raw)
+
+    for index in range(groups):
+        group = f"gRoom_{index}"
+        if index % 2 == 0:
+            options = [{"command": "MANUAL"}, {"command": "SCHEDULE"}]
+            add(f"Room{index}_Mode", "String", group, False, "MANUAL", options)
+            add(f"Room{index}_Room_temperature", "Number:Temperature", group, True)
+            add(f"Room{index}_Floor_temperature", "Number:Temperature", group, True)
+            add(f"Room{index}_Manual_temperature", "Number:Temperature", group, False)
+            add(f"Room{index}_Away_temperature", "Number:Temperature", group, False)
+        for filler in range(FILLER_ITEMS):
+            add(f"Room{index}_Sensor_{filler}", "Number:Power", group, True)
+    return raw_items
+
+
+def legacy_match(groups, item_to_group, items, raw_items) -> int:
+    """The removed climate setup loop: every group scans all item mappings."""
+    count = 0
+    for group_name in groups:
+        group_items = {
+            name: items[name]
+            for name, parent in item_to_group.items()
+            if parent == group_name and name in items
+        }
+        mode = current = setpoint = False
+        for item_name, item in group_items.items():
+            name_lower = item_name.lower()
+            state_desc = raw_items[item_name].get("stateDescription", {})
+            if item.type_ == "String" and "_mode" in name_lower:
+                mode = True
+            if item.type_.startswith("Number") and state_desc.get("readOnly", False):
+                current = current or "room_temperature" in name_lower
+            if item.type_.startswith("Number") and not state_desc.get("readOnly", True):
+                setpoint = setpoint or "_temperature" in name_lower
+        count += mode and current and setpoint
+    return count
+
+
+def best_of(func, rounds: int = 3) -> float:
+    """Return the best wall time of `rounds` runs."""
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    """Run both matchers for each group count and check linear scaling."""
+    counts = [int(arg) for arg in sys.argv[1:]] or [100, 1_000, 5_000]
+    models, templates = load_component()
+    print(
+        f"{'groups':>7} {'items':>7} {'legacy ms':>10} {'templates ms':>13} "
+        f"{'us/item':>8}"
+    )
+    per_item = []
+    for groups in counts:
+        raw_list = synthetic_items(groups)
+        raw_items = {raw["name"]: raw for raw in raw_list}
+        items = models.build_items(raw_list)
+        item_to_group = {raw["name"]: raw["groupNames"][0] for raw in raw_list}
+        group_names = sorted(set(item_to_group.values()))
+
+        matches = templates.match_templates(
+            [templates.THERMOSTAT], item_to_group, items, raw_items
+        )[templates.THERMOSTAT.name]
+        expected = (groups + 1) // 2
+        if len(matches) != expected:
+            print(f"Mismatch: {len(matches)} template matches, expected {expected}")
+            return 1
+
+        legacy = f"{'skipped':>10}"
+        # The legacy loop is quadratic, only time it at small sizes
+        if groups <= LEGACY_MAX_GROUPS:
+            if legacy_match(group_names, item_to_group, items, raw_items) != expected:
+                print("Mismatch between legacy and template matching")
+                return 1
+            legacy_time = best_of(
+                lambda: legacy_match(group_names, item_to_group, items, raw_items)
+            )
+            legacy = f"{legacy_time * 1000:>10.1f}"
+        template_time = best_of(
+            lambda: templates.match_templates(
+                [templates.THERMOSTAT], item_to_group, items, raw_items
+            )
+        )
+        per_item.append(template_time / len(raw_list))
+        print(
+            f"{groups:>7} {len(raw_list):>7} {legacy} "
+            f"{template_time * 1000:>13.1f} {per_item[-1] * 1e6:>8.2f}"
+        )
+
+    growth = per_item[-1] / per_item[0]
+    print(f"Per-item time growth: {growth:.2f}x (limit {MAX_GROWTH}x)")
+    return 1 if growth > MAX_GROWTH else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Check the import time of the integration against a budget.
+
+Imports the Home Assistant modules every integration needs first, then the
+integration package under `python -X importtime`, and reports the modules that
+the integration pulled in with their self time. Exits with status 1 when the
+best integration import time over --rounds runs exceeds --budget-ms.
+
+Usage: python scripts/import_budget.py [--budget-ms 150] [--top 15] [--rounds 5]
+
+Needs Home Assistant and the integration requirements installed.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+# Loaded by Home Assistant before any integration is imported
+PRELOAD = (
+    "homeassistant.config_entries",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.entity_platform",
+)
+PACKAGE = "custom_components.openhab"
+MARKER = "-- integration import --"
+
+
+def measure() -> list[tuple[str, int, int]]:
+    """Return (module, self us, cumulative us) for modules the package imported."""
+    code = (
+        f"import sys\nimport {', '.join(PRELOAD)}\n"
+        f"sys.stderr.write({MARKER!r} + '\\n')\nimport {PACKAGE}"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = result.stderr.splitlines()
+    rows = []
+    for line in lines[lines.index(MARKER) + 1 :]:
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.split(":", 1)[1].split("|")
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    """Measure the import a few times and check the best run against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    best: list[tuple[str, int, int]] | None = None
+    best_total = float("inf")
+    for _ in range(args.rounds):
+        rows = measure()
+        total = sum(self_us for _, self_us, _ in rows)
+        if total < best_total:
+            best, best_total = rows, total
+
+    print(f"{PACKAGE} import: {best_total / 1000:.1f} ms for {len(best)} modules")
+    print(f"Top {args.top} modules by self time:")
+    for module, self_us, _ in sorted(best, key=lambda row: -row[1])[: args.top]:
+        print(f"  {self_us / 1000:>7.1f} ms  {module}")
+
+    if best_total / 1000 > args.budget_ms:
+        print(f"Over the import budget of {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"Within the import budget of {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Command throughput load test against a local fake openHAB.
+
+Starts a fake openHAB REST server with a configurable response latency, sets up
+the real coordinator and platform entities against it and calls the entity
+command methods (switch on/off, cover position, number value) at rising
+concurrency levels. Reports throughput, p50/p99 command latency, executor
+queue depth and how many REST refreshes each command triggered.
+
+Usage: python scripts/load_test_commands.py [--latency-ms 20] [--items 300]
+       [--commands 500] [--concurrency 1 4 16 64] [--executor-workers 8]
+
+Needs Home Assistant and the integration requirements installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR.parent))
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+# pylint: disable=wrong-import-position
+from aiohttp import web  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+
+from custom_components.openhab.api import OpenHABApiClient  # noqa: E402
+from custom_components.openhab.const import CONF_AUTH_TYPE_TOKEN  # noqa: E402
+from custom_components.openhab.coordinator import (  # noqa: E402
+    OpenHABDataUpdateCoordinator,
+)
+from custom_components.openhab.cover import OpenHABCover  # noqa: E402
+from custom_components.openhab.governor import ITEM_REFRESH_DELAY  # noqa: E402
+from custom_components.openhab.number import OpenHABNumber  # noqa: E402
+from custom_components.openhab.switch import OpenHABBinarySwitch  # noqa: E402
+from replay_traffic import async_setup_platforms  # noqa: E402
+
+SAMPLE_INTERVAL = 0.01
+
+
+def synthetic_items(count: int) -> dict[str, dict]:
+    """Return switches, rollershutters and setpoints in equal parts."""
+    items = {}
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            raw = {"name": f"Switch_{index}", "type": "Switch", "state": "OFF"}
+        elif kind == 1:
+            raw = {"name": f"Shutter_{index}", "type": "Rollershutter", "state": "0"}
+        else:
+            raw = {
+                "name": f"Setpoint_{index}",
+                "type": "Number:Temperature",
+                "state": "20.0 °C",
+                "stateDescription": {
+                    "minimum": 5,
+                    "maximum": 35,
+                    "step": 0.5,
+                    "readOnly": False,
+                },
+            }
+        raw.update(
+            label=raw["name"].replace("_", " "), tags=[], groupNames=[], editable=False
+        )
+        items[raw["name"]] = raw
+    return items
+
+
+class FakeOpenHAB:
+    """Minimal openHAB REST server answering after a fixed latency."""
+
+    def __init__(self, item_count: int, latency: float) -> None:
+        """Create the server state."""
+        self.items = synthetic_items(item_count)
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.app = web.Application()
+        self.app.router.add_get("/rest/", self._root)
+        self.app.router.add_get("/rest/items", self._items)
+        self.app.router.add_get("/rest/items/{name}", self._item)
+        self.app.router.add_post("/rest/items/{name}", self._command)
+        self.app.router.add_get("/rest/things", self._things)
+        self._runner = web.AppRunner(self.app)
+
+    async def async_start(self) -> str:
+        """Start listening on a free local port and return the base URL."""
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        # pylint: disable-next=protected-access
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        await self._runner.cleanup()
+
+    async def _respond(self, kind: str, body) -> web.Response:
+        """Count the request and answer after the configured latency."""
+        self.requests[kind] += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response(body)
+
+    async def _root(self, request: web.Request) -> web.Response:
+        return await self._respond(
+            "root", {"runtimeInfo": {"version": "4.1.0", "buildString": "Fake"}}
+        )
+
+    async def _items(self, request: web.Request) -> web.Response:
+        return await self._respond("full_refresh", list(self.items.values()))
+
+    async def _item(self, request: web.Request) -> web.Response:
+        raw_item = self.items[request.match_info["name"]]
+        return await self._respond("item_refresh", raw_item)
+
+    async def _things(self, request: web.Request) -> web.Response:
+        return await self._respond("things", [])
+
+    async def _command(self, request: web.Request) -> web.Response:
+        self.requests["command"] += 1
+        command = await request.text()
+        await asyncio.sleep(self.latency)
+        self.items[request.match_info["name"]]["state"] = command
+        return web.Response(status=200)
+
+
+class ExecutorSampler:
+    """Sample the work queue depth of the default executor."""
+
+    def __init__(self, executor: ThreadPoolExecutor) -> None:
+        """Initialize the sampler."""
+        self.executor = executor
+        self.samples: list[int] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._task.cancel()
+
+    async def _run(self) -> None:
+        while True:
+            # pylint: disable-next=protected-access
+            self.samples.append(self.executor._work_queue.qsize())
+            await asyncio.sleep(SAMPLE_INTERVAL)
+
+
+def command_calls(entities: list) -> list:
+    """Return one command coroutine factory per commandable entity."""
+    calls = []
+    for entity in entities:
+        if isinstance(entity, OpenHABBinarySwitch):
+            calls.append(
+                lambda i, e=entity: e.async_turn_on() if i % 2 else e.async_turn_off()
+            )
+        elif isinstance(entity, OpenHABCover):
+            calls.append(
+                lambda i, e=entity: e.async_set_cover_position(position=i % 101)
+            )
+        elif isinstance(entity, OpenHABNumber):
+            calls.append(lambda i, e=entity: e.async_set_native_value(5.0 + i % 30))
+    return calls
+
+
+async def async_run_level(
+    calls: list, concurrency: int, total: int
+) -> list[float]:
+    """Send `total` commands with `concurrency` workers, return latencies."""
+    latencies: list[float] = []
+    counter = iter(range(total))
+
+    async def _worker() -> None:
+        for index in counter:
+            start = time.perf_counter()
+            await calls[index % len(calls)](index)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return latencies
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the given percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def async_load_test(args: argparse.Namespace, config_dir: str) -> None:
+    """Run all concurrency levels and print a report."""
+    executor = ThreadPoolExecutor(max_workers=args.executor_workers)
+    asyncio.get_running_loop().set_default_executor(executor)
+    server = FakeOpenHAB(args.items, args.latency_ms / 1000)
+    base_url = await server.async_start()
+
+    hass = HomeAssistant(config_dir)
+    if hasattr(frame, "async_setup"):
+        frame.async_setup(hass)
+    api = OpenHABApiClient(hass, base_url, CONF_AUTH_TYPE_TOKEN, None, None, None)
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    await coordinator.async_refresh()
+    coordinator.update_interval = None
+    entities = await async_setup_platforms(hass, coordinator)
+    calls = command_calls(entities)
+    sampler = ExecutorSampler(executor)
+
+    print(
+        f"Fake openHAB latency {args.latency_ms} ms, {len(calls)} commandable "
+        f"entities, {args.executor_workers} executor workers"
+    )
+    print(
+        f"{'conc':>5} {'cmds':>6} {'cmd/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'max queue':>10} {'busy %':>7} {'refresh/cmd':>12}"
+    )
+    for concurrency in args.concurrency:
+        server.requests.clear()
+        sampler.start()
+        start = time.perf_counter()
+        latencies = await async_run_level(calls, concurrency, args.commands)
+        elapsed = time.perf_counter() - start
+        # Let the governor run the refreshes requested by the last commands
+        await asyncio.sleep(ITEM_REFRESH_DELAY + 4 * server.latency + 0.2)
+        sampler.stop()
+        refreshes = server.requests["item_refresh"] + server.requests["full_refresh"]
+        busy = sum(1 for sample in sampler.samples if sample) / len(sampler.samples)
+        print(
+            f"{concurrency:>5} {len(latencies):>6} {len(latencies) / elapsed:>8.1f} "
+            f"{statistics.median(latencies) * 1000:>8.1f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.1f} "
+            f"{max(sampler.samples):>10} {busy * 100:>7.1f} "
+            f"{refreshes / len(latencies):>12.2f}"
+        )
+
+    for platform, stats in coordinator.commands.latency_stats().items():
+        print(f"Acknowledged {platform} commands: {stats}")
+
+    coordinator.governor.async_cancel()
+    await server.async_stop()
+    await hass.async_stop(force=True)
+    executor.shutdown(wait=False)
+
+
+def main() -> None:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--commands", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--executor-workers", type=int, default=8)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(async_load_test(args, config_dir))
+
+
+if __name__ == "__main__":
+    main()
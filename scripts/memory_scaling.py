@@ -0,0 +1,171 @@
+"""Memory scaling check across item counts.
+
+Builds the per-item data the coordinator keeps (raw item dicts and typed
+items) for synthetic installs of 1k/10k/50k items under tracemalloc and
+reports bytes per item. With Home Assistant installed it also sets up the
+coordinator and all platform entities and reports bytes per entity.
+
+Results are compared with scripts/memory_baseline.json and the script exits
+with status 1 when a value grows past the baseline by more than --tolerance,
+or when a baselined value could not be measured (e.g. without Home Assistant).
+
+Usage: python scripts/memory_scaling.py [--counts 1000 10000 50000]
+       [--tolerance 0.1] [--update-baseline]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import tempfile
+import tracemalloc
+
+from benchmark_item_decoding import load_models, synthetic_payload
+
+BASELINE_FILE = Path(__file__).resolve().parent / "memory_baseline.json"
+
+
+def traced_bytes() -> int:
+    """Return the currently traced memory after a full collection."""
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure_items(models, count: int) -> dict[str, float]:
+    """Return bytes per item for raw dicts and typed items."""
+    payload = synthetic_payload(count)
+    start = traced_bytes()
+    raw_items = {raw["name"]: raw for raw in models.decode_items(payload)}
+    after_raw = traced_bytes()
+    items = models.build_items(list(raw_items.values()))
+    after_items = traced_bytes()
+    result = {
+        "raw_per_item": (after_raw - start) / count,
+        "typed_per_item": (after_items - after_raw) / count,
+    }
+    del raw_items, items
+    return result
+
+
+def measure_entities(count: int) -> dict[str, float] | None:
+    """Return bytes per entity with the real coordinator, or None without HA."""
+    try:
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.core import HomeAssistant
+        from homeassistant.helpers import frame
+        from replay_traffic import ReplayApiClient, async_setup_platforms
+
+        from custom_components.openhab.api import ITEM_METADATA
+        from custom_components.openhab.coordinator import (
+            OpenHABDataUpdateCoordinator,
+        )
+        from custom_components.openhab.models import decode_items
+    except ImportError:
+        return None
+
+    class DecodingReplayApiClient(ReplayApiClient):
+        """Decode the recorded body on each request, like the real client."""
+
+        def _req_get_fast(self, uri_path: str):
+            return decode_items(super()._req_get_fast(uri_path))
+
+    # Keep the body encoded so the raw item dicts are allocated while traced
+    uri = f"/items?recursive=false&{ITEM_METADATA}"
+    body = synthetic_payload(count)
+    records = [{"kind": "rest", "uri": uri, "duration": 0, "body": body}]
+
+    async def _async_measure(config_dir: str) -> dict[str, float]:
+        hass = HomeAssistant(config_dir)
+        if hasattr(frame, "async_setup"):
+            frame.async_setup(hass)
+        api = DecodingReplayApiClient(hass, records, speed=1.0)
+        start = traced_bytes()
+        coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+        await coordinator.async_refresh()
+        coordinator.update_interval = None
+        after_refresh = traced_bytes()
+        entities = await async_setup_platforms(hass, coordinator)
+        # One listener round builds each entity's cached state
+        coordinator.async_update_listeners()
+        after_entities = traced_bytes()
+        await hass.async_stop(force=True)
+        return {
+            "coordinator_per_item": (after_refresh - start) / count,
+            "entity_per_entity": (after_entities - after_refresh)
+            / max(len(entities), 1),
+        }
+
+    # Entities are added without an EntityPlatform, silence the warning per entity
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as config_dir:
+        return asyncio.run(_async_measure(config_dir))
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a message for every regressed, unmeasured or unknown value."""
+    failures = []
+    for count, values in results.items():
+        expected_values = baseline.get(count, {})
+        for key in sorted(expected_values.keys() - values.keys()):
+            failures.append(f"{count} items {key}: not measured")
+        for key, value in values.items():
+            expected = expected_values.get(key)
+            if expected is None:
+                failures.append(f"{count} items {key}: no baseline")
+            elif value > expected * (1 + tolerance):
+                failures.append(
+                    f"{count} items {key}: {value:.0f} B > baseline {expected:.0f} B "
+                    f"(+{tolerance:.0%})"
+                )
+    return failures
+
+
+def main() -> None:
+    """Measure all counts, print the results and check the baseline."""
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        # Dict sizes, and with them the per-item bytes, vary with the hash seed
+        os.execve(
+            sys.executable,
+            [sys.executable, *sys.argv],
+            {**os.environ, "PYTHONHASHSEED": "0"},
+        )
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    models = load_models()
+    tracemalloc.start()
+    results: dict[str, dict[str, float]] = {}
+    for count in args.counts:
+        values = measure_items(models, count)
+        values.update(measure_entities(count) or {})
+        results[str(count)] = values
+        summary = ", ".join(f"{key} {value:.0f} B" for key, value in values.items())
+        print(f"{count:>7} items: {summary}")
+    tracemalloc.stop()
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    if args.update_baseline:
+        for count, values in results.items():
+            baseline.setdefault(count, {}).update(
+                {key: round(value) for key, value in values.items()}
+            )
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Updated {BASELINE_FILE}")
+        return
+
+    if failures := compare(results, baseline, args.tolerance):
+        print("Memory check failed:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("Within baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Replay a recorded openHAB session into the coordinator and the platforms.
+
+Recordings are written by the `openhab.record_traffic` service. REST responses
+are served from the recording with their recorded latency, WebSocket frames and
+commands are replayed at their recorded offsets, divided by --speed.
+
+Usage: python scripts/replay_traffic.py RECORDING [--speed 10] [--config-dir DIR]
+
+Needs Home Assistant and the integration requirements installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict, deque
+from pathlib import Path
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pylint: disable=wrong-import-position
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+
+from custom_components.openhab import (  # noqa: E402
+    binary_sensor,
+    climate,
+    cover,
+    device_tracker,
+    light,
+    media_player,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.openhab.api import OpenHABApiClient  # noqa: E402
+from custom_components.openhab.const import CONF_AUTH_TYPE_TOKEN, DOMAIN  # noqa: E402
+from custom_components.openhab.coordinator import (  # noqa: E402
+    OpenHABDataUpdateCoordinator,
+)
+from custom_components.openhab.traffic import read_recording  # noqa: E402
+from custom_components.openhab.websocket import OpenHABWebSocket  # noqa: E402
+
+PLATFORM_MODULES = [
+    binary_sensor,
+    climate,
+    cover,
+    device_tracker,
+    light,
+    media_player,
+    number,
+    select,
+    sensor,
+    switch,
+]
+REPLAY_URL = "http://replay:8080"
+
+
+class ReplayApiClient(OpenHABApiClient):
+    """API client answering from a recording instead of the network."""
+
+    def __init__(
+        self, hass: HomeAssistant, records: list[dict], speed: float
+    ) -> None:
+        """Index the recorded REST responses by path."""
+        super().__init__(hass, REPLAY_URL, CONF_AUTH_TYPE_TOKEN, None, None, None)
+        self.speed = speed
+        self.responses: dict[str, deque] = defaultdict(deque)
+        self.command_durations: dict[tuple[str, str], float] = {}
+        self.stats = {"rest": 0, "commands": 0, "missing": 0}
+        for record in records:
+            if record["kind"] == "rest":
+                self.responses[record["uri"]].append(record)
+            elif record["kind"] == "command":
+                key = (record["item"], record["command"])
+                self.command_durations[key] = record["duration"]
+
+    async def async_get_version(self) -> str:
+        """Return a fixed version, the version request is not recorded."""
+        return "replay"
+
+    def _req_get_fast(self, uri_path: str) -> Any:
+        """Return the next recorded response for the path, keeping the last."""
+        responses = self.responses.get(uri_path)
+        if not responses:
+            self.stats["missing"] += 1
+            raise ConnectionError(f"No recorded response for {uri_path}")
+        record = responses.popleft() if len(responses) > 1 else responses[0]
+        time.sleep(record["duration"] / self.speed)
+        self.stats["rest"] += 1
+        return record["body"]
+
+    async def _async_send_command(self, item_name: str, command: str) -> None:
+        """Wait for the recorded command latency."""
+        duration = self.command_durations.get((item_name, command), 0.0)
+        await asyncio.sleep(duration / self.speed)
+        self.stats["commands"] += 1
+
+
+async def async_setup_platforms(
+    hass: HomeAssistant, coordinator: OpenHABDataUpdateCoordinator
+) -> list:
+    """Create all platform entities and attach them to the coordinator."""
+    entry = SimpleNamespace(entry_id="replay", options={}, data={})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entities: list = []
+    for module in PLATFORM_MODULES:
+        added: list = []
+        await module.async_setup_entry(hass, entry, added.extend)
+        platform = module.__name__.rsplit(".", 1)[1]
+        for index, entity in enumerate(added):
+            entity.hass = hass
+            entity.entity_id = f"{platform}.replay_{index}"
+            await entity.async_added_to_hass()
+        entities.extend(added)
+    return entities
+
+
+async def async_replay(path: str, speed: float, config_dir: str) -> None:
+    """Replay a recording and print timing and throughput."""
+    header, record_iter = read_recording(path)
+    records = list(record_iter)
+    hass = HomeAssistant(config_dir)
+    if hasattr(frame, "async_setup"):
+        frame.async_setup(hass)
+
+    api = ReplayApiClient(hass, records, speed)
+    coordinator = OpenHABDataUpdateCoordinator(hass, api=api)
+    writes = 0
+
+    def _count_write() -> None:
+        nonlocal writes
+        writes += 1
+
+    setup_start = time.perf_counter()
+    await coordinator.async_refresh()
+    coordinator.update_interval = None
+    entities = await async_setup_platforms(hass, coordinator)
+    coordinator.async_add_listener(_count_write)
+    setup_time = time.perf_counter() - setup_start
+    # Commands are tracked per platform of the entity that owns the item
+    platforms = {}
+    for entity in entities:
+        item = getattr(entity, "item", None) or getattr(entity, "_mode_item", None)
+        if item is not None:
+            platforms[item.name] = entity.entity_id.split(".", 1)[0]
+
+    socket = OpenHABWebSocket(hass, REPLAY_URL, CONF_AUTH_TYPE_TOKEN, None, None, None)
+    socket.on_state = coordinator.async_handle_item_state
+    socket.on_thing_status = coordinator.async_handle_thing_status
+
+    # The initial refresh above already consumed the first /items download
+    skip_refresh = True
+    replay_start = time.monotonic()
+    pending: list[asyncio.Task] = []
+    for record in records:
+        delay = record["t"] / speed - (time.monotonic() - replay_start)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if record["kind"] == "frame":
+            # pylint: disable-next=protected-access
+            socket._handle_message(record["data"])
+        elif record["kind"] == "command":
+            pending.append(
+                asyncio.create_task(
+                    coordinator.async_send_command(
+                        record["item"],
+                        record["command"],
+                        platforms.get(record["item"], DOMAIN),
+                    )
+                )
+            )
+        elif record["uri"].startswith("/items") and "?" in record["uri"]:
+            # A full or group-scoped /items download, i.e. a coordinator refresh
+            if not skip_refresh:
+                await coordinator.async_refresh()
+            skip_refresh = False
+    await asyncio.gather(*pending)
+    await asyncio.sleep(1)
+    coordinator.governor.async_cancel()
+    replay_time = time.monotonic() - replay_start
+
+    print(f"Recording: {path} (redacted: {header.get('redacted')})")
+    print(f"Records: {len(records)}, speed: {speed}x")
+    print(f"Items: {len(coordinator.data or {})}, entities: {len(entities)}")
+    print(f"Initial refresh + platform setup: {setup_time:.3f} s")
+    print(f"Replay wall time: {replay_time:.3f} s")
+    print(
+        f"REST responses served: {api.stats['rest']}, "
+        f"missing: {api.stats['missing']}"
+    )
+    print(f"Commands replayed: {api.stats['commands']}, listener updates: {writes}")
+    await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--config-dir")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as config_dir:
+        asyncio.run(
+            async_replay(args.recording, args.speed, args.config_dir or config_dir)
+        )
+
+
+if __name__ == "__main__":
+    main()